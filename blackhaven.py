@@ -7,18 +7,23 @@ All rights reserved.
 
 
 import argparse
+import os
 import sys
 import time
-from typing import Callable
+from typing import IO, Callable, Optional
 import types
 
 import updater
 from colorama import Fore, Style, init
 
 from framework.core.framework import Framework
+from framework.core.response_cache import bypass_response_cache
 
 
 VERSION = "1.0.0"
+# Set to any non-empty value to accept the legal notice when targets are
+# piped in and no terminal is available; interactive runs always prompt.
+ACCEPT_NOTICE_ENV = "BLACKHAVEN_ACCEPT_NOTICE"
 
 init(autoreset=True)
 
@@ -42,13 +47,49 @@ Type "I AGREE" to continue or Ctrl+C to exit.
 """
 
 
-def require_legal_acknowledgement() -> None:
+def _open_tty() -> IO[str]:
+    return open("/dev/tty", "r+", encoding="utf-8")
+
+
+def _prompt(tty: Optional[IO[str]]) -> str:
+    if tty is None:
+        return input("> ")
+    tty.write("> ")
+    tty.flush()
+    line = tty.readline()
+    if not line:
+        raise EOFError
+    return line
+
+
+def require_legal_acknowledgement(stdin_is_data: bool = False) -> None:
+    """Show the legal notice and wait for "I AGREE".
+
+    When stdin carries targets the answer is read from the terminal instead;
+    without one, ``BLACKHAVEN_ACCEPT_NOTICE`` must be set.
+    """
+
     print(LEGAL_NOTICE)
-    while True:
-        response = input("> ").strip()
-        if response == "I AGREE":
-            return
-        print('Confirmation not received. Type "I AGREE" to continue or Ctrl+C to exit.')
+    tty = None
+    if stdin_is_data:
+        try:
+            tty = _open_tty()
+        except OSError:
+            if os.environ.get(ACCEPT_NOTICE_ENV):
+                return
+            raise SystemExit(
+                f"Targets are read from stdin and no terminal is available; "
+                f"set {ACCEPT_NOTICE_ENV}=1 to accept the legal notice."
+            )
+    try:
+        while True:
+            response = _prompt(tty).strip()
+            if response == "I AGREE":
+                return
+            print('Confirmation not received. Type "I AGREE" to continue or Ctrl+C to exit.')
+    finally:
+        if tty is not None:
+            tty.close()
 
 
 class BlackHavenArgumentParser(argparse.ArgumentParser):
@@ -60,6 +101,8 @@ class BlackHavenArgumentParser(argparse.ArgumentParser):
             "  -o, --output FILE          Save output to file",
             "  -v, --verbose              Enable verbose output",
             "  -t, --threads INT           Number of threads",
+            "  --no-cache                 Bypass the response cache",
+            "  --no-update-check          Skip the background update check",
             "  --generate-completion      Generate bash auto-completion script",
             "  --version                  Show version",
         ]
@@ -68,6 +111,7 @@ class BlackHavenArgumentParser(argparse.ArgumentParser):
             "  scan        Run reconnaissance modules",
             "  osint       Run OSINT modules",
             "  modules     Manage modules",
+            "  workflow    Run module workflows",
             "  session     Manage sessions",
             "  report      Export reports",
             "  config      Show configuration",
@@ -76,7 +120,10 @@ class BlackHavenArgumentParser(argparse.ArgumentParser):
         examples = [
             "  blackhaven scan domain example.com",
             "  blackhaven scan ports example.com",
+            "  blackhaven scan ports --targets-file hosts.txt --parallel 8",
+            "  cat hosts.txt | blackhaven scan tech --targets-file -",
             "  blackhaven osint username johndoe",
+            "  blackhaven workflow run web-recon example.com",
             "  blackhaven report html",
         ]
 
@@ -108,6 +155,8 @@ class BlackHavenArgumentParser(argparse.ArgumentParser):
                 required = "username"
             if required == "modules_cmd":
                 required = "module"
+            if required == "workflow_cmd":
+                required = "command"
             if required == "session_cmd":
                 required = "name"
             if required == "report_type":
@@ -242,6 +291,26 @@ def _attach_subcommand_help(
     parser.error = types.MethodType(lambda self, msg: _subcommand_error(self, msg), parser)
 
 
+def _add_target_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("target", nargs="?")
+    parser.add_argument("--targets-file", metavar="FILE", help="Read targets from FILE ('-' for stdin)")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N", help="Targets run concurrently")
+
+
+def _collect_targets(args: argparse.Namespace) -> list[str]:
+    """Targets from the positional argument and --targets-file, deduplicated in order."""
+
+    targets = [args.target] if args.target else []
+    if args.targets_file:
+        if args.targets_file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.targets_file, "r", encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        targets.extend(line.split("#", 1)[0].strip() for line in lines)
+    return list(dict.fromkeys(target for target in targets if target))
+
+
 def _print_header() -> None:
     print(f"{Fore.MAGENTA}BlackHaven Framework v{VERSION}{Style.RESET_ALL}")
     print(f"{Fore.CYAN}Modular Cybersecurity Recon Framework{Style.RESET_ALL}")
@@ -259,6 +328,10 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("-o", "--output", help="Output file path")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
     parser.add_argument("-t", "--threads", type=int, help="Override thread count")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    parser.add_argument(
+        "--no-update-check", action="store_true", help="Skip the background update check"
+    )
     parser.add_argument(
         "--generate-completion",
         action="store_true",
@@ -296,45 +369,50 @@ def _build_parser() -> argparse.ArgumentParser:
     _attach_subcommand_help(
         scan_domain,
         description="Perform domain reconnaissance including DNS resolution and WHOIS lookup.",
-        usage="blackhaven scan domain <target>",
+        usage="blackhaven scan domain <target> | --targets-file FILE [--parallel N]",
         arguments="target      Domain to scan",
-        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads",
-        examples="blackhaven scan domain example.com",
+        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads"
+        "\n--targets-file FILE   Read targets from FILE, one per line (- for stdin)\n--parallel N          Run N targets concurrently",
+        examples="blackhaven scan domain example.com\n"
+        "blackhaven scan domain --targets-file domains.txt --parallel 4",
     )
-    scan_domain.add_argument("target")
+    _add_target_arguments(scan_domain)
 
     scan_ports = scan_sub.add_parser("ports", help="Scan ports")
     _attach_subcommand_help(
         scan_ports,
         description="Scan common ports on a target host.",
-        usage="blackhaven scan ports <target>",
+        usage="blackhaven scan ports <target> | --targets-file FILE [--parallel N]",
         arguments="target      Host or domain to scan",
-        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads",
-        examples="blackhaven scan ports example.com",
+        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads"
+        "\n--targets-file FILE   Read targets from FILE, one per line (- for stdin)\n--parallel N          Run N targets concurrently",
+        examples="blackhaven scan ports example.com\n"
+        "blackhaven scan ports --targets-file hosts.txt --parallel 8",
     )
-    scan_ports.add_argument("target")
+    _add_target_arguments(scan_ports)
 
     scan_subdomains = scan_sub.add_parser("subdomains", help="Enumerate subdomains")
     _attach_subcommand_help(
         scan_subdomains,
         description="Enumerate subdomains using a configured wordlist.",
-        usage="blackhaven scan subdomains <target>",
+        usage="blackhaven scan subdomains <target> | --targets-file FILE [--parallel N]",
         arguments="target      Domain to enumerate",
-        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads",
+        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads"
+        "\n--targets-file FILE   Read targets from FILE, one per line (- for stdin)\n--parallel N          Run N targets concurrently",
         examples="blackhaven scan subdomains example.com",
     )
-    scan_subdomains.add_argument("target")
+    _add_target_arguments(scan_subdomains)
 
     scan_tech = scan_sub.add_parser("tech", help="Detect technologies")
     _attach_subcommand_help(
         scan_tech,
         description="Detect web technologies and CDN hints from HTTP headers.",
-        usage="blackhaven scan tech <target>",
+        usage="blackhaven scan tech <target> | --targets-file FILE [--parallel N]",
         arguments="target      Domain or URL to scan",
-        options="-o, --output FILE     Save output to file",
+        options="-o, --output FILE     Save output to file\n--targets-file FILE   Read targets from FILE, one per line (- for stdin)\n--parallel N          Run N targets concurrently",
         examples="blackhaven scan tech example.com",
     )
-    scan_tech.add_argument("target")
+    _add_target_arguments(scan_tech)
 
     osint = subparsers.add_parser("osint", help="Run OSINT modules")
     _attach_group_help(
@@ -388,14 +466,53 @@ def _build_parser() -> argparse.ArgumentParser:
     _attach_subcommand_help(
         modules_run,
         description="Run a specific module by name.",
-        usage="blackhaven modules run <module> <target>",
+        usage="blackhaven modules run <module> <target> | --targets-file FILE [--parallel N]",
         arguments="module      Module name\n"
         "target      Target for the module",
-        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads",
-        examples="blackhaven modules run domain_recon example.com",
+        options="-o, --output FILE     Save output to file\n-t, --threads INT     Number of threads"
+        "\n--targets-file FILE   Read targets from FILE, one per line (- for stdin)\n--parallel N          Run N targets concurrently",
+        examples="blackhaven modules run domain_recon example.com\n"
+        "blackhaven modules run tech_detection --targets-file sites.txt --parallel 16",
     )
     modules_run.add_argument("module")
-    modules_run.add_argument("target")
+    _add_target_arguments(modules_run)
+
+    workflow = subparsers.add_parser("workflow", help="Run module workflows")
+    _attach_group_help(
+        workflow,
+        name="blackhaven workflow - run module workflows",
+        description="Chain modules through a YAML workflow, streaming results between stages.",
+        subcommands=[
+            ("list", "List available workflows"),
+            ("run", "Run a workflow"),
+        ],
+        examples=[
+            "blackhaven workflow list",
+            "blackhaven workflow run web-recon example.com",
+        ],
+    )
+    workflow_sub = workflow.add_subparsers(dest="workflow_cmd", required=True)
+    workflow_list = workflow_sub.add_parser("list", help="List available workflows")
+    _attach_subcommand_help(
+        workflow_list,
+        description="List the workflows in framework/workflows.",
+        usage="blackhaven workflow list",
+        arguments="",
+        options="",
+        examples="blackhaven workflow list",
+    )
+    workflow_run = workflow_sub.add_parser("run", help="Run a workflow")
+    _attach_subcommand_help(
+        workflow_run,
+        description="Run a workflow file (or a name from framework/workflows) on a target.",
+        usage="blackhaven workflow run <file> <target>",
+        arguments="file        Workflow YAML file or name\n"
+        "target      Target passed to the first stages",
+        options="-t, --threads INT     Number of threads",
+        examples="blackhaven workflow run web-recon example.com",
+    )
+    workflow_run.add_argument("file")
+    workflow_run.add_argument("target")
 
     session = subparsers.add_parser("session", help="Manage sessions")
     _attach_group_help(
@@ -510,11 +627,12 @@ def _print_completion_script() -> None:
   COMPREPLY=()
   cur="${COMP_WORDS[COMP_CWORD]}"
   prev="${COMP_WORDS[COMP_CWORD-1]}"
-  opts="scan osint modules session config report --help --generate-completion -o --output -v --verbose -t --threads --version"
+  opts="scan osint modules workflow session config report --help --generate-completion -o --output -v --verbose -t --threads --no-cache --no-update-check --targets-file --parallel --version"
 
   case "${prev}" in
     scan) COMPREPLY=( $(compgen -W "domain ports subdomains tech" -- "${cur}") ); return 0 ;;
     osint) COMPREPLY=( $(compgen -W "username" -- "${cur}") ); return 0 ;;
+    workflow) COMPREPLY=( $(compgen -W "list run" -- "${cur}") ); return 0 ;;
     modules) COMPREPLY=( $(compgen -W "list run" -- "${cur}") ); return 0 ;;
     session) COMPREPLY=( $(compgen -W "save load list" -- "${cur}") ); return 0 ;;
     config) COMPREPLY=( $(compgen -W "show" -- "${cur}") ); return 0 ;;
@@ -532,6 +650,9 @@ complete -F _blackhaven_complete blackhaven
 def _apply_global_overrides(framework: Framework, args: argparse.Namespace) -> None:
     if args.threads:
         framework.config.data["thread_count"] = args.threads
+    if args.no_cache:
+        framework.config.data["response_cache"] = False
+        bypass_response_cache()
 
 
 def _run_with_timing(label: str, action: Callable[[], None]) -> None:
@@ -541,6 +662,22 @@ def _run_with_timing(label: str, action: Callable[[], None]) -> None:
     print(f"{Fore.GREEN}{label} completed in {elapsed:.2f} seconds{Style.RESET_ALL}")
 
 
+def _run_targets(framework: Framework, module_name: str, args: argparse.Namespace, label: str) -> int:
+    try:
+        targets = _collect_targets(args)
+    except OSError as exc:
+        print(f"{Fore.RED}Error: cannot read targets: {exc}{Style.RESET_ALL}", file=sys.stderr)
+        return 1
+    if not targets:
+        print(f"{Fore.RED}Error: missing required argument: target{Style.RESET_ALL}", file=sys.stderr)
+        return 1
+    if len(targets) == 1:
+        _run_with_timing(label, lambda: framework.run_module(module_name, targets[0]))
+    else:
+        _run_with_timing(label, lambda: framework.run_targets(module_name, targets, args.parallel))
+    return 0
+
+
 def _run_framework(args: argparse.Namespace) -> int:
     if args.generate_completion:
         _print_completion_script()
@@ -552,7 +689,13 @@ def _run_framework(args: argparse.Namespace) -> int:
 
     framework = Framework()
     _apply_global_overrides(framework, args)
+    try:
+        return _run_command(framework, args)
+    finally:
+        framework.close()
+
 
+def _run_command(framework: Framework, args: argparse.Namespace) -> int:
     if args.command == "scan":
         mapping = {
             "domain": "domain_recon",
@@ -567,8 +710,7 @@ def _run_framework(args: argparse.Namespace) -> int:
             for name in mapping:
                 print(f"  {name}")
             return 1
-        _run_with_timing("Scan", lambda: framework.run_module(module_name, args.target))
-        return 0
+        return _run_targets(framework, module_name, args, "Scan")
 
     if args.command == "osint" and args.osint_type == "username":
         _run_with_timing("OSINT scan", lambda: framework.run_module("osint_lookup", args.username))
@@ -585,7 +727,19 @@ def _run_framework(args: argparse.Namespace) -> int:
                     f"{Fore.RED}Error: module '{args.module}' not found{Style.RESET_ALL}"
                 )
                 return 1
-            _run_with_timing("Module run", lambda: framework.run_module(args.module, args.target))
+            return _run_targets(framework, args.module, args, "Module run")
+
+    if args.command == "workflow":
+        if args.workflow_cmd == "list":
+            for name in framework.list_workflows():
+                print(name)
+            return 0
+        if args.workflow_cmd == "run":
+            try:
+                _run_with_timing("Workflow", lambda: framework.run_workflow(args.file, args.target))
+            except (OSError, ValueError) as exc:
+                print(f"{Fore.RED}Error: {exc}{Style.RESET_ALL}", file=sys.stderr)
+                return 1
             return 0
 
     if args.command == "session":
@@ -626,10 +780,10 @@ def _run_framework(args: argparse.Namespace) -> int:
 
 
 def main() -> int:
-    require_legal_acknowledgement()
-    updater.update()
     parser = _build_parser()
     args = parser.parse_args()
+    require_legal_acknowledgement(getattr(args, "targets_file", None) == "-")
+    update_check = updater.start_update_check(not args.no_update_check)
     if args.command:
         _print_header()
     try:
@@ -639,6 +793,10 @@ def main() -> int:
     except Exception as exc:
         print(f"{Fore.RED}System error: {exc}{Style.RESET_ALL}", file=sys.stderr)
         return 2
+    finally:
+        notice = update_check.notice() if update_check else None
+        if notice:
+            print(f"{Fore.YELLOW}{notice}{Style.RESET_ALL}", file=sys.stderr)
 
 
 if __name__ == "__main__":
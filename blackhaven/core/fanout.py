@@ -0,0 +1,134 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+
+from __future__ import annotations
+
+import re
+import subprocess
+import threading
+import time
+from typing import Callable, List, Tuple
+
+_URL_RE = re.compile(r"https?://[^\s\]\)\"'<>]+")
+
+Report = Callable[[str], None]
+Stage = Callable[[Report, threading.Event], None]
+
+
+def extract_url(value: str) -> str:
+    """Return the first URL in a tool output line, or the stripped line."""
+
+    match = _URL_RE.search(value)
+    return match.group(0) if match else value.strip()
+
+
+def _dedupe_key(value: str) -> str:
+    return extract_url(value).rstrip("/").lower()
+
+
+def announce(source: str, value: str) -> None:
+    """Print a newly merged hit with its source prefix."""
+
+    if "FOUND" in value:
+        print(f"[{source}] {value}")
+    else:
+        print(f"[{source}] FOUND: {value}")
+
+
+class FoundSet:
+    """Thread-safe, order-preserving set of hits merged from several sources."""
+
+    def __init__(self, on_new: Callable[[str, str], None] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._seen: set[str] = set()
+        self.items: List[Tuple[str, str]] = []
+        self._on_new = on_new
+
+    def add(self, source: str, value: str) -> bool:
+        key = _dedupe_key(value)
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            self.items.append((source, value))
+        if self._on_new:
+            self._on_new(source, value)
+        return True
+
+    def values(self) -> List[str]:
+        with self._lock:
+            return [value for _, value in self.items]
+
+
+def command_stage(cmd: List[str], prefix: str, marker: str = "FOUND") -> Stage:
+    """Stage that runs an external tool and reports its output lines containing ``marker``."""
+
+    def _run(report: Report, stop: threading.Event) -> None:
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        except FileNotFoundError:
+            print(f"[{prefix}] ERROR: command not found")
+            return
+
+        def _kill_on_stop() -> None:
+            stop.wait()
+            if proc.poll() is None:
+                proc.kill()
+
+        threading.Thread(target=_kill_on_stop, daemon=True).start()
+        if proc.stdout:
+            for line in proc.stdout:
+                line = line.strip()
+                if line and marker in line:
+                    report(line)
+        proc.wait()
+
+    return _run
+
+
+def run_stages(
+    stages: List[Tuple[str, Stage]],
+    found: FoundSet,
+    timeout: float | None = None,
+) -> FoundSet:
+    """Run every stage concurrently, merging their hits into ``found``.
+
+    Returns when all stages finish or ``timeout`` seconds elapse; on the
+    deadline every stage is told to stop and running tools are killed.
+    """
+
+    stop = threading.Event()
+    threads: List[threading.Thread] = []
+    for source, stage in stages:
+        def _report(value: str, _source: str = source) -> None:
+            found.add(_source, value)
+
+        def _target(_stage: Stage = stage, _report: Report = _report, _source: str = source) -> None:
+            try:
+                _stage(_report, stop)
+            except Exception as exc:
+                print(f"[{_source}] ERROR: {exc}")
+
+        thread = threading.Thread(target=_target, name=f"stage-{source}", daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    for thread in threads:
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        thread.join(remaining)
+
+    stop.set()
+    for thread in threads:
+        thread.join(5)
+    return found
@@ -8,171 +8,630 @@ All rights reserved.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import queue
 import threading
 import time
-import urllib.error
-import urllib.request
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from framework.core.async_http import AsyncHTTPClient, HostKey
+from framework.core.breaker import CircuitBreaker
+from framework.core.catalog import STRATEGY_BODY, SiteEntry, load_catalog
+from framework.core.concurrency import AIMDController
+from framework.core.response_cache import ResponseCache, open_response_cache
+from framework.core.retry import RETRY_STATUSES, RetryPolicy
+from framework.core.site_stats import SiteStats
+from framework.core.strategy import ProbeStrategy
 
 _DEFAULT_TIMEOUT = 6.0
 _DEFAULT_SITES_PATH = os.path.expanduser("~/WhatsMyName/blackbird/sites.json")
-_DEFAULT_MIN_WORKERS = 10
-_DEFAULT_MAX_WORKERS = 30
-_DEFAULT_WORKERS = 20
+_DEFAULT_CONCURRENCY = 256
+# Starting in-flight limit when concurrency adapts (AIMD) up to max_workers.
+_INITIAL_CONCURRENCY = 32
+_DEFAULT_PER_HOST_LIMIT = 8
+# Bodies are only drained for connection reuse when no signature is needed.
+_DRAIN_BYTES = 64 * 1024
+_CHUNK_SIZE = 16384
+# Seconds between checks of a caller's stop event while waiting for results.
+_STOP_POLL = 0.25
+# Upper bound on the time spent pre-opening connections before a batch.
+_WARM_UP_TIMEOUT = 3.0
+# Namespace of the engine's outcomes in the shared response cache.
+_CACHE_MODULE = "username_engine"
 _USERNAME_RESULTS_DIR = "/home/hacker/BlackHaven/results/usernames"
 
+@dataclass(frozen=True)
+class _Settings:
+    """Per-search engine knobs passed down from the public entry points."""
+
+    max_workers: int = _DEFAULT_CONCURRENCY
+    timeout: float = _DEFAULT_TIMEOUT
+    per_host_limit: int = _DEFAULT_PER_HOST_LIMIT
+    adaptive: bool = True
+    retry: RetryPolicy | None = None
+    warm_hosts: int = 0
+    cache: Mapping[str, Any] | None = None
+
+
+@dataclass
+class _Plan:
+    """Catalog, host-interleaved (index, site) schedule and learned per-site state."""
+
+    sites: List[SiteEntry]
+    schedule: List[Tuple[int, SiteEntry]]
+    stats: SiteStats
+    breaker: CircuitBreaker
+    strategies: ProbeStrategy
+    cache: ResponseCache | None = None
+
+    def save(self) -> None:
+        self.stats.save()
+        self.breaker.save()
+        self.strategies.save()
 
-def _load_sites(path: str) -> List[Dict[str, str]]:
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Sites file not found: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("sites", [])
+
+def _load_sites(path: str) -> List[SiteEntry]:
+    return load_catalog(path)
 
 
 def _ensure_username_results_dir() -> None:
     os.makedirs(_USERNAME_RESULTS_DIR, exist_ok=True)
 
 
-def _save_text(name: str, lines: List[str]) -> str:
+def _results_path(name: str, extension: str) -> str:
     _ensure_username_results_dir()
     stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     safe_name = "".join(ch for ch in name if ch.isalnum() or ch in ("-", "_"))
-    path = os.path.join(_USERNAME_RESULTS_DIR, f"{safe_name}_{stamp}.txt")
-    with open(path, "w", encoding="utf-8") as f:
-        for line in lines:
-            f.write(line.rstrip("\n") + "\n")
-    return path
+    return os.path.join(_USERNAME_RESULTS_DIR, f"{safe_name}_{stamp}.{extension}")
 
 
 def _save_json(name: str, data: object) -> str:
-    _ensure_username_results_dir()
-    stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(ch for ch in name if ch.isalnum() or ch in ("-", "_"))
-    path = os.path.join(_USERNAME_RESULTS_DIR, f"{safe_name}_{stamp}.json")
+    path = _results_path(name, "json")
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
     return path
 
 
-def _format_template(template: str, username: str) -> str:
-    return template.format_map({"account": username, "username": username})
+async def _match_stream(
+    resp,
+    e_sig: bytes | None,
+    m_sig: bytes | None,
+    max_bytes: int,
+) -> Tuple[bool | None, int | None]:
+    """Scan up to ``max_bytes`` of the body; ``m_sig`` anywhere wins over ``e_sig``.
 
+    Also returns the body offset where the deciding signature ends, or
+    None when the whole scanned body was needed to rule out ``m_sig``.
+    """
+    overlap = max(len(e_sig or b""), len(m_sig or b"")) - 1
+    tail = b""
+    seen = 0
+    e_found = False
+    async for chunk in resp.iter_chunks(_CHUNK_SIZE):
+        window = tail + chunk
+        base = seen - len(tail)
+        if m_sig:
+            position = window.find(m_sig)
+            if position >= 0:
+                return False, base + position + len(m_sig)
+        if e_sig and not e_found:
+            position = window.find(e_sig)
+            if position >= 0:
+                if not m_sig:
+                    return True, base + position + len(e_sig)
+                e_found = True
+        seen += len(chunk)
+        if seen >= max_bytes:
+            break
+        tail = window[-overlap:] if overlap > 0 else b""
+    return (True, None) if e_found else (None, None)
 
-def _fetch_site(url: str, headers: Dict[str, str], body: str | None, timeout: float) -> Tuple[int, str]:
+
+async def _fetch_site(
+    client: AsyncHTTPClient,
+    url: str,
+    headers: Dict[str, str],
+    body: str | None,
+    timeout: float,
+    e_sig: bytes | None,
+    m_sig: bytes | None,
+    max_bytes: int,
+    hedge_after: float | None = None,
+    range_end: int | None = None,
+) -> Tuple[int, bool | None, int | None, float, Dict[str, str]]:
     method = "POST" if body is not None else "GET"
     payload = body.encode("utf-8") if body is not None else None
-    request = urllib.request.Request(
-        url,
-        headers=headers,
-        data=payload,
-        method=method,
-    )
-    try:
-        with urllib.request.urlopen(request, timeout=timeout) as resp:
-            status = resp.getcode()
-            text = resp.read().decode("utf-8", errors="ignore")
-            return status, text
-    except urllib.error.HTTPError as exc:
-        text = exc.read().decode("utf-8", errors="ignore")
-        return exc.code, text
-
-
-def _check_site(site: Dict[str, str], username: str, timeout: float) -> Dict[str, str]:
-    url_template = site.get("url") or site.get("uri_check")
-    if not url_template:
-        return {"site": site.get("name", "unknown"), "url": "", "status": "error", "found": "no"}
-
-    display_template = site.get("uri_pretty") or url_template
-    name = site.get("name", display_template)
-    url = _format_template(url_template, username)
-    display_url = _format_template(display_template, username)
-
-    headers = {"User-Agent": "BlackHaven/1.0"}
-    headers.update(site.get("headers", {}))
-    body = site.get("post_body")
-    if body is not None:
-        body = _format_template(body, username)
+    if range_end is not None:
+        headers = {**headers, "Range": f"bytes=0-{range_end - 1}"}
+    async with client.stream(
+        method, url, headers=headers, body=payload, timeout=timeout, hedge_after=hedge_after
+    ) as resp:
+        if e_sig or m_sig:
+            matched, sig_end = await _match_stream(resp, e_sig, m_sig, max_bytes)
+        else:
+            matched, sig_end = None, None
+            await resp.read(_DRAIN_BYTES)
+        elapsed = resp.elapsed
+    return resp.status, matched, sig_end, elapsed, resp.headers
 
-    try:
-        status, text = _fetch_site(url, headers, body, timeout)
-        e_string = site.get("e_string")
-        m_string = site.get("m_string")
-        e_code = site.get("e_code")
-        m_code = site.get("m_code")
-
-        found: bool | None = None
-        if m_string and m_string in text:
-            found = False
-        elif e_string and e_string in text:
-            found = True
-
-        if found is None:
-            if m_code is not None and status == m_code:
-                found = False
-            elif e_code is not None and status == e_code:
-                found = True
-            else:
-                found = status == 200
 
+def _cache_variant(site: SiteEntry) -> str:
+    """Identify the rules a cached verdict was derived from."""
+    return repr((site.e_code, site.m_code, site.e_sig, site.m_sig))
+
+
+def _is_found(site: SiteEntry, status: int, matched: bool | None) -> bool:
+    if matched is not None:
+        return matched
+    if site.m_code is not None and status == site.m_code:
+        return False
+    if site.e_code is not None and status == site.e_code:
+        return True
+    return status == 200
+
+
+async def _check_site(
+    client: AsyncHTTPClient,
+    site: SiteEntry,
+    username: str,
+    timeout: float,
+    plan: _Plan | None = None,
+) -> Dict[str, str]:
+    if not site.valid:
+        return {"site": site.name, "url": "", "status": "error", "found": "no"}
+
+    display_url = site.display_url(username)
+    url = site.url(username)
+    body = site.body(username)
+    method = "POST" if body is not None else "GET"
+    payload = body.encode("utf-8") if body is not None else None
+    cache = plan.cache if plan is not None else None
+    cached = None
+    if cache is not None:
+        cached = cache.lookup(_CACHE_MODULE, method, url, payload, _cache_variant(site))
+        if cached is not None and cached.fresh:
+            return {
+                "site": site.name,
+                "url": display_url,
+                "status": str(cached.value["status"]),
+                "found": cached.value["found"],
+            }
+
+    if plan is not None and not plan.breaker.allow(site.name):
         return {
-            "site": name,
+            "site": site.name,
             "url": display_url,
-            "status": str(status),
-            "found": "yes" if found else "no",
+            "status": "skipped-breaker",
+            "found": "no",
         }
-    except urllib.error.HTTPError as exc:
+
+    headers = {**site.headers, **cached.validators()} if cached is not None else site.headers
+    hedge_after = None
+    range_end = None
+    ceiling = timeout
+    if plan is not None:
+        timeout = plan.stats.timeout_for(site.name, timeout)
+        hedge_after = plan.stats.latency(site.name, 95)
+        if site.strategy == STRATEGY_BODY and body is None:
+            range_end = plan.strategies.range_end(site.name)
+
+    async def _fetch(range_end: int | None) -> Tuple[int, bool | None, int | None, float, Dict[str, str]]:
+        return await _fetch_site(
+            client,
+            url,
+            headers,
+            body,
+            timeout,
+            site.e_sig,
+            site.m_sig,
+            site.max_bytes,
+            hedge_after,
+            range_end,
+        )
+
+    try:
+        status, matched, sig_end, elapsed, response_headers = await _fetch(range_end)
+        if range_end is not None and status in {206, 416}:
+            if matched is None:
+                # The signatures were not in the prefix: fall back to the full page.
+                plan.strategies.clear_range(site.name)
+                status, matched, sig_end, elapsed, response_headers = await _fetch(None)
+            else:
+                status = 200
+        if plan is not None:
+            plan.stats.record_success(site.name, elapsed)
+            plan.breaker.record_success(site.name)
+            if sig_end is not None and body is None:
+                plan.strategies.record_signature(site.name, sig_end)
+        if status == 304 and cached is not None:
+            cache.revalidated(cached, response_headers)
+            status, found = cached.value["status"], cached.value["found"]
+        else:
+            found = "yes" if _is_found(site, status, matched) else "no"
+            if cache is not None and status not in RETRY_STATUSES:
+                cache.store(
+                    _CACHE_MODULE,
+                    method,
+                    url,
+                    {"status": status, "found": found},
+                    response_headers,
+                    payload,
+                    _cache_variant(site),
+                )
         return {
-            "site": name,
+            "site": site.name,
             "url": display_url,
-            "status": str(exc.code),
-            "found": "no",
+            "status": str(status),
+            "found": found,
         }
-    except Exception:
+    except asyncio.CancelledError:
+        # Stopped early (max_hits, stop event): no verdict either way.
+        if plan is not None:
+            plan.breaker.release(site.name)
+        raise
+    except Exception as exc:
+        if plan is not None and isinstance(exc, asyncio.TimeoutError):
+            plan.stats.record_timeout(site.name, timeout)
+            # A learned timeout below the ceiling may just be too short.
+            if timeout >= ceiling:
+                plan.breaker.record_failure(site.name)
+            else:
+                plan.breaker.release(site.name)
+        elif plan is not None:
+            plan.stats.record_failure(site.name)
+            plan.breaker.record_failure(site.name)
         return {
-            "site": name,
+            "site": site.name,
             "url": display_url,
             "status": "error",
             "found": "no",
         }
 
 
+def _interleave_sites(
+    sites: List[SiteEntry],
+    stats: SiteStats | None = None,
+) -> List[Tuple[int, SiteEntry]]:
+    """Round-robin (index, site) across hosts so one host is never hit back to back.
+
+    With ``stats``, historically slow sites (and their hosts) come first so
+    their long waits overlap with the fast checks instead of trailing them.
+    """
+    indexed = list(enumerate(sites))
+    if stats is not None:
+        indexed.sort(key=lambda item: stats.expected_latency(item[1].name), reverse=True)
+    by_host: Dict[str, List[Tuple[int, SiteEntry]]] = {}
+    for index, site in indexed:
+        by_host.setdefault(site.host, []).append((index, site))
+    queues = list(by_host.values())
+    ordered: List[Tuple[int, SiteEntry]] = []
+    for index in range(max((len(queue) for queue in queues), default=0)):
+        ordered.extend(queue[index] for queue in queues if index < len(queue))
+    return ordered
+
+
+def _host_counts(sites: Iterable[SiteEntry]) -> Dict[HostKey, int]:
+    """Count sites per (scheme, host, port), skipping hosts built from the username."""
+    counts: Dict[HostKey, int] = {}
+    for site in sites:
+        if not site.valid or not site.host or "{" in site.host:
+            continue
+        key = AsyncHTTPClient.host_key(site.url_parts[0])
+        if key is not None:
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+async def _check_pairs(
+    pairs: Iterable[Tuple[str, int, SiteEntry]],
+    settings: _Settings,
+    emit: Callable[[str, int, Dict[str, str]], None],
+    plan: _Plan | None = None,
+) -> None:
+    """Drain (username, index, site) pairs with worker tasks, AIMD-capped when ``adaptive``."""
+    concurrency = max(1, settings.max_workers)
+    timeout = settings.timeout
+    controller = None
+    if settings.adaptive:
+        controller = AIMDController(initial=min(_INITIAL_CONCURRENCY, concurrency), maximum=concurrency)
+    async with AsyncHTTPClient(
+        timeout=timeout,
+        limit=concurrency,
+        limit_per_host=settings.per_host_limit,
+        controller=controller,
+        retry=settings.retry if settings.retry is not None else RetryPolicy(),
+    ) as client:
+        counts = _host_counts(plan.sites) if plan is not None else {}
+        prefetch = asyncio.ensure_future(client.prefetch(counts)) if counts else None
+        if settings.warm_hosts > 0 and counts:
+            busiest = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+            await client.warm_up(
+                dict(busiest[: settings.warm_hosts]), timeout=min(timeout, _WARM_UP_TIMEOUT)
+            )
+        iterator = iter(pairs)
+
+        async def _worker() -> None:
+            for username, index, site in iterator:
+                emit(username, index, await _check_site(client, site, username, timeout, plan))
+
+        workers = [asyncio.ensure_future(_worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Cancelling gather() returns before its children finish; make sure
+            # no worker outlives the client (or keeps pulling pairs).
+            for worker in workers:
+                worker.cancel()
+            if prefetch is not None:
+                prefetch.cancel()
+                workers.append(prefetch)
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _stream(
+    make_coro: Callable[[Callable[[object], None]], Awaitable[None]],
+    stop: threading.Event | None = None,
+) -> Iterator[object]:
+    """Run an engine coroutine on a background loop and yield what it emits.
+
+    Closing the generator early, or setting ``stop``, cancels the engine.
+    """
+    items: "queue.Queue[Tuple[bool, object]]" = queue.Queue()
+    started = threading.Event()
+    handle: Dict[str, object] = {}
+
+    async def _main() -> None:
+        handle["loop"] = asyncio.get_running_loop()
+        handle["task"] = asyncio.current_task()
+        started.set()
+        await make_coro(lambda item: items.put((False, item)))
+
+    def _runner() -> None:
+        error: BaseException | None = None
+        try:
+            asyncio.run(_main())
+        except asyncio.CancelledError:
+            pass
+        except BaseException as exc:
+            error = exc
+        finally:
+            started.set()
+            items.put((True, error))
+
+    thread = threading.Thread(target=_runner, name="username-engine", daemon=True)
+    thread.start()
+    try:
+        while True:
+            if stop is not None and stop.is_set():
+                return
+            try:
+                finished, value = items.get(timeout=_STOP_POLL if stop is not None else None)
+            except queue.Empty:
+                continue
+            if finished:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        started.wait()
+        if thread.is_alive() and "task" in handle:
+            try:
+                handle["loop"].call_soon_threadsafe(handle["task"].cancel)
+            except RuntimeError:
+                pass
+        thread.join()
+
+
+def _load_plan(sites_path: str | None, settings: _Settings) -> _Plan:
+    """Load the catalog and learned state and build the site schedule."""
+    sites = _load_sites(sites_path or _DEFAULT_SITES_PATH)
+    stats = SiteStats.shared()
+    return _Plan(
+        sites=sites,
+        schedule=_interleave_sites(sites, stats),
+        stats=stats,
+        breaker=CircuitBreaker.shared(),
+        strategies=ProbeStrategy.shared(),
+        cache=open_response_cache(settings.cache) if settings.cache is not None else None,
+    )
+
+
+async def _run_plan(
+    names: List[str],
+    plan: _Plan,
+    settings: _Settings,
+    emit: Callable[[str, int, Dict[str, str]], None],
+) -> None:
+    pairs = ((name, index, site) for name in names for index, site in plan.schedule)
+    try:
+        await _check_pairs(pairs, settings, emit, plan)
+    finally:
+        plan.save()
+
+
+def search_usernames(
+    usernames: Iterable[str],
+    sites_path: str | None = None,
+    max_workers: int = _DEFAULT_CONCURRENCY,
+    timeout: float = _DEFAULT_TIMEOUT,
+    per_host_limit: int = _DEFAULT_PER_HOST_LIMIT,
+    stop: threading.Event | None = None,
+    adaptive: bool = True,
+    retry: RetryPolicy | None = None,
+    warm_hosts: int = 0,
+    cache: Mapping[str, Any] | None = None,
+) -> Iterator[Tuple[str, List[Dict[str, str]]]]:
+    """Check many usernames over one connection pool, yielding each one's results in site order.
+
+    ``cache`` takes the framework's ``response_cache*`` settings; ``stop`` ends the search early.
+    """
+    settings = _Settings(max_workers, timeout, per_host_limit, adaptive, retry, warm_hosts, cache)
+    plan = _load_plan(sites_path, settings)
+    sites = plan.sites
+    names = list(dict.fromkeys(usernames))
+    if not names:
+        return
+
+    async def _run(emit: Callable[[object], None]) -> None:
+        pending = {name: [None] * len(sites) for name in names}
+        remaining = {name: len(sites) for name in names}
+
+        def _collect(username: str, index: int, result: Dict[str, str]) -> None:
+            pending[username][index] = result
+            remaining[username] -= 1
+            if remaining[username] == 0:
+                emit((username, pending.pop(username)))
+
+        for name in names:
+            if not sites:
+                emit((name, []))
+        await _run_plan(names, plan, settings, _collect)
+
+    yield from _stream(_run, stop)
+
+
+async def _aiter_results(
+    username: str,
+    plan: _Plan,
+    settings: _Settings,
+    max_hits: int | None,
+) -> AsyncIterator[Tuple[int, Dict[str, str]]]:
+    """Yield (site index, result) pairs in completion order."""
+    results: "asyncio.Queue[Tuple[int, Dict[str, str]] | None]" = asyncio.Queue()
+
+    def _collect(_: str, index: int, result: Dict[str, str]) -> None:
+        results.put_nowait((index, result))
+
+    task = asyncio.ensure_future(_run_plan([username], plan, settings, _collect))
+    task.add_done_callback(lambda _: results.put_nowait(None))
+    hits = 0
+    try:
+        while True:
+            item = await results.get()
+            if item is None:
+                break
+            yield item
+            if item[1]["found"] == "yes":
+                hits += 1
+                if max_hits is not None and hits >= max_hits:
+                    return
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+async def astream_username(
+    username: str,
+    sites_path: str | None = None,
+    max_workers: int = _DEFAULT_CONCURRENCY,
+    timeout: float = _DEFAULT_TIMEOUT,
+    per_host_limit: int = _DEFAULT_PER_HOST_LIMIT,
+    adaptive: bool = True,
+    max_hits: int | None = None,
+    retry: RetryPolicy | None = None,
+    warm_hosts: int = 0,
+    cache: Mapping[str, Any] | None = None,
+) -> AsyncIterator[Dict[str, str]]:
+    """Async-iterate a username's site results as they complete, stopping after ``max_hits`` finds."""
+    settings = _Settings(max_workers, timeout, per_host_limit, adaptive, retry, warm_hosts, cache)
+    items = _aiter_results(username, _load_plan(sites_path, settings), settings, max_hits)
+    try:
+        async for _, result in items:
+            yield result
+    finally:
+        await items.aclose()
+
+
+def _stream_indexed(
+    username: str,
+    plan: _Plan,
+    settings: _Settings,
+    max_hits: int | None,
+    stop: threading.Event | None,
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    async def _run(emit: Callable[[object], None]) -> None:
+        items = _aiter_results(username, plan, settings, max_hits)
+        try:
+            async for item in items:
+                emit(item)
+        finally:
+            await items.aclose()
+
+    return _stream(_run, stop)
+
+
+def stream_username(
+    username: str,
+    sites_path: str | None = None,
+    max_workers: int = _DEFAULT_CONCURRENCY,
+    timeout: float = _DEFAULT_TIMEOUT,
+    per_host_limit: int = _DEFAULT_PER_HOST_LIMIT,
+    adaptive: bool = True,
+    max_hits: int | None = None,
+    stop: threading.Event | None = None,
+    retry: RetryPolicy | None = None,
+    warm_hosts: int = 0,
+    cache: Mapping[str, Any] | None = None,
+) -> Iterator[Dict[str, str]]:
+    """Yield a username's site results as each check completes; ``stop`` cancels the rest."""
+    settings = _Settings(max_workers, timeout, per_host_limit, adaptive, retry, warm_hosts, cache)
+    items = _stream_indexed(username, _load_plan(sites_path, settings), settings, max_hits, stop)
+    try:
+        for _, result in items:
+            yield result
+    finally:
+        items.close()
+
+
+def _format_result(entry: Dict[str, str]) -> str:
+    return f"{entry['site']}: {entry['url']} [{entry['status']}] found={entry['found']}"
+
+
 def search_username(
     username: str,
     sites_path: str | None = None,
-    max_workers: int = _DEFAULT_WORKERS,
+    max_workers: int = _DEFAULT_CONCURRENCY,
     timeout: float = _DEFAULT_TIMEOUT,
+    per_host_limit: int = _DEFAULT_PER_HOST_LIMIT,
+    adaptive: bool = True,
+    max_hits: int | None = None,
+    on_result: Callable[[Dict[str, str]], None] | None = None,
+    retry: RetryPolicy | None = None,
+    warm_hosts: int = 0,
+    cache: Mapping[str, Any] | None = None,
 ) -> List[Dict[str, str]]:
-    if not sites_path:
-        sites_path = _DEFAULT_SITES_PATH
+    """Check a username, writing the text report as results arrive; returns them in site order."""
+    start = time.time()
+    settings = _Settings(max_workers, timeout, per_host_limit, adaptive, retry, warm_hosts, cache)
+    plan = _load_plan(sites_path, settings)
+    collected: List[Tuple[int, Dict[str, str]]] = []
+    path = _results_path(f"username_{username}", "txt")
+    with open(path, "w", encoding="utf-8") as report:
+        report.write(f"Username: {username}\n\n")
+        report.flush()
+        items = _stream_indexed(username, plan, settings, max_hits, None)
+        for index, entry in items:
+            collected.append((index, entry))
+            report.write(_format_result(entry) + "\n")
+            report.flush()
+            if on_result is not None:
+                on_result(entry)
 
-    sites = _load_sites(sites_path)
-    max_workers = max(_DEFAULT_MIN_WORKERS, min(_DEFAULT_MAX_WORKERS, max_workers))
-    results: List[Dict[str, str]] = []
-    lock = threading.Lock()
+        duration = time.time() - start
+        report.write(f"\nChecked: {len(collected)} sites\n")
+        report.write(f"Duration: {duration:.2f}s\n")
 
-    start = time.time()
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(_check_site, site, username, timeout) for site in sites]
-        for future in as_completed(futures):
-            result = future.result()
-            with lock:
-                results.append(result)
-
-    duration = time.time() - start
-    lines = [
-        f"Username: {username}",
-        f"Checked: {len(results)} sites",
-        f"Duration: {duration:.2f}s",
-        "",
-    ]
-    for entry in sorted(results, key=lambda x: x["site"].lower()):
-        lines.append(f"{entry['site']}: {entry['url']} [{entry['status']}] found={entry['found']}")
-
-    _save_text(f"username_{username}", lines)
+    collected.sort(key=lambda item: item[0])
+    results = [entry for _, entry in collected]
     _save_json(f"username_{username}", results)
     return results
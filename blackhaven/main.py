@@ -5,6 +5,11 @@ Copyright (c) 2026 erraf132 and Vyrn.exe Official
 All rights reserved.
 """
 
+import argparse
+from typing import List, Optional
+
+from framework.core.response_cache import bypass_response_cache
+
 from .ui import display_logo, require_login, run_app
 from .ui.banner import show_banner
 from .utils.results_file import prompt_results_file
@@ -49,7 +54,13 @@ def show_legal_disclaimer() -> None:
         print('Confirmation not received. Type "I AGREE" to continue or Ctrl+C to exit.')
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="blackhaven")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    args = parser.parse_args(argv)
+    if args.no_cache:
+        bypass_response_cache()
+
     show_legal_disclaimer()
 
     # Prompt for the shared results file before any auth flow.
@@ -9,9 +9,10 @@ All rights reserved.
 from __future__ import annotations
 
 import json
-import urllib.request
 from typing import Dict, Tuple
 
+from framework.core.http import get_client
+
 from ._utils import get_logger
 
 LOG = get_logger("net")
@@ -23,9 +24,9 @@ def http_request(
     timeout: int = 8,
     method: str = "GET",
 ) -> Tuple[int, str]:
-    req = urllib.request.Request(url, headers=headers or {}, method=method)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.status, resp.read().decode("utf-8", errors="replace")
+    resp = get_client().request(method, url, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return resp.status_code, resp.content.decode("utf-8", errors="replace")
 
 
 def http_get(url: str, headers: Dict[str, str] | None = None, timeout: int = 8) -> Tuple[int, str]:
@@ -8,13 +8,27 @@ All rights reserved.
 
 from __future__ import annotations
 
+import os
 import re
+from typing import Any, Dict
 
 from colorama import Fore, Style
 
 from blackhaven.auth_pkg.logger import log_action
 from blackhaven.auth_pkg.session import get_current_user
 from blackhaven.core.username_engine import search_username
+from framework.core.utils import ConfigManager
+
+# Response-cache TTLs and limits are shared with the framework modules.
+FRAMEWORK_CONFIG = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "framework", "config.yaml"
+)
+
+
+def _cache_settings() -> Dict[str, Any]:
+    """``response_cache*`` settings; ``--no-cache`` or ``BLACKHAVEN_NO_CACHE`` still bypass the cache."""
+
+    return ConfigManager(FRAMEWORK_CONFIG).data
 
 
 def run() -> None:
@@ -29,17 +43,25 @@ def run() -> None:
     if user:
         log_action(user.username, f"searched username {username}")
 
+    cache = _cache_settings()
+
     print("\nChecking sites:")
-    results = search_username(username)
 
-    for entry in sorted(results, key=lambda x: x["site"].lower()):
-        status = entry["status"]
+    def _show(entry) -> None:
         found = entry["found"]
-        color = Fore.GREEN if found == "yes" else Fore.RED if found == "no" else Fore.YELLOW
-        line = f"- {entry['site']}: {status} ({entry['url']})"
+        if found == "yes":
+            color = Fore.GREEN
+        elif entry["status"] == "skipped-breaker":
+            color = Fore.YELLOW
+        else:
+            color = Fore.RED
+        line = f"- {entry['site']}: {entry['status']} ({entry['url']})"
         print(f"{color}{line}{Style.RESET_ALL}")
-    print("\nSaved results to: /home/hacker/BlackHaven/results/usernames/")
 
+    results = search_username(username, on_result=_show, cache=cache)
+    hits = sum(1 for entry in results if entry["found"] == "yes")
+    print(f"\nFound on {hits} of {len(results)} sites.")
+    print("Saved results to: /home/hacker/BlackHaven/results/usernames/")
 
 def get_module():
     return {
@@ -8,6 +8,15 @@ All rights reserved.
 
 """BlackHaven Framework package."""
 
-from framework.core.framework import Framework
+from typing import Any
 
 __all__ = ["Framework"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported lazily so ``import framework.core.x`` does not load the whole shell.
+    if name == "Framework":
+        from framework.core.framework import Framework
+
+        return Framework
+    raise AttributeError(f"module 'framework' has no attribute {name!r}")
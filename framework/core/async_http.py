@@ -0,0 +1,711 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import socket
+import ssl
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Tuple
+from urllib.parse import urljoin, urlsplit
+from framework.core.concurrency import (
+    RESET,
+    THROTTLE_STATUSES,
+    THROTTLED,
+    TIMEOUT,
+    AIMDController,
+    AsyncAdaptiveGate,
+    is_connection_reset,
+)
+from framework.core.http import DEFAULT_TIMEOUT, DEFAULT_USER_AGENT
+from framework.core.retry import RetryPolicy
+
+# Total requests in flight across all hosts.
+DEFAULT_LIMIT = 256
+# Requests in flight (and idle keep-alive connections kept) per host.
+DEFAULT_LIMIT_PER_HOST = 8
+DEFAULT_CHUNK_SIZE = 16384
+MAX_REDIRECTS = 5
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+# Redirect bodies larger than this are not drained; the connection is dropped.
+_DRAIN_LIMIT = 65536
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+# Seconds a resolved (or failed) host lookup is reused.
+DNS_TTL = 300.0
+# Threads resolving hostnames; getaddrinfo blocks, so this bounds DNS parallelism.
+DNS_WORKERS = 64
+
+HostKey = Tuple[str, str, int]
+
+
+class HTTPProtocolError(Exception):
+    """Raised when a server sends a malformed HTTP/1.1 response."""
+
+
+class _StaleConnection(Exception):
+    """A pooled keep-alive connection was closed by the server."""
+
+
+class _Connection:
+    """Open stream pair bound to one scheme/host/port."""
+
+    def __init__(self, key: HostKey, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class AsyncResponse:
+    """Response whose body is streamed from a pooled connection.
+
+    The body is not read until ``iter_chunks`` or ``read`` is called, so a
+    caller can stop early; ``release`` then drops the connection instead of
+    returning it to the pool.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncHTTPClient",
+        conn: _Connection,
+        method: str,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        keep_alive: bool,
+        deadline: float,
+    ) -> None:
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.history: List[Tuple[int, str]] = []
+        # Monotonic time the request was sent; set by the client.
+        self.started = time.monotonic()
+        self._client = client
+        self._conn: _Connection | None = conn
+        self._keep_alive = keep_alive
+        self._deadline = deadline
+        self._chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+        self._chunk_left = 0
+        self._length: int | None = None
+        self._done = False
+
+        if method == "HEAD" or status in {204, 304} or 100 <= status < 200:
+            self._done = True
+        elif not self._chunked:
+            length = headers.get("content-length")
+            if length is not None and length.strip().isdigit():
+                self._length = int(length)
+                self._done = self._length == 0
+            else:
+                self._keep_alive = False
+
+        encoding = headers.get("content-encoding", "").lower()
+        self._decoder = None
+        if encoding in {"gzip", "x-gzip"}:
+            self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._decoder = zlib.decompressobj()
+
+    async def _io(self, coro):
+        remaining = self._deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            coro.close()
+            raise asyncio.TimeoutError()
+        return await asyncio.wait_for(coro, remaining)
+
+    async def _read_some(self, size: int) -> bytes:
+        """Read the next piece of the transfer-decoded body, or b"" at the end."""
+
+        if self._done or self._conn is None:
+            return b""
+        reader = self._conn.reader
+
+        if self._chunked:
+            if self._chunk_left == 0:
+                line = await self._io(reader.readline())
+                size_text = line.split(b";", 1)[0].strip()
+                if not size_text:
+                    raise HTTPProtocolError("Missing chunk size")
+                self._chunk_left = int(size_text, 16)
+                if self._chunk_left == 0:
+                    while True:
+                        trailer = await self._io(reader.readline())
+                        if trailer in {b"\r\n", b"\n", b""}:
+                            break
+                    self._done = True
+                    return b""
+            data = await self._io(reader.read(min(size, self._chunk_left)))
+            if not data:
+                raise HTTPProtocolError("Connection closed inside a chunk")
+            self._chunk_left -= len(data)
+            if self._chunk_left == 0:
+                await self._io(reader.readexactly(2))
+            return data
+
+        if self._length is not None:
+            data = await self._io(reader.read(min(size, self._length)))
+            if not data:
+                raise HTTPProtocolError("Connection closed before Content-Length")
+            self._length -= len(data)
+            self._done = self._length == 0
+            return data
+
+        data = await self._io(reader.read(size))
+        if not data:
+            self._done = True
+        return data
+
+    async def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yield decoded body chunks as they arrive."""
+
+        while True:
+            data = await self._read_some(size)
+            if not data:
+                if self._decoder is not None:
+                    tail = self._decoder.flush()
+                    if tail:
+                        yield tail
+                return
+            if self._decoder is not None:
+                data = self._decoder.decompress(data)
+                if not data:
+                    continue
+            yield data
+
+    async def read(self, limit: int | None = None) -> bytes:
+        """Read the body, stopping once ``limit`` bytes have been collected."""
+
+        parts: List[bytes] = []
+        total = 0
+        async for chunk in self.iter_chunks():
+            parts.append(chunk)
+            total += len(chunk)
+            if limit is not None and total >= limit:
+                break
+        body = b"".join(parts)
+        return body[:limit] if limit is not None else body
+
+    @property
+    def complete(self) -> bool:
+        return self._done
+
+    def peer_certificate(self) -> bytes | None:
+        """DER certificate of the TLS peer, available until the response is released."""
+
+        if self._conn is None:
+            return None
+        ssl_object = self._conn.writer.get_extra_info("ssl_object")
+        return ssl_object.getpeercert(binary_form=True) if ssl_object is not None else None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since this (final) request was sent, excluding queueing."""
+
+        return time.monotonic() - self.started
+
+    def release(self) -> None:
+        """Return the connection to the pool, or close it if the body was not consumed."""
+
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        self._client._finish(conn, reusable=self._done and self._keep_alive)
+
+
+class AsyncHTTPClient:
+    """Asyncio HTTP/1.1 client with keep-alive pools and per-host limits.
+
+    Shares the user agent and timeout defaults of ``framework.core.http``
+    so async engines behave like the synchronous client. With a
+    ``controller`` the global in-flight cap follows its AIMD limit (never
+    exceeding ``limit``) and every request outcome is fed back to it. A
+    ``retry`` policy adds retries with backoff and optional hedging for
+    idempotent requests. ``verify_tls=False`` accepts any certificate,
+    for probing hosts whose certificates are self-signed or mismatched.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: float = DEFAULT_TIMEOUT,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        controller: AIMDController | None = None,
+        retry: RetryPolicy | None = None,
+        verify_tls: bool = True,
+    ) -> None:
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.limit = max(1, limit)
+        self.limit_per_host = max(1, limit_per_host)
+        self.controller = controller
+        self.retry = retry
+        self._ssl_context = ssl.create_default_context()
+        if not verify_tls:
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+        self._idle: Dict[HostKey, List[_Connection]] = {}
+        self._host_slots: Dict[HostKey, asyncio.Semaphore] = {}
+        self._slots = AsyncAdaptiveGate(self._current_limit)
+        self._dns: Dict[Tuple[str, int], Tuple[float, asyncio.Future]] = {}
+        self._resolver: ThreadPoolExecutor | None = None
+
+    def _current_limit(self) -> int:
+        if self.controller is None:
+            return self.limit
+        return min(self.limit, self.controller.limit)
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every idle pooled connection."""
+
+        for connections in self._idle.values():
+            for conn in connections:
+                conn.close()
+        self._idle.clear()
+        if self._resolver is not None:
+            self._resolver.shutdown(wait=False)
+            self._resolver = None
+
+    @staticmethod
+    def host_key(url: str) -> HostKey | None:
+        """Return the (scheme, host, port) pool key for ``url``, or None if unsupported."""
+
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in _DEFAULT_PORTS or not parts.hostname:
+            return None
+        try:
+            port = parts.port or _DEFAULT_PORTS[scheme]
+        except ValueError:
+            return None
+        return scheme, parts.hostname, port
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """Resolve ``host`` to addresses, sharing lookups and caching results.
+
+        Concurrent callers share one lookup; answers and failures are both
+        cached for ``DNS_TTL`` so a dead domain is not resolved again per
+        request.
+        """
+
+        loop = asyncio.get_running_loop()
+        entry = self._dns.get((host, port))
+        if entry is None or entry[0] <= loop.time():
+            if self._resolver is None:
+                self._resolver = ThreadPoolExecutor(max_workers=DNS_WORKERS, thread_name_prefix="dns")
+            lookup = loop.run_in_executor(
+                self._resolver,
+                lambda: socket.getaddrinfo(host, port, type=socket.SOCK_STREAM),
+            )
+            entry = self._dns[(host, port)] = (loop.time() + DNS_TTL, lookup)
+        infos = await asyncio.shield(entry[1])
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+    async def prefetch(self, keys: Iterable[HostKey]) -> int:
+        """Resolve every distinct host in ``keys`` concurrently; returns how many resolved."""
+
+        async def _one(host: str, port: int) -> bool:
+            try:
+                await self.resolve(host, port)
+            except Exception:
+                return False
+            return True
+
+        unique = {(host, port) for _, host, port in keys}
+        results = await asyncio.gather(*(_one(host, port) for host, port in unique))
+        return sum(results)
+
+    async def warm_up(self, counts: Dict[HostKey, int], timeout: float | None = None) -> int:
+        """Pre-open idle keep-alive connections, up to ``limit_per_host`` per host.
+
+        ``counts`` maps hosts to how many connections are wanted; failures
+        are ignored. Returns the number of connections parked in the pool.
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout if timeout is not None else self.timeout)
+
+        async def _open(key: HostKey) -> bool:
+            try:
+                conn = await self._connect(key, deadline, fresh=True)
+            except Exception:
+                return False
+            idle = self._idle.setdefault(key, [])
+            if len(idle) >= self.limit_per_host:
+                conn.close()
+                return False
+            idle.append(conn)
+            return True
+
+        wanted = [
+            key
+            for key, count in counts.items()
+            for _ in range(min(count, self.limit_per_host) - len(self._idle.get(key, [])))
+        ]
+        results = await asyncio.gather(*(_open(key) for key in wanted))
+        return sum(results)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+        allow_redirects: bool = True,
+        hedge_after: float | None = None,
+    ) -> AsyncIterator[AsyncResponse]:
+        """Send a request and yield the response with its body unread."""
+
+        response = await self.request(
+            method,
+            url,
+            headers=headers,
+            body=body,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            hedge_after=hedge_after,
+        )
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+        allow_redirects: bool = True,
+        hedge_after: float | None = None,
+    ) -> AsyncResponse:
+        """Send a request, following redirects; the caller must release the response.
+
+        With a retry policy, idempotent requests are retried on transient
+        errors and retryable statuses, and may be hedged: ``hedge_after``
+        overrides the policy's rolling p95 as the hedge delay.
+        """
+
+        method = method.upper()
+        policy = self.retry
+
+        def _once() -> Awaitable[AsyncResponse]:
+            return self._request_once(method, url, headers, body, timeout, allow_redirects)
+
+        if policy is None:
+            return await _once()
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._hedged(_once, policy.hedge_delay(method, hedge_after))
+            except Exception as exc:
+                timed_out = isinstance(exc, asyncio.TimeoutError)
+                if not policy.retry_error(method, attempt, exc, timed_out):
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                if not policy.retry_status(method, attempt, response.status):
+                    return response
+                delay = policy.delay(attempt, response.headers.get("retry-after"))
+                if delay is None:
+                    return response
+                try:
+                    await response.read(_DRAIN_LIMIT)
+                finally:
+                    response.release()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _hedged(
+        self,
+        send: Callable[[], Awaitable[AsyncResponse]],
+        delay: float | None,
+    ) -> AsyncResponse:
+        """Run ``send``; if it is still pending after ``delay``, race a duplicate."""
+
+        if delay is None:
+            return await send()
+
+        tasks = [asyncio.ensure_future(send())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                tasks.append(asyncio.ensure_future(send()))
+            error: BaseException | None = None
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.remove(task)
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(outcome, AsyncResponse):
+                    outcome.release()
+
+    async def _request_once(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None,
+        body: bytes | None,
+        timeout: float | None,
+        allow_redirects: bool,
+    ) -> AsyncResponse:
+        timeout = timeout if timeout is not None else self.timeout
+        history: List[Tuple[int, str]] = []
+
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._send(method, url, headers, body, timeout)
+            location = response.headers.get("location")
+            if not allow_redirects or response.status not in REDIRECT_CODES or not location:
+                response.history = history
+                return response
+
+            history.append((response.status, url))
+            try:
+                await response.read(_DRAIN_LIMIT)
+            finally:
+                response.release()
+            url = urljoin(url, location)
+            if response.status == 303 or (response.status in {301, 302} and method == "POST"):
+                method = "GET"
+                body = None
+
+        raise HTTPProtocolError(f"Too many redirects for {url}")
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None,
+        body: bytes | None,
+        timeout: float,
+    ) -> AsyncResponse:
+        key = self.host_key(url)
+        if key is None:
+            raise ValueError(f"Unsupported URL: {url}")
+        parts = urlsplit(url)
+
+        host_slot = self._host_slots.get(key)
+        if host_slot is None:
+            host_slot = self._host_slots[key] = asyncio.Semaphore(self.limit_per_host)
+
+        await host_slot.acquire()
+        try:
+            await self._slots.acquire()
+        except BaseException:
+            host_slot.release()
+            raise
+
+        started = time.monotonic()
+        deadline = asyncio.get_running_loop().time() + timeout
+        payload = self._encode_request(method, parts, headers, body)
+        try:
+            for attempt in range(2):
+                conn = await self._connect(key, deadline, fresh=attempt > 0)
+                try:
+                    response = await self._exchange(conn, method, url, payload, deadline)
+                except _StaleConnection:
+                    conn.close()
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+                response.started = started
+                self._record(response.status, time.monotonic() - started)
+                return response
+            raise HTTPProtocolError(f"Connection closed by {key[1]}")
+        except BaseException as exc:
+            self._record_error(exc)
+            self._release_slots(key)
+            raise
+
+    def _record(self, status: int, latency: float) -> None:
+        if self.retry is not None:
+            self.retry.observe(latency)
+        if self.controller is None:
+            return
+        if status in THROTTLE_STATUSES:
+            self.controller.record_failure(THROTTLED)
+        else:
+            self.controller.record_success(latency)
+
+    def _record_error(self, exc: BaseException) -> None:
+        if self.controller is None:
+            return
+        if isinstance(exc, asyncio.TimeoutError):
+            self.controller.record_failure(TIMEOUT)
+        elif is_connection_reset(exc):
+            self.controller.record_failure(RESET)
+
+    def _encode_request(
+        self,
+        method: str,
+        parts,
+        headers: Dict[str, str] | None,
+        body: bytes | None,
+    ) -> bytes:
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        merged = {
+            "host": ("Host", parts.netloc.rsplit("@", 1)[-1]),
+            "user-agent": ("User-Agent", self.user_agent),
+            "accept": ("Accept", "*/*"),
+            "accept-encoding": ("Accept-Encoding", "gzip, deflate"),
+            "connection": ("Connection", "keep-alive"),
+        }
+        for name, value in (headers or {}).items():
+            merged[name.lower()] = (name, str(value))
+        if body is not None:
+            merged["content-length"] = ("Content-Length", str(len(body)))
+
+        lines = [f"{method} {path} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in merged.values())
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1", errors="replace")
+        return head + body if body else head
+
+    async def _connect(self, key: HostKey, deadline: float, fresh: bool = False) -> _Connection:
+        if not fresh:
+            idle = self._idle.get(key)
+            while idle:
+                conn = idle.pop()
+                if conn.writer.is_closing() or conn.reader.at_eof():
+                    conn.close()
+                    continue
+                conn.reused = True
+                return conn
+
+        scheme, host, port = key
+        ssl_context = self._ssl_context if scheme == "https" else None
+        loop = asyncio.get_running_loop()
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        addresses = await asyncio.wait_for(self.resolve(host, port), remaining)
+
+        error: BaseException | None = None
+        for address in addresses:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(
+                        address,
+                        port,
+                        ssl=ssl_context,
+                        server_hostname=host if ssl_context else None,
+                    ),
+                    remaining,
+                )
+            except (OSError, ssl.SSLError) as exc:
+                error = exc
+                continue
+            break
+        else:
+            raise error or OSError(f"No addresses for {host}")
+        return _Connection(key, reader, writer)
+
+    async def _exchange(
+        self,
+        conn: _Connection,
+        method: str,
+        url: str,
+        payload: bytes,
+        deadline: float,
+    ) -> AsyncResponse:
+        loop = asyncio.get_running_loop()
+
+        async def _io(coro):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                coro.close()
+                raise asyncio.TimeoutError()
+            return await asyncio.wait_for(coro, remaining)
+
+        try:
+            conn.writer.write(payload)
+            await _io(conn.writer.drain())
+            line = await _io(conn.reader.readline())
+        except (ConnectionError, asyncio.IncompleteReadError):
+            if conn.reused:
+                raise _StaleConnection()
+            raise
+        if not line:
+            if conn.reused:
+                raise _StaleConnection()
+            raise HTTPProtocolError("Empty response")
+
+        while True:
+            status_parts = line.decode("latin-1").split(None, 2)
+            if len(status_parts) < 2 or not status_parts[0].startswith("HTTP/"):
+                raise HTTPProtocolError(f"Bad status line: {line[:80]!r}")
+            version = status_parts[0]
+            try:
+                status = int(status_parts[1])
+            except ValueError:
+                raise HTTPProtocolError(f"Bad status code: {status_parts[1]!r}")
+
+            headers: Dict[str, str] = {}
+            while True:
+                raw = await _io(conn.reader.readline())
+                if raw in {b"\r\n", b"\n", b""}:
+                    break
+                name, _, value = raw.decode("latin-1").partition(":")
+                name = name.strip().lower()
+                value = value.strip()
+                headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+            if status != 100 and not (100 < status < 200):
+                break
+            line = await _io(conn.reader.readline())
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = version != "HTTP/1.0" and "close" not in connection
+        return AsyncResponse(self, conn, method, url, status, headers, keep_alive, deadline)
+
+    def _finish(self, conn: _Connection, reusable: bool) -> None:
+        if reusable and not conn.writer.is_closing():
+            idle = self._idle.setdefault(conn.key, [])
+            if len(idle) < self.limit_per_host:
+                idle.append(conn)
+            else:
+                conn.close()
+        else:
+            conn.close()
+        self._release_slots(conn.key)
+
+    def _release_slots(self, key: HostKey) -> None:
+        self._host_slots[key].release()
+        self._slots.release()
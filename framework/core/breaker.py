@@ -0,0 +1,87 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import time
+from typing import Set
+from framework.core.state import PersistentStore
+
+DEFAULT_BREAKER_FILE = "breakers.json"
+# Consecutive failures that open a site's breaker.
+DEFAULT_THRESHOLD = 5
+# Seconds an open breaker skips its site before a half-open probe.
+DEFAULT_COOLDOWN = 3600.0
+# A failed probe doubles the cool-down, up to this many seconds.
+MAX_COOLDOWN = 7 * 24 * 3600.0
+
+
+class CircuitBreaker(PersistentStore):
+    """Per-site circuit breakers.
+
+    A site is closed (checked normally) until ``threshold`` consecutive
+    failures open it. While open it is skipped; once the cool-down passes
+    a single half-open probe is let through. A successful probe closes the
+    breaker, a failed one reopens it with a doubled cool-down.
+    """
+
+    FILE = DEFAULT_BREAKER_FILE
+
+    def __init__(
+        self,
+        path: str | None = None,
+        threshold: int = DEFAULT_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        super().__init__(path)
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self._probing: Set[str] = set()
+
+    def allow(self, key: str) -> bool:
+        """Return True if ``key`` may be checked now (closed, or half-open probe)."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.get("opened_at") is None:
+                return True
+            if key in self._probing:
+                return False
+            if time.time() < entry["opened_at"] + entry.get("cooldown", self.cooldown):
+                return False
+            self._probing.add(key)
+            return True
+
+    def is_open(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return bool(entry and entry.get("opened_at") is not None)
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            self._probing.discard(key)
+            if key in self._entries:
+                del self._entries[key]
+                self._dirty = True
+
+    def release(self, key: str) -> None:
+        """Give back a half-open probe that ended without a verdict."""
+
+        with self._lock:
+            self._probing.discard(key)
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.setdefault(key, {"failures": 0, "opened_at": None})
+            entry["failures"] += 1
+            if key in self._probing:
+                self._probing.discard(key)
+                entry["opened_at"] = time.time()
+                entry["cooldown"] = min(MAX_COOLDOWN, entry.get("cooldown", self.cooldown) * 2)
+            elif entry["opened_at"] is None and entry["failures"] >= self.threshold:
+                entry["opened_at"] = time.time()
+                entry["cooldown"] = self.cooldown
+            self._dirty = True
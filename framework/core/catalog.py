@@ -0,0 +1,145 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+import os
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Tuple
+from urllib.parse import urlsplit
+from framework.core.state import load_compiled
+
+# Bump whenever SiteEntry changes shape so stale pickles are rebuilt.
+_CACHE_VERSION = 1
+# Bytes of a profile page scanned for e_string/m_string before giving up.
+DEFAULT_MAX_BODY_BYTES = 512 * 1024
+# Strategy: signatures must be searched for in the body.
+STRATEGY_BODY = "body"
+# Strategy: the status code alone decides, the body is never needed.
+STRATEGY_STATUS = "status"
+_PLACEHOLDERS = {"account", "username"}
+
+
+@dataclass(frozen=True)
+class SiteEntry:
+    """Normalized, ready-to-probe site definition."""
+
+    name: str
+    url_parts: Tuple[str, ...]
+    display_parts: Tuple[str, ...]
+    host: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    body_parts: Tuple[str, ...] | None = None
+    e_sig: bytes | None = None
+    m_sig: bytes | None = None
+    e_code: int | None = None
+    m_code: int | None = None
+    strategy: str = STRATEGY_STATUS
+    max_bytes: int = DEFAULT_MAX_BODY_BYTES
+
+    @property
+    def valid(self) -> bool:
+        return bool(self.url_parts)
+
+    def url(self, username: str) -> str:
+        return username.join(self.url_parts)
+
+    def display_url(self, username: str) -> str:
+        return username.join(self.display_parts)
+
+    def body(self, username: str) -> str | None:
+        if self.body_parts is None:
+            return None
+        return username.join(self.body_parts)
+
+
+def _split_template(template: str) -> Tuple[str, ...]:
+    """Split a ``{account}``/``{username}`` template into literal parts.
+
+    Formatting then becomes ``username.join(parts)``; unknown fields make
+    the template invalid, matching the KeyError ``format_map`` would raise.
+    """
+
+    parts: List[str] = []
+    literal = ""
+    for text, field_name, _, _ in Formatter().parse(template):
+        literal += text
+        if field_name is None:
+            continue
+        if field_name not in _PLACEHOLDERS:
+            raise ValueError(f"Unknown template field: {field_name}")
+        parts.append(literal)
+        literal = ""
+    parts.append(literal)
+    return tuple(parts)
+
+
+def _as_code(value: Any) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def compile_site(site: Dict[str, Any]) -> SiteEntry:
+    """Normalize one raw ``sites.json``/``data.json`` record."""
+
+    url_template = site.get("url") or site.get("uri_check") or ""
+    display_template = site.get("uri_pretty") or url_template
+    name = site.get("name") or display_template or "unknown"
+
+    try:
+        url_parts = _split_template(url_template) if url_template else ()
+        display_parts = _split_template(display_template) if display_template else ()
+        post_body = site.get("post_body")
+        body_parts = _split_template(post_body) if post_body is not None else None
+    except ValueError:
+        return SiteEntry(name=name, url_parts=(), display_parts=())
+
+    e_string = site.get("e_string")
+    m_string = site.get("m_string")
+    e_sig = e_string.encode("utf-8") if e_string else None
+    m_sig = m_string.encode("utf-8") if m_string else None
+
+    return SiteEntry(
+        name=name,
+        url_parts=url_parts,
+        display_parts=display_parts,
+        host=(urlsplit(url_template).hostname or "").lower(),
+        headers=dict(site.get("headers") or {}),
+        body_parts=body_parts,
+        e_sig=e_sig,
+        m_sig=m_sig,
+        e_code=_as_code(site.get("e_code")),
+        m_code=_as_code(site.get("m_code")),
+        strategy=STRATEGY_BODY if (e_sig or m_sig) else STRATEGY_STATUS,
+        max_bytes=int(site.get("max_bytes", DEFAULT_MAX_BODY_BYTES)),
+    )
+
+
+def compile_sites(sites: Iterable[Dict[str, Any]]) -> List[SiteEntry]:
+    return [compile_site(site) for site in sites]
+
+
+def _build_catalog(path: str) -> List[SiteEntry]:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    return compile_sites(data.get("sites", []))
+
+
+def load_catalog(path: str) -> List[SiteEntry]:
+    """Return the compiled catalog for a site list file.
+
+    The compiled entries are cached in memory and on disk (see
+    ``load_compiled``); JSON is only parsed when the file changed.
+    """
+
+    path = os.path.abspath(path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Sites file not found: {path}")
+    return load_compiled(path, "catalog", _CACHE_VERSION, _build_catalog)
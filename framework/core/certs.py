@@ -0,0 +1,131 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import ipaddress
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+
+_OID_COMMON_NAME = b"\x55\x04\x03"
+_OID_SUBJECT_ALT_NAME = b"\x55\x1d\x11"
+_SEQUENCE = 0x30
+_SET = 0x31
+_OID = 0x06
+_OCTET_STRING = 0x04
+_EXTENSIONS = 0xA3
+_VERSION = 0xA0
+_SAN_DNS = 0x82
+_SAN_IP = 0x87
+_STRING_CODECS = {0x0C: "utf-8", 0x13: "ascii", 0x14: "latin-1", 0x16: "ascii", 0x1E: "utf-16-be"}
+
+Tlv = Tuple[int, int, int]
+
+
+def _read_tlv(data: bytes, pos: int) -> Tlv:
+    """Return (tag, content start, content end) of the DER element at ``pos``."""
+
+    if pos + 2 > len(data):
+        raise ValueError("Truncated DER element")
+    tag = data[pos]
+    length = data[pos + 1]
+    pos += 2
+    if length & 0x80:
+        count = length & 0x7F
+        if count == 0 or count > 4 or pos + count > len(data):
+            raise ValueError("Bad DER length")
+        length = int.from_bytes(data[pos:pos + count], "big")
+        pos += count
+    if pos + length > len(data):
+        raise ValueError("DER element overruns its parent")
+    return tag, pos, pos + length
+
+
+def _children(data: bytes, start: int, end: int) -> Iterator[Tlv]:
+    pos = start
+    while pos < end:
+        tlv = _read_tlv(data, pos)
+        yield tlv
+        pos = tlv[2]
+
+
+def _string(data: bytes, tlv: Tlv) -> str:
+    tag, start, end = tlv
+    return data[start:end].decode(_STRING_CODECS.get(tag, "latin-1"), "replace")
+
+
+def _common_name(data: bytes, name: Tlv) -> str | None:
+    for _, set_start, set_end in _children(data, name[1], name[2]):
+        for _, start, end in _children(data, set_start, set_end):
+            parts = list(_children(data, start, end))
+            if len(parts) == 2 and parts[0][0] == _OID and data[parts[0][1]:parts[0][2]] == _OID_COMMON_NAME:
+                return _string(data, parts[1])
+    return None
+
+
+def _time(data: bytes, tlv: Tlv) -> str | None:
+    text = data[tlv[1]:tlv[2]].decode("ascii", "replace")
+    layout = "%y%m%d%H%M%SZ" if tlv[0] == 0x17 else "%Y%m%d%H%M%SZ"
+    try:
+        return datetime.strptime(text, layout).replace(tzinfo=timezone.utc).isoformat()
+    except ValueError:
+        return None
+
+
+def _alt_names(data: bytes, start: int, end: int) -> List[str]:
+    names: List[str] = []
+    _, seq_start, seq_end = _read_tlv(data, start)
+    for tag, name_start, name_end in _children(data, seq_start, seq_end):
+        if tag == _SAN_DNS:
+            names.append(data[name_start:name_end].decode("ascii", "replace"))
+        elif tag == _SAN_IP and name_end - name_start in (4, 16):
+            names.append(str(ipaddress.ip_address(data[name_start:name_end])))
+    return names
+
+
+def parse_certificate(der: bytes) -> Dict[str, Any]:
+    """Extract subject/issuer CN, DNS/IP SANs and validity from a DER certificate.
+
+    A minimal DER walk, enough for reporting on unverified peers where
+    ``ssl`` only exposes the binary certificate. Raises ValueError when
+    the certificate is malformed.
+    """
+
+    tag, start, end = _read_tlv(der, 0)
+    if tag != _SEQUENCE:
+        raise ValueError("Not a certificate")
+    tbs_tag, tbs_start, tbs_end = _read_tlv(der, start)
+    if tbs_tag != _SEQUENCE:
+        raise ValueError("Missing TBSCertificate")
+    fields = list(_children(der, tbs_start, tbs_end))
+    if fields and fields[0][0] == _VERSION:
+        fields = fields[1:]
+    if len(fields) < 6:
+        raise ValueError("Truncated TBSCertificate")
+    _, _, issuer, validity, subject = fields[:5]
+
+    not_before = not_after = None
+    times = list(_children(der, validity[1], validity[2]))
+    if len(times) == 2:
+        not_before, not_after = _time(der, times[0]), _time(der, times[1])
+
+    san: List[str] = []
+    for field in fields[6:]:
+        if field[0] != _EXTENSIONS:
+            continue
+        _, ext_start, ext_end = _read_tlv(der, field[1])
+        for _, item_start, item_end in _children(der, ext_start, ext_end):
+            parts = list(_children(der, item_start, item_end))
+            if parts and der[parts[0][1]:parts[0][2]] == _OID_SUBJECT_ALT_NAME and parts[-1][0] == _OCTET_STRING:
+                san = _alt_names(der, parts[-1][1], parts[-1][2])
+
+    return {
+        "subject_cn": _common_name(der, subject),
+        "issuer_cn": _common_name(der, issuer),
+        "san": san,
+        "not_before": not_before,
+        "not_after": not_after,
+    }
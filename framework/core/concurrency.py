@@ -0,0 +1,163 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque
+
+# Failure kinds that signal congestion and trigger a multiplicative decrease.
+TIMEOUT = "timeout"
+THROTTLED = "throttled"
+RESET = "reset"
+CONGESTION_SIGNALS = {TIMEOUT, THROTTLED, RESET}
+# HTTP statuses treated as the server asking us to slow down.
+THROTTLE_STATUSES = {429, 503}
+
+
+def is_connection_reset(exc: BaseException) -> bool:
+    """Return True when ``exc`` (or anything it wraps) is a dropped connection."""
+
+    seen = set()
+    pending = [exc]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)):
+            return True
+        pending.extend([current.__cause__, current.__context__])
+        pending.extend(arg for arg in getattr(current, "args", ()) if isinstance(arg, BaseException))
+    return False
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease concurrency limit.
+
+    Until the first congestion signal the limit grows by ``increase`` per
+    healthy success (doubling every round trip, like TCP slow start).
+    After that, every success while latency stays within
+    ``latency_tolerance`` of the observed baseline and the congestion rate
+    is low adds ``increase / limit``, i.e. roughly one extra slot per
+    window of ``limit`` requests. A timeout, 429/503 or connection reset
+    multiplies the limit by ``decrease``; further signals during the
+    following cool-down are folded into that same decrease.
+    """
+
+    def __init__(
+        self,
+        initial: int = 16,
+        minimum: int = 2,
+        maximum: int = 256,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_congestion_rate: float = 0.1,
+    ) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.max_congestion_rate = max_congestion_rate
+        self._limit = float(min(self.maximum, max(self.minimum, initial)))
+        self._baseline: float | None = None
+        self._congestion_rate = 0.0
+        self._cooldown_until = 0.0
+        self._slow_start = True
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def baseline(self) -> float | None:
+        return self._baseline
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                self._baseline = self._baseline * 0.95 + latency * 0.05
+            self._congestion_rate *= 0.95
+
+            healthy = latency <= self._baseline * self.latency_tolerance
+            if healthy and self._congestion_rate <= self.max_congestion_rate:
+                step = self.increase if self._slow_start else self.increase / self._limit
+                self._limit = min(float(self.maximum), self._limit + step)
+
+    def record_failure(self, kind: str) -> None:
+        if kind not in CONGESTION_SIGNALS:
+            return
+        with self._lock:
+            self._congestion_rate = self._congestion_rate * 0.95 + 0.05
+            self._slow_start = False
+            now = time.monotonic()
+            if now < self._cooldown_until:
+                return
+            self._limit = max(float(self.minimum), self._limit * self.decrease)
+            self._cooldown_until = now + max(1.0, (self._baseline or 0.5) * 2)
+
+
+class AdaptiveGate:
+    """Thread gate admitting at most ``limit()`` concurrent holders."""
+
+    def __init__(self, limit: Callable[[], int]) -> None:
+        self._limit = limit
+        self._active = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self._limit():
+                self._cond.wait()
+            self._active += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+
+class AsyncAdaptiveGate:
+    """Asyncio counterpart of :class:`AdaptiveGate`; waiters are served in order."""
+
+    def __init__(self, limit: Callable[[], int]) -> None:
+        self._limit = limit
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        if not self._waiters and self._active < self._limit():
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._active < self._limit():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
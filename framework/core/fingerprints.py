@@ -0,0 +1,441 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import base64
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Pattern, Tuple
+from framework.core.state import load_compiled
+
+# Bump whenever the normalized signature layout changes so stale pickles are rebuilt.
+_CACHE_VERSION = 1
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "technologies.json")
+# Shortest literal worth using to pre-filter a signature.
+MIN_LITERAL = 3
+_FIELDS = ("headers", "cookies", "meta", "html", "scriptSrc", "url")
+_META_RE = re.compile(r"<meta\s[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"""([a-zA-Z:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+_SCRIPT_SRC_RE = re.compile(r"""<script[^>]+src\s*=\s*["']?([^"'\s>]+)""", re.IGNORECASE)
+_ICON_RE = re.compile(r"""<link[^>]+rel\s*=\s*["']?(?:shortcut\s+)?icon["']?[^>]*>""", re.IGNORECASE)
+_COOKIE_RE = re.compile(r"(?:^|,\s*)([A-Za-z0-9_.\-]+)=([^;,]*)")
+_SPECIAL = set(".^$*+?{}[]\\|()")
+_QUANTIFIER_RE = re.compile(r"\{(\d*)(?:,\d*)?\}")
+# Characters taken by the argument of an alphanumeric escape such as \x41.
+_ESCAPE_WIDTH = {"x": 2, "u": 4, "U": 8}
+
+
+@dataclass(frozen=True)
+class Technology:
+    name: str
+    categories: Tuple[str, ...] = ()
+    implies: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Signature:
+    """One pattern of one technology; an empty pattern only tests presence."""
+
+    tech: str
+    pattern: str = ""
+    version: str = ""
+    literal: str = ""
+
+
+@dataclass(frozen=True)
+class Detection:
+    name: str
+    version: str = ""
+    categories: Tuple[str, ...] = ()
+
+    def label(self) -> str:
+        return f"{self.name} {self.version}" if self.version else self.name
+
+
+def mmh3_32(data: bytes, seed: int = 0) -> int:
+    """Signed 32-bit MurmurHash3 (x86), as used for favicon hashes."""
+
+    mask = 0xFFFFFFFF
+    c1, c2 = 0xCC9E2D51, 0x1B873593
+    h = seed & mask
+    rounded = len(data) & ~3
+    for index in range(0, rounded, 4):
+        k = int.from_bytes(data[index:index + 4], "little")
+        k = (k * c1) & mask
+        k = ((k << 15) | (k >> 17)) & mask
+        h ^= (k * c2) & mask
+        h = ((h << 13) | (h >> 19)) & mask
+        h = (h * 5 + 0xE6546B64) & mask
+    k = 0
+    tail = len(data) & 3
+    if tail == 3:
+        k ^= data[rounded + 2] << 16
+    if tail >= 2:
+        k ^= data[rounded + 1] << 8
+    if tail >= 1:
+        k ^= data[rounded]
+        k = (k * c1) & mask
+        k = ((k << 15) | (k >> 17)) & mask
+        h ^= (k * c2) & mask
+    h ^= len(data)
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & mask
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & mask
+    h ^= h >> 16
+    return h - (1 << 32) if h & 0x80000000 else h
+
+
+def favicon_hash(content: bytes) -> int:
+    """Favicon hash in the Shodan ``http.favicon.hash`` convention."""
+
+    return mmh3_32(base64.encodebytes(content))
+
+
+def _escape_end(pattern: str, index: int) -> int:
+    """Index of the last character of the escape whose letter is at ``index``."""
+
+    char = pattern[index]
+    if char in _ESCAPE_WIDTH:
+        return min(index + _ESCAPE_WIDTH[char], len(pattern) - 1)
+    if char == "N" and pattern.startswith("{", index + 1):
+        end = pattern.find("}", index)
+        return end if end != -1 else len(pattern) - 1
+    # Octal escapes and group references: \0, \12, \101.
+    while char.isdigit() and index + 1 < len(pattern) and pattern[index + 1].isdigit():
+        index += 1
+    return index
+
+
+def _required_literal(pattern: str) -> str:
+    """Longest literal run every match of ``pattern`` must contain.
+
+    Only top-level text is considered; groups, classes and optional or
+    repeated characters break a run. Patterns with a top-level ``|`` have
+    no required literal.
+    """
+
+    runs: List[str] = []
+    current = ""
+    depth = 0
+    index = 0
+    in_class = False
+    while index < len(pattern):
+        char = pattern[index]
+        literal = None
+        if in_class:
+            if char == "\\":
+                index += 1
+            elif char == "]":
+                in_class = False
+        elif char == "\\" and index + 1 < len(pattern):
+            nxt = pattern[index + 1]
+            index += 1
+            if depth == 0 and not nxt.isalnum():
+                literal = nxt
+            elif nxt.isalnum():
+                index = _escape_end(pattern, index)
+        elif char == "{" and _QUANTIFIER_RE.match(pattern, index):
+            # A quantifier's digits are not text; the atom before it was handled already.
+            index = _QUANTIFIER_RE.match(pattern, index).end() - 1
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif char == "|" and depth == 0:
+            return ""
+        elif depth == 0 and char not in _SPECIAL:
+            literal = char
+        index += 1
+
+        if depth > 0 or in_class:
+            literal = None
+        if literal is None:
+            runs.append(current)
+            current = ""
+            continue
+        following = pattern[index] if index < len(pattern) else ""
+        quantifier = _QUANTIFIER_RE.match(pattern, index)
+        if following in ("?", "*") or (quantifier is not None and not int(quantifier.group(1) or 0)):
+            runs.append(current)
+            current = ""
+        elif following == "+" or quantifier is not None:
+            runs.append(current + literal)
+            current = ""
+        else:
+            current += literal
+    runs.append(current)
+    best = max(runs, key=len).lower()
+    return best if len(best) >= MIN_LITERAL else ""
+
+
+def _split_pattern(tech: str, raw: Any) -> Signature:
+    """Parse a Wappalyzer-style ``regex\\;version:\\1\\;confidence:50`` string."""
+
+    parts = str(raw).split("\\;")
+    version = ""
+    for extra in parts[1:]:
+        if extra.startswith("version:"):
+            version = extra[len("version:"):]
+    pattern = parts[0]
+    return Signature(tech=tech, pattern=pattern, version=version, literal=_required_literal(pattern))
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+class _PatternSet:
+    """Signatures matched against one kind of text in a single scan.
+
+    The required literals of all signatures are folded into one trie-shaped
+    regex; a scan of the lowered text finds which literals occur, and only
+    the signatures owning them (plus those without a literal) are run.
+    Individual patterns are compiled on first use.
+    """
+
+    def __init__(self, signatures: List[Signature]) -> None:
+        self.signatures = signatures
+        self._compiled: List[Pattern[str] | bool | None] = [None] * len(signatures)
+        self._always: List[int] = []
+        self._by_literal: Dict[str, List[int]] = {}
+        for index, signature in enumerate(signatures):
+            if signature.literal:
+                self._by_literal.setdefault(signature.literal, []).append(index)
+            else:
+                self._always.append(index)
+        self._trie: Dict[str, Any] = {}
+        for literal in self._by_literal:
+            node = self._trie
+            for char in literal:
+                node = node.setdefault(char, {})
+            node[""] = True
+        self._prefilter = re.compile(self._trie_regex(self._trie)) if self._trie else None
+
+    @classmethod
+    def _trie_regex(cls, node: Dict[str, Any]) -> str:
+        # A literal that ends here is enough to report the start position;
+        # the trie walk in ``_literals`` then finds every literal from it.
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + cls._trie_regex(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    def _literals(self, lowered: str) -> Iterable[str]:
+        found = set()
+        position = 0
+        while self._prefilter is not None:
+            match = self._prefilter.search(lowered, position)
+            if match is None:
+                break
+            start = match.start()
+            node = self._trie
+            for end in range(start, len(lowered)):
+                node = node.get(lowered[end])
+                if node is None:
+                    break
+                if "" in node:
+                    found.add(lowered[start:end + 1])
+            position = start + 1
+        return found
+
+    def _pattern(self, index: int) -> Pattern[str] | None:
+        compiled = self._compiled[index]
+        if compiled is None:
+            try:
+                compiled = re.compile(self.signatures[index].pattern, re.IGNORECASE)
+            except re.error:
+                compiled = False
+            self._compiled[index] = compiled
+        return compiled or None
+
+    def match(self, text: str) -> Iterator[Tuple[Signature, str]]:
+        """Yield (signature, version) for every signature matching ``text``."""
+
+        candidates = set(self._always)
+        for literal in self._literals(text.lower()):
+            candidates.update(self._by_literal[literal])
+        for index in sorted(candidates):
+            signature = self.signatures[index]
+            if not signature.pattern:
+                yield signature, ""
+                continue
+            pattern = self._pattern(index)
+            found = pattern.search(text) if pattern is not None else None
+            if found is not None:
+                yield signature, _version(signature.version, found)
+
+
+def _version(template: str, match: "re.Match[str]") -> str:
+    if not template:
+        return ""
+
+    def _group(ref: "re.Match[str]") -> str:
+        try:
+            return match.group(int(ref.group(1))) or ""
+        except (IndexError, ValueError):
+            return ""
+
+    return re.sub(r"\\(\d+)", _group, template).strip()
+
+
+def parse_html(body: str) -> Tuple[Dict[str, str], List[str], List[str]]:
+    """Return (meta name -> content, script srcs, icon hrefs) from a page prefix."""
+
+    meta: Dict[str, str] = {}
+    for tag in _META_RE.findall(body):
+        attrs = {name.lower(): a or b or c for name, a, b, c in _ATTR_RE.findall(tag)}
+        name = attrs.get("name") or attrs.get("property")
+        if name and "content" in attrs:
+            meta.setdefault(name.lower(), attrs["content"])
+    icons = []
+    for tag in _ICON_RE.findall(body):
+        attrs = {name.lower(): a or b or c for name, a, b, c in _ATTR_RE.findall(tag)}
+        if attrs.get("href"):
+            icons.append(attrs["href"])
+    return meta, _SCRIPT_SRC_RE.findall(body), icons
+
+
+def parse_set_cookie(value: str) -> Dict[str, str]:
+    """Cookie names and values from a (possibly comma-joined) Set-Cookie header."""
+
+    return {name: cookie for name, cookie in _COOKIE_RE.findall(value or "")}
+
+
+class FingerprintDB:
+    """Compiled Wappalyzer-style technology signatures.
+
+    Signatures cover headers, cookies, meta tags, HTML, script URLs, the
+    page URL and favicon hashes. Each keyed field (a header, cookie or meta
+    name) and each text field has its own ``_PatternSet``.
+    """
+
+    def __init__(
+        self,
+        technologies: Dict[str, Technology],
+        signatures: Dict[str, Dict[str, List[Signature]]],
+        favicons: Dict[int, List[str]],
+    ) -> None:
+        self.technologies = technologies
+        self.signatures = signatures
+        self.favicons = favicons
+        self._sets = {
+            field: {key: _PatternSet(items) for key, items in by_key.items()}
+            for field, by_key in signatures.items()
+        }
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickle the normalized signatures; the pattern sets are rebuilt on load.
+        return (FingerprintDB, (self.technologies, self.signatures, self.favicons))
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> "FingerprintDB":
+        """Normalize a ``technologies.json`` document (or a bare name -> tech map)."""
+
+        raw_techs = data.get("technologies", data)
+        category_names = {str(key): value.get("name", key) if isinstance(value, dict) else value
+                          for key, value in (data.get("categories") or {}).items()}
+        technologies: Dict[str, Technology] = {}
+        signatures: Dict[str, Dict[str, List[Signature]]] = {field: {} for field in _FIELDS}
+        favicons: Dict[int, List[str]] = {}
+
+        for name, spec in raw_techs.items():
+            if not isinstance(spec, dict):
+                continue
+            technologies[name] = Technology(
+                name=name,
+                categories=tuple(str(category_names.get(str(cat), cat)) for cat in _as_list(spec.get("cats"))),
+                implies=tuple(str(item).split("\\;")[0] for item in _as_list(spec.get("implies"))),
+            )
+            for field in ("headers", "cookies", "meta"):
+                for key, raw in (spec.get(field) or {}).items():
+                    bucket = signatures[field].setdefault(key.lower(), [])
+                    bucket.extend(_split_pattern(name, item) for item in _as_list(raw))
+            for field, aliases in (("html", ("html",)), ("scriptSrc", ("scriptSrc", "scripts")), ("url", ("url",))):
+                for alias in aliases:
+                    bucket = signatures[field].setdefault("", [])
+                    bucket.extend(_split_pattern(name, item) for item in _as_list(spec.get(alias)))
+            for value in _as_list(spec.get("favicon")):
+                favicons.setdefault(int(value), []).append(name)
+        return cls(technologies, signatures, favicons)
+
+    def _hit(self, hits: Dict[str, str], name: str, version: str) -> None:
+        if name not in hits or (version and not hits[name]):
+            hits[name] = version
+
+    def detect(
+        self,
+        headers: Mapping[str, str],
+        body: str | bytes = "",
+        url: str = "",
+        cookies: Mapping[str, str] | None = None,
+        favicon: int | None = None,
+    ) -> List[Detection]:
+        """Match a response against every signature; implied technologies are added."""
+
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        lowered = {key.lower(): value for key, value in headers.items()}
+        if cookies is None:
+            cookies = parse_set_cookie(lowered.get("set-cookie", ""))
+        meta, scripts, _ = parse_html(body) if body else ({}, [], [])
+        hits: Dict[str, str] = {}
+
+        for field, values in (
+            ("headers", lowered),
+            ("cookies", {key.lower(): value for key, value in cookies.items()}),
+            ("meta", meta),
+        ):
+            sets = self._sets.get(field, {})
+            for key, value in values.items():
+                if key in sets:
+                    for signature, version in sets[key].match(value):
+                        self._hit(hits, signature.tech, version)
+        for field, text in (("html", body), ("scriptSrc", "\n".join(scripts)), ("url", url)):
+            patterns = self._sets.get(field, {}).get("")
+            if patterns is not None and text:
+                for signature, version in patterns.match(text):
+                    self._hit(hits, signature.tech, version)
+        if favicon is not None:
+            for name in self.favicons.get(favicon, []):
+                self._hit(hits, name, "")
+
+        pending = list(hits)
+        while pending:
+            tech = self.technologies.get(pending.pop())
+            for implied in tech.implies if tech else ():
+                if implied not in hits:
+                    hits[implied] = ""
+                    pending.append(implied)
+
+        return [
+            Detection(name, version, self.technologies[name].categories if name in self.technologies else ())
+            for name, version in sorted(hits.items())
+        ]
+
+
+def _build_db(path: str) -> FingerprintDB:
+    with open(path, "r", encoding="utf-8") as handle:
+        return FingerprintDB.from_data(json.load(handle))
+
+
+def load_fingerprints(path: str | None = None) -> FingerprintDB:
+    """Return the compiled fingerprint database for ``path`` (default: bundled).
+
+    The database is cached like the site catalog (see ``load_compiled``).
+    """
+
+    path = os.path.abspath(path or DEFAULT_DB_PATH)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Fingerprint database not found: {path}")
+    return load_compiled(path, "fingerprints", _CACHE_VERSION, _build_db)
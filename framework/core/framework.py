@@ -6,15 +6,19 @@ All rights reserved.
 
 
 from __future__ import annotations
-import importlib
-import json
 import os
-import pkgutil
 import shlex
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
+from framework.core.journal import JOURNAL_SUFFIX, SessionJournal, read_session
+from framework.core.manifest import ModuleRegistry, load_manifest
+from framework.core.report import DEFAULT_PAGE_SIZE, write_html_report, write_json_report
+from framework.core.serialize import BINARY_SUFFIX, JSON_SUFFIX, Serializer, binary_available, get_serializer
 from framework.core.utils import ConfigManager, JSONStore, Output, Timer, setup_logger
+from framework.core.workflow import WORKFLOW_DIR, WorkflowRunner, load_workflow, resolve_workflow_path
 
 BANNER = r"""
 ██████╗ ██╗      █████╗  ██████╗██╗  ██╗██╗  ██╗ █████╗ ██╗   ██╗███████╗███╗   ██╗
@@ -49,7 +53,6 @@ class Framework:
     def __init__(self) -> None:
         self.base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         self.project_root = os.path.abspath(os.path.join(self.base_dir, ".."))
-        self.modules: Dict[str, Callable[..., Dict[str, Any]]] = {}
         self.last_results: Dict[str, Any] = {"runs": []}
         self.session_id = time.strftime("%Y%m%d-%H%M%S")
         self.config = ConfigManager(os.path.join(self.base_dir, "config.yaml"))
@@ -64,24 +67,42 @@ class Framework:
         os.makedirs(self.sessions_dir, exist_ok=True)
         os.makedirs(self.logs_dir, exist_ok=True)
 
+        # Workflow stages run modules from several threads at once.
+        self._results_lock = threading.Lock()
+        self._closed = False
+        # Set when runs were recorded since the results file was last written;
+        # compacting the journal (e.g. ``session save``) leaves it set.
+        self._output_stale = False
         self.log_path = os.path.join(self.logs_dir, "blackhaven.log")
         self.logger = setup_logger(self.log_path)
+        self.session_serializer = self._session_serializer()
+        self.journal = SessionJournal(
+            os.path.join(self.sessions_dir, f"session-{self.session_id}{self.session_serializer.suffix}"),
+            self.session_serializer,
+        )
+        self.modules = ModuleRegistry(self, "framework.modules", self.logger)
         self._load_modules()
 
-    def _load_modules(self) -> None:
-        """Discover and load modules from the modules package."""
+    def _session_serializer(self) -> Serializer:
+        """Serializer for session snapshots, from ``session_format`` and ``json_backend``."""
 
-        base_path = os.path.join(os.path.dirname(__file__), "..", "modules")
-        base_package = "framework.modules"
+        fmt = str(self.config.get("session_format", "compact"))
+        backend = str(self.config.get("json_backend", "auto"))
+        if fmt == "binary" and not binary_available():
+            self.logger.warning("session_format 'binary' needs msgpack; saving compact JSON sessions")
+            fmt = "compact"
+        try:
+            return get_serializer(fmt, backend)
+        except ValueError as exc:
+            self.logger.error("%s; saving compact JSON sessions", exc)
+            return get_serializer("compact", "json")
 
-        for _, module_name, _ in pkgutil.iter_modules([base_path]):
-            try:
-                module = importlib.import_module(f"{base_package}.{module_name}")
-                if hasattr(module, "register"):
-                    module.register(self)
-                    self.logger.info("Loaded module: %s", module_name)
-            except Exception as exc:
-                self.logger.error("Failed to load module %s: %s", module_name, exc)
+    def _load_modules(self) -> None:
+        """Discover modules from the cached manifest; each is imported on first use."""
+
+        base_path = os.path.join(self.base_dir, "modules")
+        for module_name in self.modules.add_specs(load_manifest(base_path)):
+            self.modules.import_module(module_name)
 
     def register_module(self, name: str, handler: Callable[..., Dict[str, Any]]) -> None:
         """Register a module handler callable."""
@@ -115,28 +136,113 @@ class Framework:
 
             self._dispatch(command)
 
+        self.close()
         Output.info("Session ended.")
 
+    def close(self) -> None:
+        """Compact the session journal and write the session's results file.
+
+        Safe to call more than once; only runs recorded since the last
+        compaction or results write cause any I/O.
+        """
+
+        with self._results_lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self.journal.pending:
+                self._auto_save_session()
+            if self._output_stale:
+                self._auto_save_output()
+            self.journal.close()
+
     def run_module(self, module_name: str, target: str) -> None:
         """Public wrapper to execute a module."""
 
         self._run_module(module_name, target)
 
+    def run_targets(self, module_name: str, targets: List[str], parallel: int = 1) -> Dict[str, Any]:
+        """Run one module over many targets in this process, ``parallel`` at a time.
+
+        Every run lands in the current session; progress is reported as
+        targets finish rather than per target.
+        """
+
+        total = len(targets)
+        parallel = max(1, min(parallel, total or 1))
+        Output.info(f"Running {module_name} on {total} targets ({parallel} in parallel)...")
+        self.logger.info("Running %s on %d targets, parallel=%d", module_name, total, parallel)
+        started = time.perf_counter()
+        done = failed = 0
+
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix=f"batch-{module_name}") as executor:
+            futures = [executor.submit(self._run_module, module_name, target) for target in targets]
+            for future in as_completed(futures):
+                result = future.result()
+                done += 1
+                if result is None or not result.success:
+                    failed += 1
+                Output.info(f"Progress: {done}/{total} targets done, {failed} failed")
+
+        elapsed = round(time.perf_counter() - started, 4)
+        Output.success(f"{module_name}: {total - failed}/{total} targets succeeded in {elapsed}s")
+        return {"module": module_name, "targets": total, "failed": failed, "elapsed_seconds": elapsed}
+
+    def list_workflows(self) -> List[str]:
+        """List workflow files shipped next to config.yaml."""
+
+        directory = os.path.join(self.base_dir, WORKFLOW_DIR)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            os.path.splitext(name)[0] for name in os.listdir(directory) if name.endswith((".yaml", ".yml"))
+        )
+
+    def run_workflow(self, name: str, target: str) -> Dict[str, Any]:
+        """Run a YAML workflow (a file path or a name in ``workflows/``) on a target."""
+
+        workflow = load_workflow(resolve_workflow_path(name, self.base_dir))
+        missing = sorted({stage.module for stage in workflow.stages if stage.module} - set(self.modules))
+        if missing:
+            raise ValueError(f"Workflow uses unknown modules: {', '.join(missing)}")
+
+        Output.info(f"Running workflow {workflow.name} on {target}...")
+        self.logger.info("Running workflow %s on %s", workflow.name, target)
+        summary = WorkflowRunner(workflow, self._execute_stage, self.config).run(target)
+        for stage_name, counts in summary["stages"].items():
+            Output.info(
+                f"{stage_name}: {counts['processed']} processed, {counts['emitted']} emitted, "
+                f"{counts['failed']} failed"
+            )
+        Output.success(f"Workflow {workflow.name} completed in {summary['elapsed_seconds']}s")
+        return summary
+
+    def _execute_stage(self, module_name: str, target: str, config: Any) -> Tuple[bool, Dict[str, Any]]:
+        result = self._run_module(module_name, target, config)
+        if result is None:
+            return False, {}
+        return result.success, result.data
+
     def save_session(self, name: str) -> str:
         """Save current session with a custom name."""
 
-        filename = f"{name}.json"
+        filename = f"{name}{self.session_serializer.suffix}"
         path = os.path.join(self.sessions_dir, filename)
-        JSONStore.write(path, self.last_results)
+        JSONStore.write(path, self.last_results, self.session_serializer)
         return path
 
     def load_session(self, name: str) -> str:
-        """Load a session by filename or base name."""
-
-        filename = name if name.endswith(".json") else f"{name}.json"
-        path = os.path.join(self.sessions_dir, filename)
-        with open(path, "r", encoding="utf-8") as handle:
-            self.last_results = json.load(handle)
+        """Load a session by filename or base name; JSON or binary is detected."""
+
+        path = os.path.join(self.sessions_dir, name)
+        if not name.endswith((JSON_SUFFIX, BINARY_SUFFIX, JOURNAL_SUFFIX)):
+            path = next(
+                (path + suffix for suffix in (JSON_SUFFIX, BINARY_SUFFIX) if os.path.exists(path + suffix)),
+                path + JSON_SUFFIX,
+            )
+        data = read_session(path)
+        with self._results_lock:
+            self.last_results = data
         return path
 
     def list_sessions(self) -> List[str]:
@@ -147,55 +253,23 @@ class Framework:
     def save_report_json(self, path: str) -> str:
         """Save current results to a JSON report."""
 
-        payload = dict(self.last_results)
-        payload["disclaimer"] = REPORT_DISCLAIMER
-        JSONStore.write(path, payload)
-        return path
+        return write_json_report(path, self.last_results, REPORT_DISCLAIMER)
 
     def save_report_html(self, path: str | None = None) -> str:
-        """Save current results to an HTML report."""
+        """Save current results to an HTML report, paginated for large sessions."""
 
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
         if path is None:
-            timestamp = time.strftime("%Y%m%d-%H%M%S")
             filename = f"blackhaven-report-{timestamp}.html"
             path = os.path.join(self.output_dir, filename)
 
-        timestamp = time.strftime("%Y%m%d-%H%M%S")
-        html = [
-            "<html>",
-            "<head>",
-            "<meta charset='utf-8'/>",
-            "<title>BlackHaven Report</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; margin: 20px; background: #0b0f16; color: #e6e6e6; }",
-            "h1, h2 { color: #5cc8ff; }",
-            "pre { background: #111827; padding: 12px; border-radius: 6px; overflow-x: auto; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            "<h1>BlackHaven Framework Report</h1>",
-            f"<p>Generated: {timestamp}</p>",
-        ]
-
-        for run in self.last_results.get("runs", []):
-            html.append(f"<h2>{run['module']} - {run['target']}</h2>")
-            html.append(f"<p>Status: {'Success' if run['success'] else 'Failed'}</p>")
-            html.append(f"<p>Elapsed: {run['elapsed_seconds']}s</p>")
-            html.append("<pre>")
-            html.append(json.dumps(run["data"], indent=2, sort_keys=True))
-            html.append("</pre>")
-
-        html.append("<hr/>")
-        html.append(
-            "<p>This report was generated by BlackHaven Framework.<br/>"
-            "Authorized use only.<br/>"
-            "Copyright (c) 2026 erraf132.</p>"
+        write_html_report(
+            path,
+            self.last_results.get("runs", []),
+            timestamp,
+            REPORT_DISCLAIMER,
+            int(self.config.get("report_page_size", DEFAULT_PAGE_SIZE)),
         )
-        html.extend(["</body>", "</html>"])
-
-        with open(path, "w", encoding="utf-8") as handle:
-            handle.write("\n".join(html))
-
         return path
 
     def _print_help(self) -> None:
@@ -210,6 +284,8 @@ class Framework:
             "osint username <handle>",
             "modules list",
             "modules run <module> <target>",
+            "workflow list",
+            "workflow run <file> <target>",
             "config show",
             "session save",
             "session load <filename>",
@@ -242,6 +318,10 @@ class Framework:
             self._handle_modules(parts)
             return
 
+        if parts[0] == "workflow" and len(parts) >= 2:
+            self._handle_workflow(parts)
+            return
+
         if parts[0] == "config" and len(parts) == 2 and parts[1] == "show":
             self._show_config()
             return
@@ -281,6 +361,24 @@ class Framework:
 
         Output.warning("Usage: modules list | modules run <module> <target>")
 
+    def _handle_workflow(self, parts: List[str]) -> None:
+        """List workflows or run one against a target."""
+
+        if parts[1] == "list":
+            Output.info("Available workflows:")
+            for name in self.list_workflows():
+                print(f"  - {name}")
+            return
+
+        if parts[1] == "run" and len(parts) >= 4:
+            try:
+                self.run_workflow(parts[2], parts[3])
+            except (OSError, ValueError) as exc:
+                Output.error(f"Workflow failed: {exc}")
+            return
+
+        Output.warning("Usage: workflow list | workflow run <file> <target>")
+
     def _handle_scan(self, parts: List[str]) -> None:
         """Handle scan commands."""
 
@@ -308,19 +406,19 @@ class Framework:
         target = parts[2]
         self._run_module("osint_lookup", target)
 
-    def _run_module(self, module_name: str, target: str) -> None:
+    def _run_module(self, module_name: str, target: str, config: Any = None) -> ModuleResult | None:
         """Execute a module handler with timing and logging."""
 
         handler = self.modules.get(module_name)
         if not handler:
             Output.error(f"Module not found: {module_name}")
-            return
+            return None
 
         Output.info(f"Running {module_name} on {target}...")
         self.logger.info("Running %s on %s", module_name, target)
         with Timer() as timer:
             try:
-                data = handler(target, self.config)
+                data = handler(target, config if config is not None else self.config)
                 success = True
             except Exception as exc:
                 self.logger.exception("Module %s failed: %s", module_name, exc)
@@ -336,10 +434,13 @@ class Framework:
             elapsed=timer.elapsed,
         )
         self.logger.info("Completed %s in %.4fs", module_name, result.elapsed)
-        self._record_result(result)
-        self._auto_save_session()
+        with self._results_lock:
+            record = self._record_result(result)
+            self._journal_run(record)
+            self._output_stale = True
+        return result
 
-    def _record_result(self, result: ModuleResult) -> None:
+    def _record_result(self, result: ModuleResult) -> Dict[str, Any]:
         """Persist result to in-memory session store."""
 
         record = {
@@ -354,14 +455,13 @@ class Framework:
         self.last_results["runs"].append(record)
         status = "completed" if result.success else "failed"
         Output.success(f"{result.name} {status} in {record['elapsed_seconds']}s")
+        return record
 
     def _save_results(self, path: str) -> None:
         """Save results to a JSON file."""
 
         try:
-            payload = dict(self.last_results)
-            payload["disclaimer"] = REPORT_DISCLAIMER
-            JSONStore.write(path, payload)
+            write_json_report(path, self.last_results, REPORT_DISCLAIMER)
             Output.success(f"Results saved to {path}")
         except Exception as exc:
             Output.error(f"Failed to save results: {exc}")
@@ -391,27 +491,30 @@ class Framework:
 
         record["risk_score"] = {"score": score, "level": risk}
 
+    def _journal_run(self, record: Dict[str, Any]) -> None:
+        """Append one run to the session journal instead of rewriting the session."""
+
+        try:
+            self.journal.append(record)
+        except Exception as exc:
+            self.logger.error("Failed to journal run: %s", exc)
+
     def _auto_save_session(self) -> None:
-        """Persist the current session data with a timestamped filename."""
+        """Compact the journal into an atomic ``session-<id>`` snapshot."""
 
-        filename = f"session-{self.session_id}.json"
-        path = os.path.join(self.sessions_dir, filename)
         try:
-            JSONStore.write(path, self.last_results)
-            self._auto_save_output()
+            self.journal.compact(self.last_results)
         except Exception as exc:
             self.logger.error("Failed to auto-save session: %s", exc)
 
     def _auto_save_output(self) -> None:
-        """Persist a timestamped JSON report to the output directory."""
+        """Persist the session's JSON report to the output directory."""
 
-        timestamp = time.strftime("%Y%m%d-%H%M%S")
-        filename = f"blackhaven-results-{timestamp}.json"
+        filename = f"blackhaven-results-{self.session_id}.json"
         path = os.path.join(self.output_dir, filename)
         try:
-            payload = dict(self.last_results)
-            payload["disclaimer"] = REPORT_DISCLAIMER
-            JSONStore.write(path, payload)
+            write_json_report(path, self.last_results, REPORT_DISCLAIMER)
+            self._output_stale = False
         except Exception as exc:
             self.logger.error("Failed to auto-save output: %s", exc)
 
@@ -419,7 +522,8 @@ class Framework:
         """Handle session management commands."""
 
         if parts[1] == "save":
-            self._auto_save_session()
+            with self._results_lock:
+                self._auto_save_session()
             Output.success("Session saved.")
             return
 
@@ -434,8 +538,9 @@ class Framework:
             filename = parts[2]
             path = os.path.join(self.sessions_dir, filename)
             try:
-                with open(path, "r", encoding="utf-8") as handle:
-                    self.last_results = json.load(handle)
+                data = read_session(path)
+                with self._results_lock:
+                    self.last_results = data
                 Output.success(f"Session loaded from {filename}")
             except Exception as exc:
                 Output.error(f"Failed to load session: {exc}")
@@ -453,45 +558,8 @@ class Framework:
     def _export_html_report(self) -> None:
         """Export the latest results to an HTML report."""
 
-        timestamp = time.strftime("%Y%m%d-%H%M%S")
-        filename = f"blackhaven-report-{timestamp}.html"
-        path = os.path.join(self.output_dir, filename)
-
-        html = [
-            "<html>",
-            "<head>",
-            "<meta charset='utf-8'/>",
-            "<title>BlackHaven Report</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; margin: 20px; background: #0b0f16; color: #e6e6e6; }",
-            "h1, h2 { color: #5cc8ff; }",
-            "pre { background: #111827; padding: 12px; border-radius: 6px; overflow-x: auto; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            "<h1>BlackHaven Framework Report</h1>",
-            f"<p>Generated: {timestamp}</p>",
-        ]
-
-        for run in self.last_results.get("runs", []):
-            html.append(f"<h2>{run['module']} - {run['target']}</h2>")
-            html.append(f"<p>Status: {'Success' if run['success'] else 'Failed'}</p>")
-            html.append(f"<p>Elapsed: {run['elapsed_seconds']}s</p>")
-            html.append("<pre>")
-            html.append(json.dumps(run["data"], indent=2, sort_keys=True))
-            html.append("</pre>")
-
-        html.append("<hr/>")
-        html.append(
-            "<p>This report was generated by BlackHaven Framework.<br/>"
-            "Authorized use only.<br/>"
-            "Copyright (c) 2026 erraf132.</p>"
-        )
-        html.extend(["</body>", "</html>"])
-
         try:
-            with open(path, "w", encoding="utf-8") as handle:
-                handle.write("\n".join(html))
+            path = self.save_report_html()
             Output.success(f"HTML report saved to {path}")
         except Exception as exc:
-            Output.error(f"Failed to export HTML report: {exc}")
\ No newline at end of file
+            Output.error(f"Failed to export HTML report: {exc}")
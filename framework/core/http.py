@@ -0,0 +1,270 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from framework.core.concurrency import (
+    RESET,
+    THROTTLE_STATUSES,
+    THROTTLED,
+    TIMEOUT,
+    AdaptiveGate,
+    AIMDController,
+    is_connection_reset,
+)
+from framework.core.retry import RetryPolicy
+
+DEFAULT_USER_AGENT = "BlackHavenFramework/1.0"
+DEFAULT_TIMEOUT = 6.0
+# Number of distinct host pools kept alive at once.
+DEFAULT_POOL_HOSTS = 128
+# Keep-alive connections retained per host.
+DEFAULT_POOL_SIZE = 32
+# Threads available for hedged duplicate requests.
+DEFAULT_HEDGE_WORKERS = 32
+
+
+def _close_response(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+class HTTPClient:
+    """Keep-alive HTTP client shared by every HTTP-using module.
+
+    A single ``requests.Session`` backed by pooled adapters means repeated
+    probes against the same host reuse an open TCP/TLS connection instead
+    of paying for a fresh handshake on every request. An optional AIMD
+    ``controller`` gates how many requests may be in flight at once, so
+    thread-pooled modules back off when a target starts throttling, and a
+    ``retry`` policy adds retries with backoff and optional hedging.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        controller: AIMDController | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.controller = controller
+        self._gate = AdaptiveGate(lambda: controller.limit) if controller else None
+        self.retry = retry
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        timeout: float | None = None,
+        hedge_after: float | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request through the pooled session.
+
+        With a retry policy, idempotent requests are retried on transient
+        errors and retryable statuses, and may be hedged: ``hedge_after``
+        overrides the policy's rolling p95 as the hedge delay.
+        """
+
+        method = method.upper()
+        policy = self.retry
+
+        def _once() -> requests.Response:
+            return self._send(method, url, headers, timeout, kwargs)
+
+        if policy is None:
+            return _once()
+
+        attempt = 0
+        while True:
+            try:
+                response = self._hedged(_once, policy.hedge_delay(method, hedge_after))
+            except requests.RequestException as exc:
+                if not policy.retry_error(method, attempt, exc, isinstance(exc, requests.Timeout)):
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                if not policy.retry_status(method, attempt, response.status_code):
+                    return response
+                delay = policy.delay(attempt, response.headers.get("Retry-After"))
+                if delay is None:
+                    return response
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    def _hedged(
+        self,
+        send: Callable[[], requests.Response],
+        delay: float | None,
+    ) -> requests.Response:
+        """Run ``send``; if it is still pending after ``delay``, race a duplicate."""
+
+        if delay is None:
+            return send()
+
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=DEFAULT_HEDGE_WORKERS, thread_name_prefix="http-hedge"
+                )
+            pool = self._hedge_pool
+
+        pending = {pool.submit(send)}
+        done, pending = wait(pending, timeout=delay)
+        if not done:
+            pending.add(pool.submit(send))
+        error: BaseException | None = None
+        while True:
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.add_done_callback(_close_response)
+                    return future.result()
+                error = future.exception()
+            if not pending:
+                raise error
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None,
+        timeout: float | None,
+        kwargs: Dict[str, Any],
+    ) -> requests.Response:
+        if self._gate is None:
+            started = time.monotonic()
+            response = self.session.request(
+                method,
+                url,
+                headers=headers,
+                timeout=timeout if timeout is not None else self.timeout,
+                **kwargs,
+            )
+            if self.retry is not None:
+                self.retry.observe(time.monotonic() - started)
+            return response
+
+        self._gate.acquire()
+        started = time.monotonic()
+        try:
+            response = self.session.request(
+                method,
+                url,
+                headers=headers,
+                timeout=timeout if timeout is not None else self.timeout,
+                **kwargs,
+            )
+        except requests.Timeout:
+            self.controller.record_failure(TIMEOUT)
+            raise
+        except requests.RequestException as exc:
+            if is_connection_reset(exc):
+                self.controller.record_failure(RESET)
+            raise
+        finally:
+            self._gate.release()
+
+        latency = time.monotonic() - started
+        if self.retry is not None:
+            self.retry.observe(latency)
+        if response.status_code in THROTTLE_STATUSES:
+            self.controller.record_failure(THROTTLED)
+        else:
+            self.controller.record_success(latency)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._hedge_pool = self._hedge_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        self.session.close()
+
+
+_clients: Dict[Tuple[Any, ...], HTTPClient] = {}
+_client_lock = threading.Lock()
+
+
+def _client_settings(settings: Any) -> Tuple[Any, ...]:
+    return (
+        settings.get("user_agent", DEFAULT_USER_AGENT),
+        float(settings.get("timeout", DEFAULT_TIMEOUT)),
+        int(settings.get("http_pool_size", DEFAULT_POOL_SIZE)),
+        bool(settings.get("adaptive_concurrency", True)),
+        int(settings.get("thread_count", 64)),
+        int(settings.get("http_retries", 1)),
+        float(settings.get("http_retry_backoff", 0.25)),
+        bool(settings.get("http_hedge", False)),
+    )
+
+
+def get_client(config=None) -> HTTPClient:
+    """Return the shared client for these settings, creating it on first use.
+
+    Clients are keyed on the settings they are built from, so a workflow
+    stage or ``--threads`` override gets its own pool instead of silently
+    reusing whichever configuration asked first.
+    """
+
+    settings = config if config is not None else {}
+    key = _client_settings(settings)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _client_lock:
+        client = _clients.get(key)
+        if client is None:
+            user_agent, timeout, pool_size, adaptive, thread_count = key[:5]
+            client = HTTPClient(
+                user_agent=user_agent,
+                timeout=timeout,
+                pool_size=pool_size,
+                controller=AIMDController(maximum=thread_count) if adaptive else None,
+                retry=RetryPolicy.from_config(settings),
+            )
+            _clients[key] = client
+    return client
+
+
+def close_client() -> None:
+    """Close pooled connections held by the shared clients."""
+
+    with _client_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,137 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import os
+import threading
+from typing import IO, Any, Dict, List
+from framework.core.serialize import (
+    BINARY_SUFFIX,
+    JSON_SUFFIX,
+    PRETTY,
+    Serializer,
+    get_serializer,
+    loads_auto,
+)
+from framework.core.utils import JSONStore
+
+JOURNAL_SUFFIX = ".jsonl"
+# Snapshot key recording the last journal record already folded into it.
+SEQ_KEY = "journal_seq"
+# Journal lines are always compact JSON (orjson when installed).
+_LINE_SERIALIZER = get_serializer("compact")
+
+
+def journal_path_for(snapshot_path: str) -> str:
+    """Return the journal that sits next to a ``.json``/``.bhs`` session snapshot."""
+
+    return os.path.splitext(snapshot_path)[0] + JOURNAL_SUFFIX
+
+
+def _read_journal(path: str, after_seq: int) -> List[Dict[str, Any]]:
+    """Return run records newer than ``after_seq``; a torn last line is ignored."""
+
+    runs: List[Dict[str, Any]] = []
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return runs
+    with handle:
+        for line in handle:
+            try:
+                entry = loads_auto(line)
+            except ValueError:
+                break
+            if entry.get("seq", 0) > after_seq:
+                runs.append(entry["run"])
+    return runs
+
+
+def read_session(path: str) -> Dict[str, Any]:
+    """Load a session from its snapshot plus any runs still in its journal.
+
+    ``path`` may name either file. Runs journaled after the last compaction
+    (for example when the process was killed) are appended to the snapshot's
+    runs. The snapshot's format (JSON or binary) is detected from its
+    content. Raises FileNotFoundError when neither file exists.
+    """
+
+    if path.endswith(JOURNAL_SUFFIX):
+        stem = os.path.splitext(path)[0]
+        path = next(
+            (stem + suffix for suffix in (JSON_SUFFIX, BINARY_SUFFIX) if os.path.exists(stem + suffix)),
+            stem + JSON_SUFFIX,
+        )
+    journal_path = journal_path_for(path)
+    if not os.path.exists(path) and not os.path.exists(journal_path):
+        raise FileNotFoundError(f"Session not found: {path}")
+
+    data: Dict[str, Any] = {"runs": []}
+    if os.path.exists(path):
+        data = JSONStore.read(path)
+    seq = int(data.pop(SEQ_KEY, 0))
+    data.setdefault("runs", []).extend(_read_journal(journal_path, seq))
+    return data
+
+
+class SessionJournal:
+    """Append-only log of a session's runs with snapshot compaction.
+
+    Every run is appended as one JSON line to ``<name>.jsonl`` instead of
+    re-serializing the whole session after each module. ``compact`` writes
+    the full session atomically to the snapshot with ``serializer`` and
+    truncates the journal; each snapshot records the sequence number it
+    covers so a crash between the two steps never replays a run twice.
+    """
+
+    def __init__(self, snapshot_path: str, serializer: Serializer = PRETTY) -> None:
+        self.snapshot_path = snapshot_path
+        self.serializer = serializer
+        self.path = journal_path_for(snapshot_path)
+        self._seq = 0
+        self._pending = 0
+        self._handle: IO[bytes] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of runs journaled since the last compaction."""
+
+        return self._pending
+
+    def append(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            line = _LINE_SERIALIZER.dumps({"seq": self._seq + 1, "run": record})
+            if self._handle is None:
+                self._handle = open(self.path, "ab")
+            self._handle.write(line + b"\n")
+            self._handle.flush()
+            self._seq += 1
+            self._pending += 1
+
+    def compact(self, data: Dict[str, Any]) -> None:
+        """Write ``data`` as the session snapshot and empty the journal."""
+
+        with self._lock:
+            payload = dict(data)
+            payload[SEQ_KEY] = self._seq
+            JSONStore.write(self.snapshot_path, payload, self.serializer)
+            self._close_handle()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
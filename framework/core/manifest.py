@@ -0,0 +1,210 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import ast
+import importlib
+import logging
+import os
+import threading
+from collections.abc import MutableMapping
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List
+from framework.core.state import read_json, state_path, write_json_atomic
+
+# Bump whenever ModuleSpec changes shape so stale manifests are rebuilt.
+_MANIFEST_VERSION = 1
+MANIFEST_FILE = "module-manifest.json"
+
+Handler = Callable[..., Dict[str, Any]]
+
+
+@dataclass
+class ModuleSpec:
+    """What a module registers, read from its source without importing it."""
+
+    name: str
+    module: str
+    entry_point: str = "run"
+    description: str = ""
+    imports: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _FileInfo:
+    mtime_ns: int
+    size: int
+    specs: List[ModuleSpec]
+    # register() exists but its names could not be read statically.
+    dynamic: bool = False
+
+
+def _docstring_summary(node: Any) -> str:
+    doc = ast.get_docstring(node) or ""
+    return doc.strip().split("\n\n", 1)[0].replace("\n", " ")
+
+
+def scan_module_source(source: str, module: str) -> _FileInfo:
+    """Find ``register_module("name", func)`` calls in a module's ``register``."""
+
+    tree = ast.parse(source)
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    imports: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level and node.module != "__future__":
+            imports.append(node.module)
+    imports = list(dict.fromkeys(imports))
+
+    register = functions.get("register")
+    if register is None:
+        return _FileInfo(0, 0, [])
+    specs: List[ModuleSpec] = []
+    dynamic = False
+    for node in ast.walk(register):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        if node.func.attr != "register_module":
+            continue
+        args = node.args
+        if len(args) < 2 or not isinstance(args[0], ast.Constant) or not isinstance(args[0].value, str):
+            dynamic = True
+            continue
+        entry_point = args[1].id if isinstance(args[1], ast.Name) else ""
+        description = _docstring_summary(functions[entry_point]) if entry_point in functions else ""
+        specs.append(ModuleSpec(args[0].value, module, entry_point, description, imports))
+    return _FileInfo(0, 0, specs, dynamic or not specs)
+
+
+def load_manifest(modules_dir: str, path: str | None = None) -> Dict[str, _FileInfo]:
+    """Return the manifest of ``modules_dir``, re-scanning only files whose mtime/size changed."""
+
+    path = path or state_path(MANIFEST_FILE)
+    cached = read_json(path)
+    entries: Dict[str, Any] = {}
+    if isinstance(cached, dict) and cached.get("version") == _MANIFEST_VERSION:
+        if cached.get("directory") == os.path.abspath(modules_dir):
+            entries = cached.get("files") or {}
+
+    manifest: Dict[str, _FileInfo] = {}
+    changed = False
+    for filename in sorted(os.listdir(modules_dir)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        module = filename[:-3]
+        file_path = os.path.join(modules_dir, filename)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        entry = entries.get(filename)
+        if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            manifest[module] = _FileInfo(
+                stat.st_mtime_ns,
+                stat.st_size,
+                [ModuleSpec(**spec) for spec in entry.get("specs", [])],
+                bool(entry.get("dynamic")),
+            )
+            continue
+        try:
+            with open(file_path, "r", encoding="utf-8") as handle:
+                info = scan_module_source(handle.read(), module)
+        except (OSError, SyntaxError, ValueError):
+            info = _FileInfo(0, 0, [], True)
+        info.mtime_ns, info.size = stat.st_mtime_ns, stat.st_size
+        manifest[module] = info
+        changed = True
+
+    if changed or len(manifest) != len(entries):
+        write_json_atomic(
+            path,
+            {
+                "version": _MANIFEST_VERSION,
+                "directory": os.path.abspath(modules_dir),
+                "files": {
+                    f"{module}.py": {
+                        "mtime_ns": info.mtime_ns,
+                        "size": info.size,
+                        "specs": [asdict(spec) for spec in info.specs],
+                        "dynamic": info.dynamic,
+                    }
+                    for module, info in manifest.items()
+                },
+            },
+        )
+    return manifest
+
+
+class ModuleRegistry(MutableMapping):
+    """Module name -> handler mapping that imports a module on first lookup.
+
+    Names come from the manifest, so listing modules or checking ``name in
+    registry`` never imports anything. The first ``registry[name]`` imports
+    the module and calls its ``register(framework)``, which fills in the
+    real handler. Modules whose names cannot be read statically are
+    reported by ``add_specs`` so the caller can import them up front.
+    """
+
+    def __init__(self, framework: Any, package: str, logger: logging.Logger) -> None:
+        self.framework = framework
+        self.package = package
+        self.logger = logger
+        self.specs: Dict[str, ModuleSpec] = {}
+        self._handlers: Dict[str, Handler] = {}
+        self._imported: set = set()
+        self._lock = threading.RLock()
+
+    def add_specs(self, manifest: Dict[str, _FileInfo]) -> List[str]:
+        """Record manifest entries; returns the modules that must be imported eagerly."""
+
+        dynamic = []
+        for module, info in manifest.items():
+            for spec in info.specs:
+                self.specs[spec.name] = spec
+            if info.dynamic:
+                dynamic.append(module)
+        return dynamic
+
+    def import_module(self, module: str) -> None:
+        with self._lock:
+            if module in self._imported:
+                return
+            self._imported.add(module)
+            try:
+                loaded = importlib.import_module(f"{self.package}.{module}")
+                if hasattr(loaded, "register"):
+                    loaded.register(self.framework)
+                    self.logger.info("Loaded module: %s", module)
+            except Exception as exc:
+                self.logger.error("Failed to load module %s: %s", module, exc)
+
+    def __getitem__(self, name: str) -> Handler:
+        handler = self._handlers.get(name)
+        if handler is None and name in self.specs:
+            self.import_module(self.specs[name].module)
+            handler = self._handlers.get(name)
+        if handler is None:
+            raise KeyError(name)
+        return handler
+
+    def __setitem__(self, name: str, handler: Handler) -> None:
+        self._handlers[name] = handler
+
+    def __delitem__(self, name: str) -> None:
+        if self.specs.pop(name, None) is None and self._handlers.pop(name, None) is None:
+            raise KeyError(name)
+        self._handlers.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._handlers or name in self.specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(dict.fromkeys([*self.specs, *self._handlers])))
+
+    def __len__(self) -> int:
+        return len(set(self.specs) | set(self._handlers))
@@ -0,0 +1,212 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import html
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Sequence
+
+# Runs per HTML page; the first page also carries the summary index.
+DEFAULT_PAGE_SIZE = 500
+
+_STYLE = (
+    "body { font-family: Arial, sans-serif; margin: 20px; background: #0b0f16; color: #e6e6e6; }\n"
+    "h1, h2 { color: #5cc8ff; }\n"
+    "a { color: #5cc8ff; }\n"
+    "pre { background: #111827; padding: 12px; border-radius: 6px; overflow-x: auto; }\n"
+    "table { border-collapse: collapse; margin-bottom: 16px; }\n"
+    "th, td { border: 1px solid #1f2937; padding: 4px 10px; text-align: left; }\n"
+    "details { margin: 4px 0; }\n"
+    "summary { cursor: pointer; }\n"
+    ".failed { color: #f87171; }\n"
+)
+
+
+@contextmanager
+def _atomic_open(path: str) -> Iterator[IO[str]]:
+    """Open a uniquely named temp file next to ``path`` and rename it into place on success."""
+
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path))
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            yield handle
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _indented(value: Any, prefix: str) -> str:
+    text = json.dumps(value, indent=2, sort_keys=True)
+    return text.replace("\n", "\n" + prefix)
+
+
+def write_json_report(path: str, results: Dict[str, Any], disclaimer: str) -> str:
+    """Write ``results`` plus a disclaimer as indented JSON, one run at a time.
+
+    The output is byte-for-byte what ``json.dump(indent=2, sort_keys=True)``
+    produces, but runs are serialized and written individually instead of
+    copying and encoding the whole session in memory.
+    """
+
+    payload = {key: value for key, value in results.items() if key != "runs"}
+    payload["disclaimer"] = disclaimer
+    payload["runs"] = None
+    runs: Sequence[Any] = results.get("runs", [])
+
+    with _atomic_open(path) as handle:
+        handle.write("{")
+        for index, key in enumerate(sorted(payload)):
+            handle.write("," if index else "")
+            handle.write(f"\n  {json.dumps(key)}: ")
+            if key != "runs":
+                handle.write(_indented(payload[key], "  "))
+                continue
+            if not runs:
+                handle.write("[]")
+                continue
+            handle.write("[")
+            for run_index, run in enumerate(runs):
+                handle.write(",\n    " if run_index else "\n    ")
+                handle.write(_indented(run, "    "))
+            handle.write("\n  ]")
+        handle.write("\n}")
+    return path
+
+
+def page_path(path: str, page: int) -> str:
+    """Return the file of HTML page ``page`` (1-based); page 1 is ``path`` itself."""
+
+    if page == 1:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}-page-{page}{ext or '.html'}"
+
+
+def _summarize(runs: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    summary: Dict[str, Dict[str, int]] = {}
+    for run in runs:
+        counts = summary.setdefault(
+            run.get("module", "?"),
+            {"runs": 0, "success": 0, "failed": 0, "High": 0, "Medium": 0, "Low": 0},
+        )
+        counts["runs"] += 1
+        counts["success" if run.get("success") else "failed"] += 1
+        level = (run.get("risk_score") or {}).get("level")
+        if level in counts:
+            counts[level] += 1
+    return summary
+
+
+def _href(path: str, page: int) -> str:
+    return html.escape(os.path.basename(page_path(path, page)))
+
+
+def _write_head(handle: IO[str], title: str) -> None:
+    handle.write(
+        "<html>\n<head>\n<meta charset='utf-8'/>\n"
+        f"<title>{html.escape(title)}</title>\n<style>\n{_STYLE}</style>\n</head>\n<body>\n"
+    )
+
+
+def _write_nav(handle: IO[str], path: str, page: int, pages: int) -> None:
+    if pages == 1:
+        return
+    links = []
+    if page > 1:
+        links.append(f"<a href='{_href(path, page - 1)}'>Previous</a>")
+    links.append(f"<a href='{_href(path, 1)}'>Index</a>")
+    if page < pages:
+        links.append(f"<a href='{_href(path, page + 1)}'>Next</a>")
+    handle.write(f"<p>Page {page} of {pages} | {' | '.join(links)}</p>\n")
+
+
+def _write_index(
+    handle: IO[str], path: str, runs: Sequence[Dict[str, Any]], page_size: int, pages: int
+) -> None:
+    summary = _summarize(runs)
+    handle.write(f"<h2>Summary</h2>\n<p>{len(runs)} runs across {len(summary)} modules.</p>\n")
+    handle.write(
+        "<table>\n<tr><th>Module</th><th>Runs</th><th>Success</th><th>Failed</th>"
+        "<th>High</th><th>Medium</th><th>Low</th></tr>\n"
+    )
+    for module in sorted(summary):
+        counts = summary[module]
+        cells = "".join(
+            f"<td>{counts[key]}</td>" for key in ("runs", "success", "failed", "High", "Medium", "Low")
+        )
+        handle.write(f"<tr><td>{html.escape(str(module))}</td>{cells}</tr>\n")
+    handle.write("</table>\n")
+    if pages > 1:
+        handle.write("<p>Pages: ")
+        handle.write(
+            " ".join(
+                f"<a href='{_href(path, page)}'>"
+                f"{(page - 1) * page_size + 1}-{min(page * page_size, len(runs))}</a>"
+                for page in range(1, pages + 1)
+            )
+        )
+        handle.write("</p>\n")
+
+
+def _write_run(handle: IO[str], number: int, run: Dict[str, Any]) -> None:
+    status = "Success" if run.get("success") else "Failed"
+    risk = (run.get("risk_score") or {}).get("level")
+    label = f"{run.get('module')} - {run.get('target')}"
+    css = "" if run.get("success") else " class='failed'"
+    handle.write(
+        f"<details id='run-{number}'><summary{css}>#{number} {html.escape(label)} "
+        f"[{status}] {run.get('elapsed_seconds')}s{f' - risk {risk}' if risk else ''}</summary>\n<pre>"
+    )
+    handle.write(html.escape(json.dumps(run.get("data"), indent=2, sort_keys=True)))
+    handle.write("</pre>\n</details>\n")
+
+
+def write_html_report(
+    path: str,
+    runs: Sequence[Dict[str, Any]],
+    generated: str,
+    footer: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> List[str]:
+    """Stream an HTML report with a summary index and collapsible, paginated runs.
+
+    The first file (``path``) holds the per-module summary and the first
+    ``page_size`` runs; further runs go to ``<name>-page-N.html`` files
+    linked from the index. Each run is written as soon as it is rendered.
+    Returns every file written.
+    """
+
+    page_size = max(1, page_size)
+    pages = max(1, -(-len(runs) // page_size))
+    footer_html = "<br/>".join(html.escape(line) for line in footer.splitlines())
+    written: List[str] = []
+
+    for page in range(1, pages + 1):
+        target = page_path(path, page)
+        with _atomic_open(target) as handle:
+            _write_head(handle, "BlackHaven Report" if page == 1 else f"BlackHaven Report - page {page}")
+            handle.write(f"<h1>BlackHaven Framework Report</h1>\n<p>Generated: {html.escape(generated)}</p>\n")
+            if page == 1:
+                _write_index(handle, path, runs, page_size, pages)
+            _write_nav(handle, path, page, pages)
+            handle.write("<h2>Runs</h2>\n")
+            start = (page - 1) * page_size
+            for number in range(start, min(start + page_size, len(runs))):
+                _write_run(handle, number + 1, runs[number])
+            _write_nav(handle, path, page, pages)
+            handle.write(f"<hr/>\n<p>{footer_html}</p>\n</body>\n</html>\n")
+        written.append(target)
+    return written
@@ -0,0 +1,203 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import atexit
+import copy
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping
+from framework.core.state import PersistentStore, state_path
+
+DEFAULT_CACHE_FILE = "response-cache.json"
+# Entries kept before the least recently used ones are evicted.
+DEFAULT_MAX_ENTRIES = 20000
+# Seconds an entry is served without asking the server again.
+DEFAULT_TTL = 3600.0
+# Set to any non-empty value to bypass the cache, like ``--no-cache``.
+NO_CACHE_ENV = "BLACKHAVEN_NO_CACHE"
+
+_bypass = False
+# One cache per file for the whole process, saved once at exit.
+_shared: Dict[str, "ResponseCache"] = {}
+_shared_lock = threading.Lock()
+
+
+def bypass_response_cache(enabled: bool = True) -> None:
+    """Bypass the response cache for the rest of the process (``--no-cache``)."""
+
+    global _bypass
+    _bypass = enabled
+
+
+def cache_key(module: str, method: str, url: str, body: bytes | None = None, variant: str = "") -> str:
+    """Key an outcome by module, method, URL and a hash of the request body.
+
+    ``variant`` covers anything else the outcome depends on, such as the
+    signatures a body was matched against.
+    """
+
+    body_hash = hashlib.sha256(body or b"").hexdigest()
+    raw = "\n".join((module, method.upper(), url, body_hash, variant))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """A cached outcome; stale entries are only returned when they can be revalidated."""
+
+    key: str
+    value: Dict[str, Any]
+    fresh: bool
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that let the server answer 304."""
+
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(PersistentStore):
+    """Size-bounded cache of request outcomes.
+
+    Only what a module concluded from a response is stored (status, whether
+    a signature matched, detected headers), never the body. Entries are
+    served while younger than the module's TTL; after that they are kept
+    if the server sent an ETag or Last-Modified, so the next request can be
+    conditional and a 304 renews the entry without a body transfer.
+    """
+
+    FILE = DEFAULT_CACHE_FILE
+    SECTION = "entries"
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl: float = DEFAULT_TTL,
+        ttls: Mapping[str, float] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(path)
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max(1, max_entries)
+
+    def ttl_for(self, module: str) -> float:
+        return float(self.ttls.get(module, self.ttl))
+
+    def lookup(
+        self,
+        module: str,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        variant: str = "",
+    ) -> CacheEntry | None:
+        """Return the cached outcome, or None when there is nothing usable."""
+
+        key = cache_key(module, method, url, body, variant)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            fresh = now - entry.get("stored_at", 0) <= self.ttl_for(module)
+            if not fresh and not (entry.get("etag") or entry.get("last_modified")):
+                del self._entries[key]
+                self._dirty = True
+                return None
+            entry["used_at"] = int(now)
+            self._dirty = True
+            return CacheEntry(
+                key=key,
+                value=copy.deepcopy(entry["value"]),
+                fresh=fresh,
+                etag=entry.get("etag"),
+                last_modified=entry.get("last_modified"),
+            )
+
+    def store(
+        self,
+        module: str,
+        method: str,
+        url: str,
+        value: Dict[str, Any],
+        headers: Mapping[str, str] | None = None,
+        body: bytes | None = None,
+        variant: str = "",
+    ) -> None:
+        """Cache ``value``, keeping the response's validators for revalidation."""
+
+        key = cache_key(module, method, url, body, variant)
+        now = int(time.time())
+        entry: Dict[str, Any] = {"value": copy.deepcopy(value), "stored_at": now, "used_at": now}
+        if headers is not None:
+            entry["etag"] = headers.get("etag")
+            entry["last_modified"] = headers.get("last-modified")
+        with self._lock:
+            self._entries[key] = entry
+            self._evict()
+            self._dirty = True
+
+    def revalidated(self, entry: CacheEntry, headers: Mapping[str, str] | None = None) -> None:
+        """Renew ``entry`` after the server answered 304 Not Modified."""
+
+        now = int(time.time())
+        with self._lock:
+            stored = self._entries.get(entry.key)
+            if stored is None:
+                return
+            stored["stored_at"] = now
+            stored["used_at"] = now
+            if headers is not None:
+                stored["etag"] = headers.get("etag") or stored.get("etag")
+                stored["last_modified"] = headers.get("last-modified") or stored.get("last_modified")
+            self._dirty = True
+
+    def _evict(self) -> None:
+        overflow = len(self._entries) - self.max_entries
+        if overflow <= 0:
+            return
+        # Drop an extra tenth so eviction does not run on every store.
+        overflow += self.max_entries // 10
+        oldest = sorted(self._entries, key=lambda key: self._entries[key].get("used_at", 0))
+        for key in oldest[:overflow]:
+            del self._entries[key]
+
+
+def open_response_cache(config: Any = None) -> ResponseCache | None:
+    """Return the process-wide cache when ``response_cache`` is enabled and not bypassed.
+
+    The cache is opt-in; ``--no-cache`` or ``BLACKHAVEN_NO_CACHE`` turn it
+    off even when the configuration enables it. The file is loaded on the
+    first call and written back (if changed) when the process exits.
+    """
+
+    settings = config if config is not None else {}
+    if _bypass or os.environ.get(NO_CACHE_ENV) or not settings.get("response_cache", False):
+        return None
+    ttls = dict(settings.get("response_cache_ttl") or {})
+    ttl = float(ttls.get("default", DEFAULT_TTL))
+    max_entries = max(1, int(settings.get("response_cache_max_entries", DEFAULT_MAX_ENTRIES)))
+    path = state_path(DEFAULT_CACHE_FILE)
+    with _shared_lock:
+        cache = _shared.get(path)
+        if cache is None:
+            cache = _shared[path] = ResponseCache.load(path, ttl=ttl, ttls=ttls, max_entries=max_entries)
+            atexit.register(cache.save)
+        else:
+            cache.ttl, cache.ttls, cache.max_entries = ttl, ttls, max_entries
+    return cache
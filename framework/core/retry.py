@@ -0,0 +1,125 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import random
+import socket
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, FrozenSet
+from framework.core.concurrency import is_connection_reset
+from framework.core.site_stats import percentile
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Latency samples needed before the rolling p95 is used as a hedge delay.
+MIN_HEDGE_SAMPLES = 20
+HEDGE_WINDOW = 200
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds from a Retry-After header (seconds or HTTP date)."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+@dataclass
+class RetryPolicy:
+    """Retry and hedging rules shared by the sync and async HTTP clients.
+
+    Only idempotent methods are retried or hedged. Backoff is exponential
+    with full jitter; a Retry-After header on 429/503 replaces the computed
+    delay (capped at ``max_retry_after``, beyond which no retry is made).
+    Timeouts are only retried with ``retry_timeouts``, since a dead site
+    would otherwise cost several full timeouts.
+    """
+
+    retries: int = 1
+    backoff: float = 0.25
+    max_backoff: float = 4.0
+    max_retry_after: float = 10.0
+    retry_timeouts: bool = False
+    statuses: FrozenSet[int] = RETRY_STATUSES
+    # Fire a duplicate request once the first has run for the p95 latency.
+    hedge: bool = False
+    _latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=HEDGE_WINDOW), repr=False)
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> "RetryPolicy":
+        settings = config if config is not None else {}
+        return cls(
+            retries=int(settings.get("http_retries", 1)),
+            backoff=float(settings.get("http_retry_backoff", 0.25)),
+            hedge=bool(settings.get("http_hedge", False)),
+        )
+
+    def allows(self, method: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def retry_status(self, method: str, attempt: int, status: int) -> bool:
+        return self.allows(method) and attempt < self.retries and status in self.statuses
+
+    def retry_error(
+        self,
+        method: str,
+        attempt: int,
+        exc: BaseException,
+        timed_out: bool = False,
+    ) -> bool:
+        """Decide whether a failed attempt is retried.
+
+        Resets and dropped or truncated connections are retried; refused
+        connections and DNS failures are not.
+        """
+
+        if not self.allows(method) or attempt >= self.retries:
+            return False
+        if timed_out:
+            return self.retry_timeouts
+        if is_connection_reset(exc):
+            return True
+        if isinstance(exc, (ConnectionRefusedError, socket.gaierror)):
+            return False
+        return isinstance(exc, (ConnectionError, EOFError))
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """Seconds to wait before retry ``attempt + 1``; None means give up."""
+
+        hinted = parse_retry_after(retry_after)
+        if hinted is not None:
+            return hinted if hinted <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    def observe(self, latency: float) -> None:
+        """Record a time-to-response sample for the rolling hedge delay."""
+
+        self._latencies.append(latency)
+
+    def hedge_delay(self, method: str, hint: float | None = None) -> float | None:
+        """Return when to fire a hedged duplicate, or None for no hedging."""
+
+        if not self.hedge or not self.allows(method):
+            return None
+        if hint is not None:
+            return hint
+        samples = list(self._latencies)
+        if len(samples) < MIN_HEDGE_SAMPLES:
+            return None
+        return percentile(samples, 95)
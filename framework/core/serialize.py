@@ -0,0 +1,143 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Leading bytes of a binary session file; JSON files can never start with them.
+BINARY_MAGIC = b"BHS\x01"
+BINARY_SUFFIX = ".bhs"
+JSON_SUFFIX = ".json"
+FORMATS = ("pretty", "compact", "binary")
+BACKENDS = ("auto", "json", "orjson")
+
+
+class Serializer(ABC):
+    """Turns session/output data into bytes and back."""
+
+    name = ""
+    suffix = JSON_SUFFIX
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """Encode ``data``."""
+
+    @abstractmethod
+    def loads(self, raw: bytes) -> Any:
+        """Decode bytes written by ``dumps``."""
+
+
+class StdlibJSONSerializer(Serializer):
+    """``json`` module; pretty is the historical indent=2, sorted-keys layout."""
+
+    def __init__(self, pretty: bool = True) -> None:
+        self.pretty = pretty
+        self.name = "pretty" if pretty else "compact"
+
+    def dumps(self, data: Any) -> bytes:
+        if self.pretty:
+            return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, raw: bytes) -> Any:
+        return json.loads(raw)
+
+
+class OrjsonSerializer(Serializer):
+    """orjson backend; several times faster than ``json`` on large sessions."""
+
+    def __init__(self, pretty: bool = True) -> None:
+        self.pretty = pretty
+        self.name = "pretty" if pretty else "compact"
+        # Non-string keys are stringified, as ``json`` does.
+        self._options = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            self._options |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+    def dumps(self, data: Any) -> bytes:
+        try:
+            return orjson.dumps(data, option=self._options)
+        except TypeError:
+            # Values orjson rejects but json accepts, e.g. integers over 64 bits.
+            return StdlibJSONSerializer(self.pretty).dumps(data)
+
+    def loads(self, raw: bytes) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json writes NaN/Infinity, which orjson refuses to read.
+            return json.loads(raw)
+
+
+class MsgpackSerializer(Serializer):
+    """Binary sessions: ``BINARY_MAGIC`` followed by a msgpack document."""
+
+    name = "binary"
+    suffix = BINARY_SUFFIX
+
+    def dumps(self, data: Any) -> bytes:
+        return BINARY_MAGIC + msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, raw: bytes) -> Any:
+        if not raw.startswith(BINARY_MAGIC):
+            raise ValueError("Not a binary session file")
+        return msgpack.unpackb(raw[len(BINARY_MAGIC):], raw=False, strict_map_key=False)
+
+
+def binary_available() -> bool:
+    return msgpack is not None
+
+
+def get_serializer(fmt: str = "pretty", backend: str = "auto") -> Serializer:
+    """Return the serializer for a ``session_format``/``json_backend`` pair.
+
+    ``binary`` needs msgpack; callers should check ``binary_available`` and
+    fall back to ``compact``. ``auto`` uses orjson when it is installed.
+    Raises ValueError for unknown names.
+    """
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown serializer format: {fmt} (expected one of {', '.join(FORMATS)})")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend} (expected one of {', '.join(BACKENDS)})")
+    if fmt == "binary":
+        if msgpack is None:
+            raise ValueError("The binary session format needs the msgpack package")
+        return MsgpackSerializer()
+    if backend == "orjson" and orjson is None:
+        raise ValueError("The orjson backend needs the orjson package")
+    if backend in ("auto", "orjson") and orjson is not None:
+        return OrjsonSerializer(fmt == "pretty")
+    return StdlibJSONSerializer(fmt == "pretty")
+
+
+def loads_auto(raw: bytes) -> Any:
+    """Decode a session written by any serializer, detected from its first bytes."""
+
+    if raw.startswith(BINARY_MAGIC):
+        if msgpack is None:
+            raise ValueError("This session is in the binary format; install msgpack to load it")
+        return MsgpackSerializer().loads(raw)
+    if orjson is not None:
+        return OrjsonSerializer().loads(raw)
+    return json.loads(raw)
+
+
+# Human-readable stdlib layout; exported reports always use it.
+PRETTY = StdlibJSONSerializer(pretty=True)
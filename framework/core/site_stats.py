@@ -0,0 +1,103 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import math
+import time
+from typing import Any, Dict, List
+from framework.core.state import PersistentStore
+
+DEFAULT_STATS_FILE = "site-stats.json"
+# Latency samples (in milliseconds) kept per site; older ones are dropped.
+MAX_SAMPLES = 50
+# Samples needed before a site's own timeout replaces the caller's default.
+MIN_SAMPLES = 5
+# Adaptive timeout = p99 latency x this factor, clamped to [floor, default].
+TIMEOUT_FACTOR = 3.0
+TIMEOUT_FLOOR = 1.0
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (which must be non-empty)."""
+
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class SiteStats(PersistentStore):
+    """Per-site latency samples and failure counts."""
+
+    FILE = DEFAULT_STATS_FILE
+
+    def _entry(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {"latencies": [], "successes": 0, "failures": 0}
+        return entry
+
+    def record_success(self, key: str, latency: float) -> None:
+        with self._lock:
+            entry = self._entry(key)
+            samples = entry["latencies"]
+            samples.append(int(latency * 1000))
+            del samples[:-MAX_SAMPLES]
+            entry["successes"] += 1
+            entry["last_seen"] = int(time.time())
+            self._dirty = True
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            entry = self._entry(key)
+            entry["failures"] += 1
+            entry["last_seen"] = int(time.time())
+            self._dirty = True
+
+    def record_timeout(self, key: str, timeout: float) -> None:
+        """Count a timeout and keep ``timeout`` as a (censored) latency sample.
+
+        The real latency was at least ``timeout``; without the sample a site
+        that slowed down would keep the short timeout learned earlier.
+        """
+
+        with self._lock:
+            entry = self._entry(key)
+            samples = entry["latencies"]
+            samples.append(int(timeout * 1000))
+            del samples[:-MAX_SAMPLES]
+            entry["failures"] += 1
+            entry["last_seen"] = int(time.time())
+            self._dirty = True
+
+    def latency(self, key: str, pct: float) -> float | None:
+        """Return the ``pct`` latency percentile in seconds, if enough samples exist."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            samples = list(entry["latencies"]) if entry else []
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return percentile(samples, pct) / 1000.0
+
+    def failures(self, key: str) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            return int(entry["failures"]) if entry else 0
+
+    def timeout_for(self, key: str, default: float) -> float:
+        """Derive a site timeout from its p99 latency, never above ``default``."""
+
+        p99 = self.latency(key, 99)
+        if p99 is None:
+            return default
+        return min(default, max(TIMEOUT_FLOOR, p99 * TIMEOUT_FACTOR))
+
+    def expected_latency(self, key: str, default: float = 0.0) -> float:
+        """Typical (p90) latency used to schedule slow sites first."""
+
+        p90 = self.latency(key, 90)
+        return default if p90 is None else p90
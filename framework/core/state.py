@@ -0,0 +1,173 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Tuple
+from framework.core.serialize import get_serializer
+from framework.core.utils import JSONStore
+
+# State files are only read back by the framework, so skip indentation.
+_STATE_SERIALIZER = get_serializer("compact")
+STATE_DIR_ENV = "BLACKHAVEN_STATE_DIR"
+DEFAULT_STATE_DIR = os.path.join(os.path.expanduser("~"), ".blackhaven", "state")
+
+_compiled: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+_compiled_lock = threading.Lock()
+# Process-wide stores, keyed by class and file (see ``PersistentStore.shared``).
+_stores: Dict[Tuple[type, str], "PersistentStore"] = {}
+_stores_lock = threading.Lock()
+
+
+def state_dir() -> str:
+    """Return (and create) the per-user directory for caches and learned state."""
+
+    path = os.environ.get(STATE_DIR_ENV) or DEFAULT_STATE_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def state_path(name: str) -> str:
+    """Return the path of a file inside the state directory."""
+
+    return os.path.join(state_dir(), name)
+
+
+def read_json(path: str) -> Any:
+    """Load a JSON state file, returning None when it is missing or corrupt."""
+
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON atomically; state is a cache, so write errors are ignored."""
+
+    try:
+        JSONStore.write(path, data, _STATE_SERIALIZER)
+    except OSError:
+        pass
+
+
+def _read_pickle(cache_file: str, version: int, mtime_ns: int, size: int) -> Any:
+    try:
+        with open(cache_file, "rb") as handle:
+            payload = pickle.load(handle)
+    except Exception:
+        return None
+    if (
+        payload.get("version") != version
+        or payload.get("mtime_ns") != mtime_ns
+        or payload.get("size") != size
+    ):
+        return None
+    return payload.get("data")
+
+
+def _write_pickle(cache_file: str, payload: Dict[str, Any]) -> None:
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(cache_file) + ".", suffix=".tmp", dir=os.path.dirname(cache_file)
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_compiled(path: str, kind: str, version: int, build: Callable[[str], Any]) -> Any:
+    """Return ``build(path)``, cached in memory and as a pickle in the state directory.
+
+    Both copies are invalidated when the source file's mtime or size
+    changes; bump ``version`` whenever the built objects change shape.
+    Raises FileNotFoundError when ``path`` does not exist.
+    """
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (kind, path)
+    with _compiled_lock:
+        cached = _compiled.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+    cache_file = state_path(f"{kind}-{digest}.pickle")
+    data = _read_pickle(cache_file, version, stat.st_mtime_ns, stat.st_size)
+    if data is None:
+        data = build(path)
+        _write_pickle(
+            cache_file,
+            {"version": version, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data},
+        )
+
+    with _compiled_lock:
+        _compiled[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+class PersistentStore:
+    """Per-key entries kept in one versioned JSON file in the state directory.
+
+    Subclasses set ``FILE``, ``VERSION`` and ``SECTION``, mutate ``_entries``
+    under ``_lock`` and set ``_dirty``; ``save`` writes only when it is set.
+    Modules use ``shared`` so parallel runs in one process update a single
+    instance instead of overwriting each other's file.
+    """
+
+    FILE = ""
+    VERSION = 1
+    SECTION = "sites"
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or state_path(self.FILE)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: str | None = None, **kwargs: Any) -> Any:
+        store = cls(path, **kwargs)
+        data = read_json(store.path)
+        if isinstance(data, dict) and data.get("version") == cls.VERSION:
+            store._entries = dict(data.get(cls.SECTION) or {})
+        return store
+
+    @classmethod
+    def shared(cls, path: str | None = None) -> Any:
+        """Return the process-wide store for ``path``, loading it on first use."""
+
+        path = path or state_path(cls.FILE)
+        with _stores_lock:
+            store = _stores.get((cls, path))
+            if store is None:
+                store = _stores[(cls, path)] = cls.load(path)
+        return store
+
+    def save(self) -> None:
+        """Write the entries atomically if anything changed since loading."""
+
+        with self._lock:
+            if not self._dirty:
+                return
+            write_json_atomic(self.path, {"version": self.VERSION, self.SECTION: self._entries})
+            self._dirty = False
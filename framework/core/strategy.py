@@ -0,0 +1,82 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import time
+from framework.core.state import PersistentStore
+
+DEFAULT_STRATEGY_FILE = "probe-strategy.json"
+# Learned methods are re-verified after this many seconds.
+STRATEGY_TTL = 7 * 24 * 3600.0
+# HEAD responses meaning "ask again with GET".
+HEAD_REJECTED = {403, 405, 501}
+# Smallest partial GET sent once a signature position is known.
+MIN_RANGE_BYTES = 16 * 1024
+
+
+class ProbeStrategy(PersistentStore):
+    """Per-site table of the cheapest request that gives a reliable answer.
+
+    For status-only checks it records whether HEAD is accepted or GET is
+    required; for signature checks it records how far into the body the
+    signatures were found, so later checks can send a ``Range`` request
+    for just that prefix.
+    """
+
+    FILE = DEFAULT_STRATEGY_FILE
+
+    def __init__(self, path: str | None = None, ttl: float = STRATEGY_TTL) -> None:
+        super().__init__(path)
+        self.ttl = ttl
+
+    def method(self, key: str) -> str | None:
+        """Return the learned method ("HEAD"/"GET"), or None when unknown or stale."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or "method" not in entry:
+                return None
+            if time.time() - entry.get("learned_at", 0) > self.ttl:
+                return None
+            return entry["method"]
+
+    def record_method(self, key: str, method: str) -> None:
+        with self._lock:
+            entry = self._entries.setdefault(key, {})
+            if entry.get("method") == method and time.time() - entry.get("learned_at", 0) <= self.ttl:
+                return
+            entry["method"] = method
+            entry["learned_at"] = int(time.time())
+            self._dirty = True
+
+    def range_end(self, key: str) -> int | None:
+        """Bytes worth requesting for a signature check, or None for the full body."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            sig_end = entry.get("sig_end") if entry else None
+        if not sig_end:
+            return None
+        return max(MIN_RANGE_BYTES, sig_end * 2)
+
+    def record_signature(self, key: str, end: int) -> None:
+        """Remember that a signature ended ``end`` bytes into the body."""
+
+        with self._lock:
+            entry = self._entries.setdefault(key, {})
+            if entry.get("sig_end", 0) >= end:
+                return
+            entry["sig_end"] = end
+            self._dirty = True
+
+    def clear_range(self, key: str) -> None:
+        """Forget the signature position after a partial body proved too short."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.pop("sig_end", None) is not None:
+                self._dirty = True
@@ -6,16 +6,20 @@ All rights reserved.
 
 
 from __future__ import annotations
-import json
 import logging
+import os
 import socket
+import tempfile
 import time
 from dataclasses import dataclass
 from typing import Any, Dict
 from colorama import Fore, Style, init
 import yaml
+from framework.core.serialize import PRETTY, Serializer, loads_auto
 # Initialize color output once for the application.
 init(autoreset=True)
+# libyaml's loader parses config.yaml several times faster when it is available.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 @dataclass
 class Timer:
 
@@ -62,12 +66,37 @@ class Output:
 
 
 class JSONStore:
-    """JSON export helper with consistent formatting."""
+    """JSON export helper with consistent formatting.
+
+    Files are written to a uniquely named temp file and renamed into place,
+    so a crash, a concurrent reader or another writer thread never sees a
+    half-written session or report. The
+    serializer defaults to the indented, sorted-keys layout; sessions pass
+    a compact or binary one (see ``framework.core.serialize``).
+    """
+
+    @staticmethod
+    def write(path: str, data: Dict[str, Any], serializer: Serializer = PRETTY) -> None:
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path))
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(serializer.dumps(data))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
     @staticmethod
-    def write(path: str, data: Dict[str, Any]) -> None:
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, sort_keys=True)
+    def read(path: str) -> Any:
+        """Load a file written by any serializer; the format is detected from its content."""
+
+        with open(path, "rb") as handle:
+            return loads_auto(handle.read())
 
 
 def setup_logger(log_path: str) -> logging.Logger:
@@ -106,7 +135,7 @@ class ConfigManager:
     def _load(self) -> Dict[str, Any]:
         try:
             with open(self.path, "r", encoding="utf-8") as handle:
-                return yaml.safe_load(handle) or {}
+                return yaml.load(handle, Loader=_YAML_LOADER) or {}
         except FileNotFoundError:
             return {}
         except Exception:
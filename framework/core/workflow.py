@@ -0,0 +1,312 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+import yaml
+from framework.core.utils import safe_resolve
+
+WORKFLOW_DIR = "workflows"
+BUILTINS = ("dedupe", "resolve")
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One node of a workflow: a module or builtin applied to each incoming item.
+
+    Items are target strings. A module stage runs the module once per item
+    and turns its result into new items with ``emit`` (a path such as
+    ``found[].host``), rendered through ``format`` (``{item}`` is the
+    extracted value, ``{target}`` the stage's input) and kept when they
+    match ``filter``. Without ``emit`` the input item is passed on.
+    """
+
+    name: str
+    module: str | None = None
+    builtin: str | None = None
+    after: List[str] = field(default_factory=list)
+    concurrency: int = 1
+    emit: str | None = None
+    format: str = "{item}"
+    filter: str | None = None
+    config: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Workflow:
+    name: str
+    stages: List[Stage]
+    description: str = ""
+    path: str = ""
+
+    def children(self) -> Dict[str, List[str]]:
+        edges: Dict[str, List[str]] = {stage.name: [] for stage in self.stages}
+        for stage in self.stages:
+            for parent in stage.after:
+                edges[parent].append(stage.name)
+        return edges
+
+
+class StageConfig:
+    """Framework configuration with a stage's ``config`` overrides on top."""
+
+    def __init__(self, base: Any, overrides: Mapping[str, Any]) -> None:
+        self.base = base
+        self.overrides = dict(overrides)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.overrides:
+            return self.overrides[key]
+        return self.base.get(key, default)
+
+
+def resolve_workflow_path(name: str, base_dir: str) -> str:
+    """Return ``name`` if it is a file, else look it up in ``<base_dir>/workflows``."""
+
+    if os.path.isfile(name):
+        return name
+    for candidate in (name, f"{name}.yaml", f"{name}.yml"):
+        path = os.path.join(base_dir, WORKFLOW_DIR, candidate)
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(f"Workflow not found: {name}")
+
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    return [str(item) for item in value] if isinstance(value, list) else [str(value)]
+
+
+def load_workflow(path: str) -> Workflow:
+    """Parse and validate a YAML workflow; raises ValueError when it is malformed."""
+
+    with open(path, "r", encoding="utf-8") as handle:
+        data = yaml.safe_load(handle) or {}
+    if not isinstance(data, dict) or not isinstance(data.get("stages"), list) or not data["stages"]:
+        raise ValueError(f"{path}: a workflow needs a non-empty 'stages' list")
+
+    stages: List[Stage] = []
+    for raw in data["stages"]:
+        if not isinstance(raw, dict) or not raw.get("name"):
+            raise ValueError(f"{path}: every stage needs a name")
+        stage = Stage(
+            name=str(raw["name"]),
+            module=raw.get("module"),
+            builtin=raw.get("builtin"),
+            after=_as_list(raw.get("after")),
+            concurrency=max(1, int(raw.get("concurrency", 1))),
+            emit=raw.get("emit"),
+            format=str(raw.get("format", "{item}")),
+            filter=raw.get("filter"),
+            config=dict(raw.get("config") or {}),
+        )
+        if bool(stage.module) == bool(stage.builtin):
+            raise ValueError(f"{path}: stage '{stage.name}' needs exactly one of module/builtin")
+        if stage.builtin and stage.builtin not in BUILTINS:
+            raise ValueError(f"{path}: unknown builtin '{stage.builtin}' in stage '{stage.name}'")
+        if stage.filter:
+            try:
+                re.compile(stage.filter)
+            except re.error as exc:
+                raise ValueError(f"{path}: bad filter in stage '{stage.name}': {exc}")
+        stages.append(stage)
+
+    workflow = Workflow(
+        name=str(data.get("name") or os.path.splitext(os.path.basename(path))[0]),
+        stages=stages,
+        description=str(data.get("description", "")),
+        path=path,
+    )
+    _validate_graph(workflow)
+    return workflow
+
+
+def _validate_graph(workflow: Workflow) -> None:
+    names = [stage.name for stage in workflow.stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{workflow.path}: duplicate stage names")
+    for stage in workflow.stages:
+        for parent in stage.after:
+            if parent not in names:
+                raise ValueError(f"{workflow.path}: stage '{stage.name}' runs after unknown stage '{parent}'")
+
+    # Kahn's algorithm: anything left over sits on a cycle.
+    pending = {stage.name: len(stage.after) for stage in workflow.stages}
+    children = workflow.children()
+    ready = [name for name, count in pending.items() if count == 0]
+    visited = 0
+    while ready:
+        name = ready.pop()
+        visited += 1
+        for child in children[name]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                ready.append(child)
+    if visited != len(names):
+        raise ValueError(f"{workflow.path}: stages form a cycle")
+
+
+def extract_items(data: Any, path: str | None) -> List[Any]:
+    """Follow a dotted path into a result; ``name[]`` fans out over a list."""
+
+    values = [data]
+    for part in (path or "").split("."):
+        if not part:
+            continue
+        fan_out = part.endswith("[]")
+        key = part[:-2] if fan_out else part
+        next_values: List[Any] = []
+        for value in values:
+            if key:
+                value = value.get(key) if isinstance(value, dict) else None
+            if value is None:
+                continue
+            if fan_out:
+                next_values.extend(value if isinstance(value, list) else [value])
+            else:
+                next_values.append(value)
+        values = next_values
+    return [value for value in values if value is not None and not isinstance(value, (dict, list))]
+
+
+@dataclass
+class _StageState:
+    stage: Stage
+    inbox: "queue.Queue[Any]" = field(default_factory=queue.Queue)
+    seen: set = field(default_factory=set)
+    open_parents: int = 0
+    workers_left: int = 0
+    counts: Dict[str, int] = field(
+        default_factory=lambda: {"received": 0, "processed": 0, "failed": 0, "emitted": 0}
+    )
+
+
+class WorkflowRunner:
+    """Run a workflow with streaming hand-off between stages.
+
+    Every stage has its own input queue and ``concurrency`` worker threads.
+    Items a stage emits are queued for its children right away, so a
+    downstream stage starts on the first host while upstream stages are
+    still producing. A stage's input closes once all of its parents have
+    finished. Each stage drops items it has already seen.
+    """
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        execute: Callable[[str, str, Any], Tuple[bool, Dict[str, Any]]],
+        config: Any,
+    ) -> None:
+        self.workflow = workflow
+        self.execute = execute
+        self.config = config
+        self._children = workflow.children()
+        self._states = {stage.name: _StageState(stage) for stage in workflow.stages}
+        self._lock = threading.Lock()
+
+    def run(self, target: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        threads: List[threading.Thread] = []
+        for state in self._states.values():
+            state.open_parents = len(state.stage.after)
+            state.workers_left = state.stage.concurrency
+            for index in range(state.stage.concurrency):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(state,),
+                    name=f"workflow-{state.stage.name}-{index}",
+                    daemon=True,
+                )
+                threads.append(thread)
+
+        for state in self._states.values():
+            if not state.stage.after:
+                self._offer(state, target)
+                self._close(state)
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return {
+            "workflow": self.workflow.name,
+            "target": target,
+            "elapsed_seconds": round(time.perf_counter() - started, 4),
+            "stages": {name: dict(state.counts) for name, state in self._states.items()},
+        }
+
+    def _offer(self, state: _StageState, item: str) -> None:
+        with self._lock:
+            if item in state.seen:
+                return
+            state.seen.add(item)
+            state.counts["received"] += 1
+        state.inbox.put(item)
+
+    def _close(self, state: _StageState) -> None:
+        for _ in range(state.stage.concurrency):
+            state.inbox.put(_DONE)
+
+    def _worker(self, state: _StageState) -> None:
+        try:
+            while True:
+                item = state.inbox.get()
+                if item is _DONE:
+                    return
+                outputs = self._process(state, item)
+                for child in self._children[state.stage.name]:
+                    for output in outputs:
+                        self._offer(self._states[child], output)
+        finally:
+            with self._lock:
+                state.workers_left -= 1
+                finished = state.workers_left == 0
+                closing = []
+                if finished:
+                    for child in self._children[state.stage.name]:
+                        child_state = self._states[child]
+                        child_state.open_parents -= 1
+                        if child_state.open_parents == 0:
+                            closing.append(child_state)
+            for child_state in closing:
+                self._close(child_state)
+
+    def _process(self, state: _StageState, item: str) -> List[str]:
+        stage = state.stage
+        outputs: List[str] = []
+        success = True
+        if stage.builtin == "resolve":
+            success = safe_resolve(item) is not None
+            outputs = [item] if success else []
+        elif stage.builtin == "dedupe":
+            outputs = [item]
+        else:
+            try:
+                success, data = self.execute(stage.module, item, StageConfig(self.config, stage.config))
+            except Exception:
+                success, data = False, {}
+            if success:
+                values = extract_items(data, stage.emit) if stage.emit else [item]
+                outputs = [stage.format.format(item=value, target=item) for value in values]
+
+        if stage.filter:
+            pattern = re.compile(stage.filter)
+            outputs = [output for output in outputs if pattern.search(output)]
+        with self._lock:
+            state.counts["processed"] += 1
+            state.counts["emitted"] += len(outputs)
+            if not success:
+                state.counts["failed"] += 1
+        return outputs
@@ -0,0 +1,241 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import html
+import itertools
+import json
+import os
+import re
+import time
+from typing import IO, Any, Callable, Dict, Iterable, List, Tuple
+from urllib.parse import urlsplit
+from framework.core.async_http import AsyncHTTPClient, AsyncResponse
+from framework.core.certs import parse_certificate
+from framework.core.concurrency import AIMDController
+from framework.core.http import DEFAULT_USER_AGENT
+from framework.core.retry import RetryPolicy
+from framework.core.utils import Output
+from framework.modules.tech_detection import fingerprint
+DEFAULT_PORTS = [80, 443]
+# Ports probed over TLS only / plain HTTP only; any other port tries HTTPS, then HTTP.
+HTTPS_PORTS = {443, 8443, 9443}
+HTTP_PORTS = {80, 8000, 8008, 8080, 8888}
+# Body bytes read per response for the title and body fingerprints.
+DEFAULT_BODY_BYTES = 64 * 1024
+DEFAULT_CONCURRENCY = 64
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+Probe = Tuple[str, List[str]]
+# Numbers this process's runs so parallel runs never share an output file.
+_run_ids = itertools.count(1)
+def _read_targets(target: str) -> List[str]:
+    """Hosts from a file (one per line, ``#`` comments) or a comma/space separated list."""
+
+    if os.path.isfile(target):
+        with open(target, "r", encoding="utf-8") as handle:
+            lines = [line.split("#", 1)[0].strip() for line in handle]
+        return [line for line in lines if line]
+    return [item for item in re.split(r"[,\s]+", target) if item]
+
+
+def _candidate_urls(host: str, port: int) -> List[str]:
+    netloc = f"[{host}]" if ":" in host else host
+    if port in HTTPS_PORTS:
+        schemes = ["https"]
+    elif port in HTTP_PORTS:
+        schemes = ["http"]
+    else:
+        schemes = ["https", "http"]
+    return [f"{scheme}://{netloc}:{port}/" for scheme in schemes]
+
+
+def _plan_probes(entries: Iterable[str], default_ports: List[int]) -> List[Probe]:
+    """Turn ``host``, ``host:port[,port]`` and URL entries into (input, candidate URLs).
+
+    Each host:port is one probe; its candidate URLs are tried in order and
+    the first that answers is reported.
+    """
+
+    probes: List[Probe] = []
+    seen = set()
+    for entry in entries:
+        if "://" in entry:
+            if entry not in seen:
+                seen.add(entry)
+                probes.append((entry, [entry]))
+            continue
+        host, ports = entry, default_ports
+        if entry.count(":") == 1:
+            host, _, port_list = entry.partition(":")
+            ports = [int(port) for port in port_list.split(",") if port.strip().isdigit()] or default_ports
+        for port in ports:
+            key = (host.lower(), port)
+            if key not in seen:
+                seen.add(key)
+                probes.append((f"{host}:{port}", _candidate_urls(host, port)))
+    return probes
+
+
+def _title(body: str) -> str | None:
+    match = _TITLE_RE.search(body)
+    if not match:
+        return None
+    return " ".join(html.unescape(match.group(1)).split())[:256] or None
+
+
+def _tls_info(response: AsyncResponse) -> Dict[str, Any] | None:
+    der = response.peer_certificate()
+    if not der:
+        return None
+    try:
+        return parse_certificate(der)
+    except ValueError:
+        return None
+
+
+async def _probe_url(
+    client: AsyncHTTPClient,
+    url: str,
+    timeout: float,
+    body_bytes: int,
+    follow_redirects: bool,
+) -> Dict[str, Any]:
+    async with client.stream("GET", url, timeout=timeout, allow_redirects=follow_redirects) as response:
+        response_time = response.elapsed
+        tls = _tls_info(response) if response.url.startswith("https") else None
+        body = await response.read(body_bytes) if body_bytes > 0 else b""
+    text = body.decode("utf-8", "replace")
+    headers = response.headers
+    found = fingerprint(headers, text, response.url)
+    length = headers.get("content-length")
+    return {
+        "url": response.url,
+        "host": urlsplit(response.url).hostname,
+        "port": AsyncHTTPClient.host_key(response.url)[2],
+        "scheme": urlsplit(response.url).scheme,
+        "status_code": response.status,
+        "title": _title(text),
+        "server": headers.get("server"),
+        "content_type": headers.get("content-type"),
+        "content_length": int(length) if length and length.isdigit() else len(body),
+        "location": headers.get("location"),
+        "redirects": [url for _, url in response.history],
+        "response_time": round(response_time, 4),
+        "tls": tls,
+        "technologies": [item["name"] for item in found["technologies"]],
+    }
+
+
+async def _probe_all(
+    probes: List[Probe],
+    config,
+    emit: Callable[[Dict[str, Any]], None],
+) -> int:
+    """Run every probe with a bounded worker pool; returns the number of dead probes."""
+
+    concurrency = max(1, int(config.get("http_probe_concurrency", config.get("thread_count", DEFAULT_CONCURRENCY))))
+    timeout = float(config.get("timeout", 6))
+    body_bytes = int(config.get("http_probe_body_bytes", DEFAULT_BODY_BYTES))
+    follow = bool(config.get("http_probe_follow_redirects", False))
+    controller = None
+    if config.get("adaptive_concurrency", True):
+        controller = AIMDController(initial=min(16, concurrency), maximum=concurrency)
+    failed = 0
+    iterator = iter(probes)
+
+    async with AsyncHTTPClient(
+        user_agent=config.get("user_agent", DEFAULT_USER_AGENT),
+        timeout=timeout,
+        limit=concurrency,
+        controller=controller,
+        retry=RetryPolicy.from_config(config),
+        verify_tls=False,
+    ) as client:
+
+        async def _worker() -> None:
+            nonlocal failed
+            for probe_input, urls in iterator:
+                for url in urls:
+                    try:
+                        result = await _probe_url(client, url, timeout, body_bytes, follow)
+                    except Exception:
+                        continue
+                    result["input"] = probe_input
+                    emit(result)
+                    break
+                else:
+                    failed += 1
+
+        workers = [asyncio.ensure_future(_worker()) for _ in range(min(concurrency, len(probes)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    return failed
+
+
+def _open_output(config) -> IO[str]:
+    """Open ``http_probe_output``, or a new uniquely named file in the output directory."""
+
+    path = config.get("http_probe_output")
+    if path:
+        return open(path, "w", encoding="utf-8")
+    output_dir = config.get("output_directory", "output")
+    if not os.path.isabs(output_dir):
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+        output_dir = os.path.join(root, output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    name = f"http_probe_{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_run_ids)}.jsonl"
+    return open(os.path.join(output_dir, name), "x", encoding="utf-8")
+
+
+def run(target: str, config) -> Dict[str, Any]:
+    """Probe hosts for live HTTP/HTTPS services.
+
+    ``target`` is a file of hosts (e.g. saved ``subdomain_enum`` output) or
+    a comma-separated list; entries may be ``host``, ``host:port,port`` or
+    full URLs. Hosts without ports use ``http_probe_ports``. Each live
+    service is written to a JSONL file as soon as it answers.
+    """
+
+    ports = [int(port) for port in config.get("http_probe_ports", DEFAULT_PORTS)]
+    probes = _plan_probes(_read_targets(target), ports)
+    Output.info(f"Probing {len(probes)} host/port pairs...")
+    results: List[Dict[str, Any]] = []
+
+    with _open_output(config) as handle:
+        output_path = handle.name
+
+        def _emit(result: Dict[str, Any]) -> None:
+            results.append(result)
+            handle.write(json.dumps(result) + "\n")
+            handle.flush()
+            extras = " ".join(
+                f"[{value}]" for value in (result["title"], result["server"]) if value
+            )
+            Output.success(f"{result['url']} [{result['status_code']}] {extras}".rstrip())
+
+        failed = asyncio.run(_probe_all(probes, config, _emit)) if probes else 0
+
+    Output.info(f"Live results streamed to {output_path}")
+    return {
+        "target": target,
+        "probed": len(probes),
+        "live": len(results),
+        "failed": failed,
+        "output": output_path,
+        "results": results,
+    }
+
+
+def register(framework) -> None:
+    """Module entrypoint registration."""
+
+    framework.register_module("http_probe", run)
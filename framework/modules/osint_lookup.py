@@ -6,8 +6,13 @@ All rights reserved.
 
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List
 import requests
+from framework.core.catalog import compile_sites
+from framework.core.http import HTTPClient, get_client
+from framework.core.response_cache import ResponseCache, open_response_cache
+from framework.core.strategy import HEAD_REJECTED, ProbeStrategy
 from framework.core.utils import Output
 PLATFORMS = {
     "GitHub": "https://github.com/{username}",
@@ -23,33 +28,76 @@ PLATFORMS = {
     "Pinterest": "https://www.pinterest.com/{username}",
     "SoundCloud": "https://soundcloud.com/{username}",
 }
-def _check_profile(url: str, timeout: float) -> bool:
+MODULE = "osint_lookup"
+CATALOG = compile_sites({"name": name, "url": url} for name, url in PLATFORMS.items())
+def _check_profile(
+    client: HTTPClient,
+    strategies: ProbeStrategy,
+    name: str,
+    url: str,
+    timeout: float,
+    cache: ResponseCache | None = None,
+) -> bool:
 
-    headers = {"User-Agent": "BlackHavenFramework/1.0"}
-    try:
-        response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
-        if response.status_code in {405, 403}:
-            response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-    except requests.RequestException:
-        return False
+    entry = cache.lookup(MODULE, "GET", url) if cache else None
+    if entry is not None and entry.fresh:
+        return entry.value["found"]
+    conditional = entry.validators() if entry else {}
 
-    return response.status_code in {200, 301, 302}
+    response = None
+    if strategies.method(name) != "GET":
+        try:
+            response = client.head(url, headers=conditional, timeout=timeout, allow_redirects=True)
+        except requests.RequestException:
+            return False
+        if response.status_code in HEAD_REJECTED:
+            response = None
+        else:
+            strategies.record_method(name, "HEAD")
+
+    if response is None:
+        # Only the status decides, so the body is never downloaded.
+        try:
+            with client.get(url, headers=conditional, timeout=timeout, allow_redirects=True, stream=True) as response:
+                pass
+        except requests.RequestException:
+            return False
+        strategies.record_method(name, "GET")
+
+    if response.status_code == 304 and entry is not None:
+        cache.revalidated(entry, response.headers)
+        return entry.value["found"]
+    found = response.status_code in {200, 301, 302}
+    if cache is not None:
+        cache.store(MODULE, "GET", url, {"found": found}, response.headers)
+    return found
 
 
 def run(target: str, config) -> Dict[str, Any]:
-    """Perform username existence checks across platforms."""
+    """Perform username existence checks across platforms concurrently."""
 
     Output.info("Checking username across platforms...")
-    results: List[Dict[str, Any]] = []
     timeout = config.get("timeout", 6)
+    max_workers = max(1, min(config.get("thread_count", 12), len(CATALOG)))
+    client = get_client(config)
+    strategies = ProbeStrategy.shared()
+    cache = open_response_cache(config)
+    results: List[Dict[str, Any]] = [{} for _ in CATALOG]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_map = {}
+        for index, site in enumerate(CATALOG):
+            url = site.url(target)
+            future = executor.submit(_check_profile, client, strategies, site.name, url, timeout, cache)
+            future_map[future] = (index, site.name, url)
 
-    for name, template in PLATFORMS.items():
-        url = template.format(username=target)
-        exists = _check_profile(url, timeout)
-        status = "found" if exists else "not_found"
-        Output.info(f"{name}: {status}")
-        results.append({"platform": name, "url": url, "status": status})
+        for future in as_completed(future_map):
+            index, name, url = future_map[future]
+            status = "found" if future.result() else "not_found"
+            Output.info(f"{name}: {status}")
+            results[index] = {"platform": name, "url": url, "status": status}
 
+    strategies.save()
     return {
         "username": target,
         "results": results,
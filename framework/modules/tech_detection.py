@@ -6,43 +6,94 @@ All rights reserved.
 
 
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping, Tuple
+from urllib.parse import urljoin
 import requests
+from framework.core.fingerprints import favicon_hash, load_fingerprints, parse_html
+from framework.core.http import HTTPClient, get_client
+from framework.core.response_cache import open_response_cache
 from framework.core.utils import Output
-CDN_SIGNATURES = {
-    "cloudflare": ["cloudflare", "cf-ray", "cf-cache-status"],
-    "akamai": ["akamai", "akamai-ghost"],
-    "fastly": ["fastly", "x-served-by"],
-    "cloudfront": ["cloudfront", "x-amz-cf-id"],
-    "incapsula": ["incapsula", "x-cdn"],
-}
-def _detect_cdn(headers: Dict[str, str]) -> str | None:
-
-    header_blob = " ".join(f"{k}:{v}" for k, v in headers.items()).lower()
-    for provider, tokens in CDN_SIGNATURES.items():
-        if any(token in header_blob for token in tokens):
-            return provider
-    return None
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Body bytes read when body signatures are requested (tech_body_signatures).
+DEFAULT_BODY_BYTES = 64 * 1024
+# Largest favicon read for hashing (tech_favicon).
+MAX_FAVICON_BYTES = 256 * 1024
+_CHUNK_SIZE = 8192
+def _read_prefix(response: requests.Response, max_bytes: int) -> bytes:
+    """Read at most ``max_bytes`` of a streamed body."""
 
+    chunks: List[bytes] = []
+    size = 0
+    for chunk in response.iter_content(_CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            break
+    return b"".join(chunks)[:max_bytes]
 
-def run(target: str, config) -> Dict[str, Any]:
-    """Detect technology details from HTTP headers."""
 
-    url = target
-    if not url.startswith("http"):
-        url = f"https://{target}"
+def _fetch(
+    client: HTTPClient,
+    url: str,
+    headers: Dict[str, str],
+    timeout: float,
+    body_bytes: int,
+) -> Tuple[requests.Response, bytes, List[Dict[str, Any]]]:
+    """Follow redirects hop by hop, closing each response once its headers arrive.
 
-    Output.info(f"Requesting {url}...")
-    timeout = config.get("timeout", 6)
+    Only the final response's body is read, and only up to ``body_bytes``.
+    Returns the final response, the body prefix and the redirect chain.
+    """
+
+    chain: List[Dict[str, Any]] = []
+    for _ in range(MAX_REDIRECTS + 1):
+        with client.get(url, headers=headers, timeout=timeout, allow_redirects=False, stream=True) as response:
+            location = response.headers.get("location")
+            if response.status_code in REDIRECT_STATUSES and location:
+                chain.append({"url": url, "status_code": response.status_code, "location": location})
+                url = urljoin(url, location)
+                continue
+            prefix = _read_prefix(response, body_bytes) if body_bytes > 0 else b""
+            return response, prefix, chain
+    raise requests.TooManyRedirects(f"Exceeded {MAX_REDIRECTS} redirects.")
+
+
+def _favicon(client: HTTPClient, url: str, body: str, timeout: float) -> int | None:
+    """Hash the page's icon (``<link rel=icon>`` or ``/favicon.ico``)."""
+
+    _, _, icons = parse_html(body) if body else ({}, [], [])
+    icon_url = urljoin(url, icons[0] if icons else "/favicon.ico")
     try:
-        response = requests.get(url, timeout=timeout, allow_redirects=True)
-    except requests.RequestException as exc:
-        raise RuntimeError(f"HTTP request failed: {exc}")
+        response, content, _ = _fetch(client, icon_url, {}, timeout, MAX_FAVICON_BYTES)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200 or not content:
+        return None
+    return favicon_hash(content)
+
+
+def fingerprint(
+    headers: Mapping[str, str],
+    body: str | bytes = b"",
+    url: str = "",
+    favicon: int | None = None,
+    database: str | None = None,
+) -> Dict[str, Any]:
+    """Fingerprint one response against the technology database.
+
+    Shared with the bulk probing modules, which pass whatever part of the
+    response they fetched.
+    """
 
-    headers = {k.lower(): v for k, v in response.headers.items()}
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    headers = {k.lower(): v for k, v in headers.items()}
+    detections = load_fingerprints(database).detect(headers, body, url, favicon=favicon)
     server = headers.get("server")
     powered_by = headers.get("x-powered-by")
-    cdn = _detect_cdn(headers)
+    cdn = next((item.name for item in detections if "CDN" in item.categories), None)
+    generator = parse_html(body)[0].get("generator") if body else None
 
     detected = []
     if server:
@@ -51,19 +102,77 @@ def run(target: str, config) -> Dict[str, Any]:
         detected.append(f"x-powered-by:{powered_by}")
     if cdn:
         detected.append(f"cdn:{cdn}")
+    if generator:
+        detected.append(f"generator:{generator}")
+    detected.extend(item.label() for item in detections)
 
     return {
-        "target": target,
-        "url": response.url,
-        "status_code": response.status_code,
         "server": server,
         "x_powered_by": powered_by,
         "cdn": cdn,
-        "headers": headers,
+        "technologies": [
+            {"name": item.name, "version": item.version, "categories": list(item.categories)}
+            for item in detections
+        ],
         "detected_technologies": detected,
     }
 
 
+def run(target: str, config) -> Dict[str, Any]:
+    """Detect technology details from HTTP headers.
+
+    Bodies are not downloaded unless ``tech_body_signatures`` is set, in
+    which case only the first ``tech_body_bytes`` of the final page are read
+    for HTML, meta and script signatures. ``tech_favicon`` also hashes the
+    site's favicon.
+    """
+
+    url = target
+    if not url.startswith("http"):
+        url = f"https://{target}"
+
+    cache = open_response_cache(config)
+    entry = cache.lookup("tech_detection", "GET", url) if cache else None
+    if entry is not None and entry.fresh:
+        Output.info(f"Using cached result for {url}")
+        return entry.value
+
+    Output.info(f"Requesting {url}...")
+    timeout = config.get("timeout", 6)
+    conditional = entry.validators() if entry else {}
+    body_bytes = 0
+    if config.get("tech_body_signatures", False):
+        body_bytes = int(config.get("tech_body_bytes", DEFAULT_BODY_BYTES))
+    client = get_client(config)
+    try:
+        response, body, chain = _fetch(client, url, conditional, timeout, body_bytes)
+    except requests.RequestException as exc:
+        raise RuntimeError(f"HTTP request failed: {exc}")
+
+    if response.status_code == 304 and entry is not None:
+        cache.revalidated(entry, response.headers)
+        return entry.value
+
+    text = body.decode("utf-8", "replace")
+    favicon = _favicon(client, response.url, text, timeout) if config.get("tech_favicon", False) else None
+    found = fingerprint(response.headers, text, response.url, favicon, config.get("tech_fingerprints"))
+    result = {
+        "target": target,
+        "url": response.url,
+        "status_code": response.status_code,
+        "server": found["server"],
+        "x_powered_by": found["x_powered_by"],
+        "cdn": found["cdn"],
+        "headers": {k.lower(): v for k, v in response.headers.items()},
+        "redirect_chain": chain,
+        "technologies": found["technologies"],
+        "detected_technologies": found["detected_technologies"],
+    }
+    if cache is not None:
+        cache.store("tech_detection", "GET", url, result, response.headers)
+    return result
+
+
 def register(framework) -> None:
     """Module entrypoint registration."""
 
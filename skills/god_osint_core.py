@@ -10,21 +10,28 @@ All rights reserved.
 
 from __future__ import annotations
 
-import json
 import os
-import subprocess
+import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Tuple
+from typing import Callable, List, Tuple
 
-import requests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blackhaven.core.fanout import FoundSet, Stage, announce, command_stage, run_stages  # noqa: E402
+from framework.core.catalog import SiteEntry, load_catalog  # noqa: E402
+from framework.core.concurrency import AIMDController  # noqa: E402
+from framework.core.http import HTTPClient  # noqa: E402
 
 SITES_PATH = "/home/hacker/WhatsMyName/blackbird/data.json"
 RESULTS_DIR = "/home/hacker/BlackHaven/results/god_osint"
+# Upper bound on in-flight checks; the adaptive limit stays at or below it.
 THREADS = 64
 TIMEOUT = 5
+# Overall wall-clock budget shared by the external tools and the native scan.
+DEADLINE = 600
 
-_thread_local = threading.local()
+_client = HTTPClient(timeout=TIMEOUT, controller=AIMDController(maximum=THREADS))
 
 
 def _ensure_dirs() -> None:
@@ -33,35 +40,20 @@ def _ensure_dirs() -> None:
     os.makedirs("/home/hacker/BlackHaven/skills", exist_ok=True)
 
 
-def _load_sites() -> List[Dict[str, str]]:
-    with open(SITES_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("sites", [])
-
-
-def _format_url(template: str, username: str) -> str:
-    return template.format_map({"account": username, "username": username})
-
+def _load_sites() -> List[SiteEntry]:
+    return load_catalog(SITES_PATH)
 
-def _session() -> requests.Session:
-    session = getattr(_thread_local, "session", None)
-    if session is None:
-        session = requests.Session()
-        _thread_local.session = session
-    return session
 
-
-def _check_site(site: Dict[str, str], username: str) -> Tuple[str, bool]:
-    name = site.get("name", "unknown")
-    template = site.get("uri_check")
-    if not template:
-        return name, False
-    url = _format_url(template, username)
+def _check_site(site: SiteEntry, username: str) -> Tuple[str, str, bool]:
+    name = site.name
+    if not site.valid:
+        return name, "", False
+    url = site.url(username)
     try:
-        resp = _session().get(url, timeout=TIMEOUT)
-        return name, resp.status_code == 200
+        resp = _client.get(url)
+        return name, url, resp.status_code == 200
     except Exception:
-        return name, False
+        return name, url, False
 
 
 def _save_results(username: str, found: List[str]) -> str:
@@ -74,61 +66,39 @@ def _save_results(username: str, found: List[str]) -> str:
     return path
 
 
-def _stream_and_prefix(cmd: List[str], prefix: str) -> None:
-    try:
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-    except FileNotFoundError:
-        print(f"[{prefix}] ERROR: command not found")
-        return
-
-    if not proc.stdout:
-        return
-
-    for line in proc.stdout:
-        line = line.strip()
-        if not line:
-            continue
-        if "FOUND" in line:
-            print(f"[{prefix}] {line}")
-    proc.wait()
-
-
-def run_blackbird(username: str) -> None:
+def run_blackbird(username: str) -> Stage:
     cmd = [
         "/home/hacker/BlackHaven/venv/bin/python",
         "/home/hacker/WhatsMyName/blackbird/blackbird.py",
         "-u",
         username,
     ]
-    _stream_and_prefix(cmd, "BLACKBIRD")
+    return command_stage(cmd, "BLACKBIRD")
 
 
-def run_sherlock(username: str) -> None:
+def run_sherlock(username: str) -> Stage:
     cmd = [
         "/home/hacker/BlackHaven/venv/bin/python",
         "-m",
         "sherlock",
         username,
     ]
-    _stream_and_prefix(cmd, "SHERLOCK")
+    return command_stage(cmd, "SHERLOCK")
 
 
-def run_god_core(username: str) -> List[str]:
+def run_god_core(username: str, report: Callable[[str], None], stop: threading.Event) -> None:
     sites = _load_sites()
-    found_sites: List[str] = []
-    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+    executor = ThreadPoolExecutor(max_workers=THREADS)
+    try:
         futures = [executor.submit(_check_site, site, username) for site in sites]
         for future in as_completed(futures):
-            name, found = future.result()
+            if stop.is_set():
+                break
+            name, url, found = future.result()
             if found:
-                print(f"[GOD CORE] FOUND: {name}")
-                found_sites.append(name)
-    return found_sites
+                report(f"{name}: {url}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main() -> None:
@@ -138,11 +108,17 @@ def main() -> None:
         print("No username provided.")
         return
 
-    run_blackbird(username)
-    run_sherlock(username)
-    found = run_god_core(username)
-
-    path = _save_results(username, found)
+    found = run_stages(
+        [
+            ("BLACKBIRD", run_blackbird(username)),
+            ("SHERLOCK", run_sherlock(username)),
+            ("GOD CORE", lambda report, stop: run_god_core(username, report, stop)),
+        ],
+        FoundSet(on_new=announce),
+        timeout=DEADLINE,
+    )
+
+    path = _save_results(username, found.values())
     print(f"\nResults saved: {path}")
 
 
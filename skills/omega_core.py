@@ -10,21 +10,23 @@ All rights reserved.
 
 from __future__ import annotations
 
-import json
 import os
-import subprocess
+import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Callable, Iterable, List, Set
 
-import requests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blackhaven.core.fanout import FoundSet, Stage, announce, command_stage, extract_url, run_stages  # noqa: E402
+from blackhaven.core.username_engine import search_usernames  # noqa: E402
 
 SITES_PATH = "/home/hacker/WhatsMyName/blackbird/data.json"
 RESULTS_DIR = "/home/hacker/BlackHaven/results/omega"
+# Upper bound on in-flight checks; the engine adapts concurrency below it.
 THREADS = 128
 TIMEOUT = 5
-
-_thread_local = threading.local()
+# Overall wall-clock budget shared by the external tools and the native scan.
+DEADLINE = 1800
 
 
 def _ensure_dirs() -> None:
@@ -33,39 +35,6 @@ def _ensure_dirs() -> None:
     os.makedirs(RESULTS_DIR, exist_ok=True)
 
 
-def _load_sites() -> List[Dict[str, str]]:
-    with open(SITES_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("sites", [])
-
-
-def _format_url(template: str, username: str) -> str:
-    return template.format_map({"account": username, "username": username})
-
-
-def _session() -> requests.Session:
-    session = getattr(_thread_local, "session", None)
-    if session is None:
-        session = requests.Session()
-        _thread_local.session = session
-    return session
-
-
-def _check_site(site: Dict[str, str], username: str) -> Tuple[str, str] | None:
-    name = site.get("name", "unknown")
-    template = site.get("uri_check")
-    if not template:
-        return None
-    url = _format_url(template, username)
-    try:
-        resp = _session().get(url, timeout=TIMEOUT, allow_redirects=False)
-        if resp.status_code in {200, 301, 302}:
-            return name, url
-    except Exception:
-        return None
-    return None
-
-
 def _save_results(username: str, urls: Iterable[str]) -> str:
     path = os.path.join(RESULTS_DIR, f"{username}.txt")
     with open(path, "w", encoding="utf-8") as f:
@@ -74,48 +43,24 @@ def _save_results(username: str, urls: Iterable[str]) -> str:
     return path
 
 
-def _stream_and_prefix(cmd: List[str], prefix: str) -> None:
-    try:
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-    except FileNotFoundError:
-        print(f"[{prefix}] ERROR: command not found")
-        return
-
-    if not proc.stdout:
-        return
-
-    for line in proc.stdout:
-        line = line.strip()
-        if not line:
-            continue
-        if "FOUND" in line:
-            print(f"[{prefix}] {line}")
-    proc.wait()
-
-
-def run_blackbird(username: str) -> None:
+def run_blackbird(username: str) -> Stage:
     cmd = [
         "/home/hacker/BlackHaven/venv/bin/python",
         "/home/hacker/WhatsMyName/blackbird/blackbird.py",
         "-u",
         username,
     ]
-    _stream_and_prefix(cmd, "BLACKBIRD")
+    return command_stage(cmd, "BLACKBIRD")
 
 
-def run_sherlock(username: str) -> None:
+def run_sherlock(username: str) -> Stage:
     cmd = [
         "/home/hacker/BlackHaven/venv/bin/python",
         "-m",
         "sherlock",
         username,
     ]
-    _stream_and_prefix(cmd, "SHERLOCK")
+    return command_stage(cmd, "SHERLOCK")
 
 
 def generate_variations(username: str) -> List[str]:
@@ -169,19 +114,17 @@ def _dedupe(items: Iterable[str]) -> List[str]:
     return output
 
 
-def run_custom_scan(username: str) -> List[str]:
-    sites = _load_sites()
-    found_urls: List[str] = []
-    with ThreadPoolExecutor(max_workers=THREADS) as executor:
-        futures = [executor.submit(_check_site, site, username) for site in sites]
-        for future in as_completed(futures):
-            result = future.result()
-            if not result:
-                continue
-            name, url = result
-            print(f"[OMEGA] FOUND: {name}")
-            found_urls.append(url)
-    return found_urls
+def run_custom_scan(
+    usernames: List[str],
+    report: Callable[[str], None],
+    stop: threading.Event | None = None,
+) -> None:
+    results_iter = search_usernames(usernames, SITES_PATH, max_workers=THREADS, timeout=TIMEOUT, stop=stop)
+    for variation, results in results_iter:
+        print(f"[OMEGA] checked variation: {variation}")
+        for entry in results:
+            if entry["found"] == "yes":
+                report(entry["url"])
 
 
 def main() -> None:
@@ -192,16 +135,20 @@ def main() -> None:
         return
 
     print(f"[OMEGA] scanning username {username}")
-    run_blackbird(username)
-    run_sherlock(username)
-
     variations = _dedupe(generate_variations(username) + expand_usernames(username))
-    all_found: List[str] = []
-    for variation in variations:
-        print(f"[OMEGA] checking variation: {variation}")
-        all_found.extend(run_custom_scan(variation))
-
-    path = _save_results(username, _dedupe(all_found))
+    print(f"[OMEGA] checking {len(variations)} variations")
+
+    found = run_stages(
+        [
+            ("BLACKBIRD", run_blackbird(username)),
+            ("SHERLOCK", run_sherlock(username)),
+            ("OMEGA", lambda report, stop: run_custom_scan(variations, report, stop)),
+        ],
+        FoundSet(on_new=announce),
+        timeout=DEADLINE,
+    )
+
+    path = _save_results(username, _dedupe(extract_url(value) for value in found.values()))
     print(f"\nResults saved: {path}")
 
 
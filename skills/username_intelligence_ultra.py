@@ -10,12 +10,16 @@ All rights reserved.
 
 from __future__ import annotations
 
-import json
 import os
+import sys
 import urllib.error
 import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Tuple
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from framework.core.catalog import SiteEntry, load_catalog  # noqa: E402
 
 MIN_THREADS = 32
 TIMEOUT = 5
@@ -28,14 +32,8 @@ def _ensure_results_dir() -> None:
     os.makedirs(RESULTS_DIR, exist_ok=True)
 
 
-def _load_sites() -> List[Dict[str, str]]:
-    with open(SITES_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("sites", [])
-
-
-def _format_url(template: str, username: str) -> str:
-    return template.format_map({"account": username, "username": username})
+def _load_sites() -> List[SiteEntry]:
+    return load_catalog(SITES_PATH)
 
 
 def _fetch(url: str) -> int:
@@ -48,12 +46,11 @@ def _fetch(url: str) -> int:
         return resp.getcode()
 
 
-def _check_site(site: Dict[str, str], username: str) -> Tuple[str, bool]:
-    name = site.get("name", "unknown")
-    template = site.get("uri_check")
-    if not template:
+def _check_site(site: SiteEntry, username: str) -> Tuple[str, bool]:
+    name = site.name
+    if not site.valid:
         return name, False
-    url = _format_url(template, username)
+    url = site.url(username)
     try:
         status = _fetch(url)
         return name, status == 200
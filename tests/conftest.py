@@ -0,0 +1,128 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import gzip
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from framework.core import response_cache, state
+
+PROFILE = b"<html><title>Profile</title>PROFILE_OK</html>"
+MISSING = b"<html><title>Oops</title>NOUSER</html>"
+# Offset of the m_string in /late pages, past the first read chunk.
+LATE_OFFSET = 40 * 1024
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch) -> str:
+    """Keep learned state, caches and pickles out of the user's state directory."""
+
+    path = tmp_path / "state"
+    monkeypatch.setenv(state.STATE_DIR_ENV, str(path))
+    monkeypatch.setattr(state, "_compiled", {})
+    monkeypatch.setattr(state, "_stores", {})
+    monkeypatch.setattr(response_cache, "_shared", {})
+    return str(path)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Username-site lookalike; the path is ``/<kind>/<username>``.
+
+    Only the username ``taken`` exists: its pages carry PROFILE_OK with
+    status 200, every other name gets NOUSER with status 404.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        _, kind, *rest = self.path.split("/")
+        user = rest[-1] if rest else ""
+        taken = user == "taken"
+        page, status = (PROFILE, 200) if taken else (MISSING, 404)
+        if kind == "status":
+            self._send(int(rest[0]))
+        elif kind == "slow":
+            time.sleep(float(rest[0]))
+            self._send(200)
+        elif kind == "page":
+            self._send(status, page)
+        elif kind == "redirect":
+            self._send(302, headers={"Location": f"/page/{user}"})
+        elif kind == "gzip":
+            self._send(status, gzip.compress(page), {"Content-Encoding": "gzip"})
+        elif kind == "late":
+            # PROFILE_OK early, NOUSER only after a long preamble.
+            body = PROFILE + b" " * LATE_OFFSET + (b"" if taken else MISSING)
+            self._send(200, body)
+        elif kind == "chunked":
+            self.send_response(status)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for piece in (page[:10], page[10:25], page[25:]):
+                self.wfile.write(b"%x;ext=1\r\n%s\r\n" % (len(piece), piece))
+            self.wfile.write(b"0\r\nX-Trailer: done\r\n\r\n")
+        else:
+            self._send(404)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = json.loads(self.rfile.read(length) or b"{}")
+        if data.get("user") == "taken":
+            self._send(200, PROFILE)
+        else:
+            self._send(404, MISSING)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Early stops (max_hits) drop connections mid-response; that is expected.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+@pytest.fixture(scope="session")
+def http_server() -> Iterator[str]:
+    """Base URL of a local HTTP/1.1 server running ``_Handler``."""
+
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def closed_port() -> int:
+    """A local port with nothing listening on it."""
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,155 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import gzip
+import zlib
+from typing import Dict, List, Tuple
+
+import pytest
+
+from framework.core.async_http import AsyncHTTPClient, HTTPProtocolError
+
+
+Fetched = Tuple[int, Dict[str, str], bytes, List[Tuple[int, str]]]
+
+
+async def _exchange(replies: List[bytes], method: str, body: bytes | None) -> Tuple[Fetched, List[bytes]]:
+    """Serve the raw ``replies`` in turn to one request (plus its redirects).
+
+    Returns (status, headers, body, history) and the raw requests received.
+    """
+
+    requests: List[bytes] = []
+    pending = list(replies)
+
+    async def _serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while pending:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+            requests.append(head + (await reader.readexactly(length) if length else b""))
+            writer.write(pending.pop(0))
+            await writer.drain()
+            if b"connection: close" in head.lower() or not pending:
+                break
+        writer.close()
+
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with AsyncHTTPClient(timeout=5) as client:
+            url = f"http://127.0.0.1:{port}/path?q=1"
+            response = await client.request(method, url, body=body)
+            try:
+                data = await response.read()
+            finally:
+                response.release()
+    finally:
+        server.close()
+        await server.wait_closed()
+    return (response.status, response.headers, data, response.history), requests
+
+
+def _fetch(*replies: bytes, method: str = "GET", body: bytes | None = None) -> Tuple[Fetched, List[bytes]]:
+    return asyncio.run(_exchange(list(replies), method, body))
+
+
+def test_content_length_body_and_request_line():
+    (status, headers, body, _), requests = _fetch(
+        b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\nX-Test: a\r\n\r\nhello"
+    )
+
+    assert (status, body) == (200, b"hello")
+    assert headers["x-test"] == "a"
+    assert requests[0].startswith(b"GET /path?q=1 HTTP/1.1\r\n")
+    assert b"Accept-Encoding: gzip, deflate" in requests[0]
+
+
+def test_chunked_body_with_extensions_and_trailers():
+    (_, _, body, _), _ = _fetch(
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"5;name=value\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n"
+    )
+
+    assert body == b"hello world"
+
+
+def test_gzip_and_deflate_bodies_are_decoded():
+    packed = gzip.compress(b"compressed body")
+    (_, _, body, _), _ = _fetch(
+        b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\nContent-Length: %d\r\n\r\n%s" % (len(packed), packed)
+    )
+    assert body == b"compressed body"
+
+    packed = zlib.compress(b"deflated body")
+    (_, _, body, _), _ = _fetch(
+        b"HTTP/1.1 200 OK\r\nContent-Encoding: deflate\r\nContent-Length: %d\r\n\r\n%s" % (len(packed), packed)
+    )
+    assert body == b"deflated body"
+
+
+def test_body_without_length_reads_to_close():
+    (status, _, body, _), _ = _fetch(b"HTTP/1.0 200 OK\r\n\r\nuntil the end")
+
+    assert (status, body) == (200, b"until the end")
+
+
+def test_interim_100_continue_is_skipped():
+    (status, _, body, _), _ = _fetch(
+        b"HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 201 Created\r\nContent-Length: 2\r\n\r\nok",
+        method="POST",
+        body=b"{}",
+    )
+
+    assert (status, body) == (201, b"ok")
+
+
+def test_repeated_headers_are_joined():
+    (_, headers, _, _), _ = _fetch(
+        b"HTTP/1.1 200 OK\r\nSet-Cookie: a=1\r\nSet-Cookie: b=2\r\nContent-Length: 0\r\n\r\n"
+    )
+
+    assert headers["set-cookie"] == "a=1, b=2"
+
+
+def test_redirect_is_followed_and_post_becomes_get():
+    (status, _, body, history), requests = _fetch(
+        b"HTTP/1.1 302 Found\r\nLocation: /next\r\nContent-Length: 3\r\n\r\nbye",
+        b"HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\ndone",
+        method="POST",
+        body=b"payload",
+    )
+
+    assert (status, body) == (200, b"done")
+    assert [code for code, _ in history] == [302]
+    assert requests[0].startswith(b"POST /path?q=1 ") and requests[0].endswith(b"payload")
+    assert requests[1].startswith(b"GET /next ")
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        b"SSH-2.0-OpenSSH\r\n\r\n",
+        b"HTTP/1.1 abc OK\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nshort",
+    ],
+)
+def test_malformed_responses_raise(reply):
+    with pytest.raises(HTTPProtocolError):
+        _fetch(reply)
+
+
+def test_host_key():
+    assert AsyncHTTPClient.host_key("https://Example.com/x") == ("https", "example.com", 443)
+    assert AsyncHTTPClient.host_key("http://example.com:8080") == ("http", "example.com", 8080)
+    assert AsyncHTTPClient.host_key("ftp://example.com") is None
+    assert AsyncHTTPClient.host_key("http://example.com:99999") is None
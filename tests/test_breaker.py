@@ -0,0 +1,135 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+
+import pytest
+
+from blackhaven.core.username_engine import stream_username
+from framework.core import breaker as breaker_module
+from framework.core import site_stats
+from framework.core.breaker import DEFAULT_COOLDOWN, DEFAULT_THRESHOLD, MAX_COOLDOWN, CircuitBreaker
+from framework.core.site_stats import MIN_SAMPLES, SiteStats
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "time", lambda: now[0])
+    return now
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    for _ in range(2):
+        breaker.record_failure("site")
+    assert breaker.allow("site") and not breaker.is_open("site")
+
+    breaker.record_failure("site")
+    assert breaker.is_open("site")
+    assert not breaker.allow("site")
+
+
+def test_success_resets_failures(clock):
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    breaker.record_failure("site")
+    breaker.record_success("site")
+    breaker.record_failure("site")
+
+    assert not breaker.is_open("site")
+
+
+def test_half_open_probe_closes_on_success(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    breaker.record_failure("site")
+    clock[0] += 61
+
+    assert breaker.allow("site")
+    # Only one probe at a time while half-open.
+    assert not breaker.allow("site")
+    breaker.record_success("site")
+    assert not breaker.is_open("site")
+    assert breaker.allow("site")
+
+
+def test_failed_probe_doubles_cooldown(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    breaker.record_failure("site")
+    clock[0] += 61
+    assert breaker.allow("site")
+    breaker.record_failure("site")
+
+    clock[0] += 61
+    assert not breaker.allow("site")
+    clock[0] += 60
+    assert breaker.allow("site")
+
+
+def test_cooldown_is_capped(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=MAX_COOLDOWN)
+    breaker.record_failure("site")
+    clock[0] += MAX_COOLDOWN + 1
+    assert breaker.allow("site")
+    breaker.record_failure("site")
+
+    clock[0] += MAX_COOLDOWN + 1
+    assert breaker.allow("site")
+
+
+def test_breaker_state_persists(clock):
+    breaker = CircuitBreaker.load(threshold=1)
+    breaker.record_failure("site")
+    breaker.save()
+
+    assert CircuitBreaker.load().is_open("site")
+
+
+def test_timeouts_let_the_adaptive_timeout_grow():
+    stats = SiteStats()
+    for _ in range(MIN_SAMPLES * 2):
+        stats.record_success("site", 0.05)
+    timeout = stats.timeout_for("site", 10.0)
+    assert timeout < 10.0
+
+    for _ in range(5):
+        stats.record_timeout("site", timeout)
+        timeout = stats.timeout_for("site", 10.0)
+    assert timeout == 10.0
+    assert stats.failures("site") == 5
+
+
+def test_open_breaker_skips_site(tmp_path, http_server):
+    sites = tmp_path / "sites.json"
+    sites.write_text(json.dumps({"sites": [{"name": "ok", "url": f"{http_server}/status/200/{{username}}"}]}))
+    breaker = CircuitBreaker.load(threshold=1)
+    breaker.record_failure("ok")
+    breaker.save()
+
+    assert [entry["status"] for entry in stream_username("bob", str(sites), timeout=5)] == ["skipped-breaker"]
+
+
+def test_probe_timing_out_on_a_learned_timeout_is_released(tmp_path, http_server, clock, monkeypatch):
+    monkeypatch.setattr(site_stats, "TIMEOUT_FLOOR", 0.1)
+    sites = tmp_path / "sites.json"
+    sites.write_text(json.dumps({"sites": [{"name": "slow", "url": f"{http_server}/slow/0.5/{{username}}"}]}))
+    stats = SiteStats.shared()
+    for _ in range(MIN_SAMPLES):
+        stats.record_success("slow", 0.01)
+    breaker = CircuitBreaker.shared()
+    for _ in range(DEFAULT_THRESHOLD):
+        breaker.record_failure("slow")
+    clock[0] += DEFAULT_COOLDOWN + 1
+
+    results = list(stream_username("bob", str(sites), timeout=5))
+
+    # The half-open probe timed out on the short learned timeout: no verdict,
+    # so the breaker stays as it was and the next check may probe again.
+    assert results[0]["status"] == "error"
+    assert breaker.is_open("slow")
+    assert breaker.allow("slow")
+
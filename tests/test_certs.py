@@ -0,0 +1,53 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import ssl
+
+import pytest
+
+from framework.core.certs import parse_certificate
+
+# Self-signed P-256 certificate: CN probe.example, SANs probe.example,
+# www.probe.example and 10.0.0.7.
+CERT_PEM = """-----BEGIN CERTIFICATE-----
+MIIBpjCCAU2gAwIBAgIBATAKBggqhkjOPQQDAjAYMRYwFAYDVQQDDA1wcm9iZS5l
+eGFtcGxlMB4XDTI2MTAxOTA2NTIwOVoXDTM2MTAxNjA2NTIwOVowGDEWMBQGA1UE
+AwwNcHJvYmUuZXhhbXBsZTBZMBMGByqGSM49AgEGCCqGSM49AwEHA0IABIZAAVN4
+fbc/XX+P1n74xjMRXWoOOwPpPH8iZVP3au7YkyBB/Z4Pu+cr2HHAPFSM/spHXOA5
+RJrzTg5i7kepcSSjgYcwgYQwHQYDVR0OBBYEFBHYbvo3HnON/OshIsNKDxiwwfSZ
+MB8GA1UdIwQYMBaAFBHYbvo3HnON/OshIsNKDxiwwfSZMA8GA1UdEwEB/wQFMAMB
+Af8wMQYDVR0RBCowKIINcHJvYmUuZXhhbXBsZYIRd3d3LnByb2JlLmV4YW1wbGWH
+BAoAAAcwCgYIKoZIzj0EAwIDRwAwRAIgMoS9nBAJmaQFfjvRyYT2NUmA55H3P0vM
+v8Pvw3SxrLACIAxFblgrK4zyvlunEoOn/6woGfEBoRPvBvhw/0Tw3tz/
+-----END CERTIFICATE-----
+"""
+CERT_DER = ssl.PEM_cert_to_DER_cert(CERT_PEM)
+
+
+def test_parse_certificate():
+    assert parse_certificate(CERT_DER) == {
+        "subject_cn": "probe.example",
+        "issuer_cn": "probe.example",
+        "san": ["probe.example", "www.probe.example", "10.0.0.7"],
+        "not_before": "2026-10-19T06:52:09+00:00",
+        "not_after": "2036-10-16T06:52:09+00:00",
+    }
+
+
+@pytest.mark.parametrize(
+    "der",
+    [
+        b"",
+        b"\x02\x01\x00",
+        CERT_DER[:40],
+        b"\x30\x84\xff\xff\xff\xff",
+    ],
+)
+def test_malformed_certificates_raise(der):
+    with pytest.raises(ValueError):
+        parse_certificate(der)
@@ -0,0 +1,125 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import importlib.util
+import io
+import os
+import types
+
+import pytest
+
+_CLI_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "blackhaven.py")
+# blackhaven.py shares its name with the blackhaven package, so load it by path.
+_spec = importlib.util.spec_from_file_location("blackhaven_cli", _CLI_PATH)
+cli = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cli)
+
+ARGV = ["blackhaven", "--no-update-check", "scan", "tech", "--targets-file", "-", "--parallel", "2"]
+PIPED = "a.example\n# staging hosts\nb.example  # second\na.example\n"
+
+
+class _FakeFramework:
+    def __init__(self) -> None:
+        self.config = types.SimpleNamespace(data={})
+        self.modules = {"tech_detection": None}
+        self.calls = []
+        self.closed = False
+
+    def run_module(self, name, target):
+        self.calls.append((name, [target], 1))
+
+    def run_targets(self, name, targets, parallel=1):
+        self.calls.append((name, list(targets), parallel))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeTTY:
+    def __init__(self, answer: str) -> None:
+        self._reader = io.StringIO(answer)
+        self.written = []
+        self.closed = False
+
+    def write(self, text: str) -> None:
+        self.written.append(text)
+
+    def flush(self) -> None:
+        pass
+
+    def readline(self) -> str:
+        return self._reader.readline()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def piped(monkeypatch):
+    frameworks = []
+
+    def _framework() -> _FakeFramework:
+        frameworks.append(_FakeFramework())
+        return frameworks[-1]
+
+    monkeypatch.setattr(cli, "Framework", _framework)
+    monkeypatch.setattr("sys.argv", ARGV)
+    monkeypatch.setattr("sys.stdin", io.StringIO(PIPED))
+    monkeypatch.delenv(cli.ACCEPT_NOTICE_ENV, raising=False)
+    return frameworks
+
+
+def _no_tty():
+    raise OSError("No such device or address")
+
+
+def test_piped_targets_without_terminal_accept_env(piped, monkeypatch):
+    monkeypatch.setenv(cli.ACCEPT_NOTICE_ENV, "1")
+    monkeypatch.setattr(cli, "_open_tty", _no_tty)
+
+    assert cli.main() == 0
+    assert piped[0].calls == [("tech_detection", ["a.example", "b.example"], 2)]
+    assert piped[0].closed
+
+
+def test_piped_targets_read_acknowledgement_from_tty(piped, monkeypatch):
+    tty = _FakeTTY("nope\nI AGREE\n")
+    monkeypatch.setattr(cli, "_open_tty", lambda: tty)
+
+    assert cli.main() == 0
+    assert tty.written == ["> ", "> "]
+    assert tty.closed
+    assert piped[0].calls == [("tech_detection", ["a.example", "b.example"], 2)]
+
+
+def test_piped_targets_without_terminal_need_env(piped, monkeypatch):
+    monkeypatch.setattr(cli, "_open_tty", _no_tty)
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+    assert cli.ACCEPT_NOTICE_ENV in str(excinfo.value)
+    assert piped == []
+
+
+def test_interactive_run_prompts_even_with_env(monkeypatch):
+    monkeypatch.setenv(cli.ACCEPT_NOTICE_ENV, "1")
+    answers = iter(["yes", "I AGREE"])
+    prompts = []
+
+    def _input(prompt):
+        prompts.append(prompt)
+        return next(answers)
+
+    def _unexpected_tty():
+        raise AssertionError("interactive runs read stdin")
+
+    monkeypatch.setattr("builtins.input", _input)
+    monkeypatch.setattr(cli, "_open_tty", _unexpected_tty)
+
+    cli.require_legal_acknowledgement()
+    assert prompts == ["> ", "> "]
@@ -0,0 +1,140 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import re
+from typing import Dict, Iterator, List
+
+import pytest
+
+from framework.core.fingerprints import (
+    DEFAULT_DB_PATH,
+    FingerprintDB,
+    _build_db,
+    _required_literal,
+    _version,
+)
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+# Candidate characters for classes, ``.`` and negated literals.
+_ALPHABET = "a0Z9-_/. =\"'<>#x"
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: str.isdigit,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda char: not char.isdigit(),
+    sre_constants.CATEGORY_WORD: lambda char: char.isalnum() or char == "_",
+    sre_constants.CATEGORY_NOT_WORD: lambda char: not (char.isalnum() or char == "_"),
+    sre_constants.CATEGORY_SPACE: str.isspace,
+    sre_constants.CATEGORY_NOT_SPACE: lambda char: not char.isspace(),
+}
+
+
+def _in_class(char: str, items) -> bool:
+    negate = False
+    member = False
+    for op, value in items:
+        if op == sre_constants.NEGATE:
+            negate = True
+        elif op == sre_constants.LITERAL:
+            member |= char == chr(value)
+        elif op == sre_constants.RANGE:
+            member |= value[0] <= ord(char) <= value[1]
+        elif op == sre_constants.CATEGORY:
+            member |= _CATEGORIES[value](char)
+    return member != negate
+
+
+def _pick(test) -> str:
+    return next((char for char in _ALPHABET if test(char)), "")
+
+
+def _sample(parsed, variant: int, groups: Dict[int, str]) -> str:
+    """Build text shaped like ``parsed``; ``variant`` varies repeats and branches."""
+
+    out: List[str] = []
+    for op, value in parsed:
+        if op == sre_constants.LITERAL:
+            out.append(chr(value))
+        elif op == sre_constants.NOT_LITERAL:
+            out.append(_pick(lambda char: char != chr(value)))
+        elif op == sre_constants.ANY:
+            out.append(_ALPHABET[variant % len(_ALPHABET)])
+        elif op == sre_constants.IN:
+            out.append(_pick(lambda char: _in_class(char, value)))
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            low, high, item = value
+            count = min(high, low + variant)
+            out.extend(_sample(item, variant, groups) for _ in range(count))
+        elif op == sre_constants.SUBPATTERN:
+            text = _sample(value[-1], variant, groups)
+            if value[0] is not None:
+                groups[value[0]] = text
+            out.append(text)
+        elif op == sre_constants.BRANCH:
+            branches = value[1]
+            out.append(_sample(branches[variant % len(branches)], variant, groups))
+        elif op == sre_constants.GROUPREF:
+            out.append(groups.get(value, ""))
+    return "".join(out)
+
+
+def _samples(pattern: str) -> Iterator[str]:
+    parsed = sre_parse.parse(pattern)
+    for variant in range(3):
+        text = _sample(parsed, variant, {})
+        yield text
+        yield text.upper()
+        yield f"prefix {text} suffix"
+
+
+@pytest.mark.parametrize(
+    "pattern, literal",
+    [
+        ("x{10,20}y", ""),
+        ("[a-f0-9]{128}", ""),
+        ("^[0-9]{1,3}$", ""),
+        ("abc{0,2}def", "def"),
+        ("foo{,3}bar", "bar"),
+        ("abcd{2}ef", "abcd"),
+        ("\\x41bcd", "bcd"),
+        ("nginx(?:/([\\d.]+))?", "nginx"),
+        ("^GitHub\\.com$", "github.com"),
+        ("a|bcdef", ""),
+    ],
+)
+def test_required_literal(pattern, literal):
+    assert _required_literal(pattern) == literal
+
+
+def test_quantifier_digits_do_not_hide_matches():
+    db = FingerprintDB.from_data({"Y": {"headers": {"x-id": "^[0-9]{1,3}$"}}})
+
+    assert [hit.name for hit in db.detect({"x-id": "42"})] == ["Y"]
+
+
+def test_prefilter_agrees_with_plain_regex_on_bundled_database():
+    db = _build_db(DEFAULT_DB_PATH)
+    checked = 0
+    for field, sets in db._sets.items():
+        for key, pattern_set in sets.items():
+            texts = {text for signature in pattern_set.signatures for text in _samples(signature.pattern)}
+            for text in texts:
+                expected = []
+                for signature in pattern_set.signatures:
+                    found = re.search(signature.pattern, text, re.IGNORECASE)
+                    if found is not None:
+                        expected.append((signature.pattern, _version(signature.version, found)))
+                actual = [(signature.pattern, version) for signature, version in pattern_set.match(text)]
+                assert sorted(actual) == sorted(expected), (field, key, text)
+                checked += len(expected)
+    # The samples must actually exercise the signatures.
+    assert checked > 100
@@ -0,0 +1,135 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+import logging
+import os
+import threading
+
+import pytest
+
+from framework.core.framework import Framework
+from framework.core.journal import SEQ_KEY, SessionJournal, journal_path_for, read_session
+from framework.core.serialize import get_serializer
+from framework.core.utils import JSONStore
+
+
+def _run(index: int) -> dict:
+    return {"module": "tech_detection", "target": f"host{index}.example", "success": True}
+
+
+def test_runs_are_journaled_before_compaction(tmp_path):
+    journal = SessionJournal(str(tmp_path / "session.json"))
+    for index in range(3):
+        journal.append(_run(index))
+    journal.close()
+
+    assert journal.pending == 3
+    assert not os.path.exists(journal.snapshot_path)
+    assert read_session(journal.snapshot_path)["runs"] == [_run(0), _run(1), _run(2)]
+
+
+def test_compact_writes_snapshot_and_empties_journal(tmp_path):
+    journal = SessionJournal(str(tmp_path / "session.json"))
+    runs = [_run(index) for index in range(3)]
+    for run in runs:
+        journal.append(run)
+    journal.compact({"session_id": "s1", "runs": runs})
+
+    assert journal.pending == 0
+    assert not os.path.exists(journal.path)
+    snapshot = JSONStore.read(journal.snapshot_path)
+    assert snapshot[SEQ_KEY] == 3
+
+    journal.append(_run(3))
+    journal.close()
+    session = read_session(journal.snapshot_path)
+    assert session["session_id"] == "s1"
+    assert session["runs"] == runs + [_run(3)]
+    assert SEQ_KEY not in session
+
+
+def test_runs_already_in_the_snapshot_are_not_replayed(tmp_path):
+    journal = SessionJournal(str(tmp_path / "session.json"))
+    runs = [_run(index) for index in range(2)]
+    for run in runs:
+        journal.append(run)
+    journal.close()
+    # Crash between writing the snapshot and removing the journal.
+    JSONStore.write(journal.snapshot_path, {"runs": runs, SEQ_KEY: 2})
+
+    assert read_session(journal.snapshot_path)["runs"] == runs
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    journal = SessionJournal(str(tmp_path / "session.json"))
+    journal.append(_run(0))
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"seq": 2, "run": _run(1)})[:20])
+
+    assert read_session(journal.path)["runs"] == [_run(0)]
+
+
+def test_missing_session_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_session(str(tmp_path / "nothing.json"))
+
+
+def test_journal_path_sits_next_to_snapshot(tmp_path):
+    assert journal_path_for(str(tmp_path / "s.bhs")) == str(tmp_path / "s.jsonl")
+
+
+def test_compact_serializer_snapshot_round_trips(tmp_path):
+    journal = SessionJournal(str(tmp_path / "session.json"), get_serializer("compact"))
+    journal.append(_run(0))
+    journal.compact({"runs": [_run(0)]})
+
+    with open(journal.snapshot_path, "rb") as handle:
+        assert b"\n" not in handle.read()
+    assert read_session(journal.snapshot_path)["runs"] == [_run(0)]
+
+
+def _framework(tmp_path) -> Framework:
+    """A Framework with its session and output directories under ``tmp_path``."""
+
+    framework = Framework.__new__(Framework)
+    framework.session_id = "test"
+    framework.last_results = {"runs": []}
+    framework.config = {}
+    framework.output_dir = str(tmp_path / "output")
+    framework.sessions_dir = str(tmp_path / "sessions")
+    os.makedirs(framework.output_dir)
+    os.makedirs(framework.sessions_dir)
+    framework.logger = logging.getLogger("blackhaven.test")
+    framework.modules = {"echo": lambda target, config: {"target": target}}
+    framework.journal = SessionJournal(os.path.join(framework.sessions_dir, "session-test.json"))
+    framework._results_lock = threading.Lock()
+    framework._closed = False
+    framework._output_stale = False
+    return framework
+
+
+def test_close_writes_results_after_session_save(tmp_path):
+    framework = _framework(tmp_path)
+    framework.run_module("echo", "a.example")
+    framework._handle_session(["session", "save"])
+    assert framework.journal.pending == 0
+
+    framework.close()
+    results = JSONStore.read(os.path.join(framework.output_dir, "blackhaven-results-test.json"))
+    assert [run["target"] for run in results["runs"]] == ["a.example"]
+
+
+def test_close_without_new_runs_writes_nothing(tmp_path):
+    framework = _framework(tmp_path)
+    framework.close()
+
+    assert os.listdir(framework.output_dir) == []
+    assert os.listdir(framework.sessions_dir) == []
+
@@ -0,0 +1,38 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.core.report import write_json_report
+
+
+def _results(target: str) -> dict:
+    return {"session_id": "s1", "runs": [{"module": "tech_detection", "target": target, "data": {"x": "y" * 20000}}]}
+
+
+def test_json_report_matches_json_dump(tmp_path):
+    path = str(tmp_path / "report.json")
+    results = _results("a.example")
+    write_json_report(path, results, "notice")
+
+    with open(path, "r", encoding="utf-8") as handle:
+        assert handle.read() == json.dumps({**results, "disclaimer": "notice"}, indent=2, sort_keys=True)
+
+
+def test_parallel_writers_to_one_report_never_collide(tmp_path):
+    path = str(tmp_path / "report.json")
+    targets = [f"host{index}.example" for index in range(16)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda target: write_json_report(path, _results(target), "notice"), targets))
+
+    with open(path, "r", encoding="utf-8") as handle:
+        assert json.load(handle)["runs"][0]["target"] in targets
+    assert os.listdir(tmp_path) == ["report.json"]
@@ -0,0 +1,88 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+
+from blackhaven.core import username_engine
+from blackhaven.core.username_engine import stream_username
+from framework.core import response_cache as cache_module
+from framework.core.response_cache import NO_CACHE_ENV, ResponseCache, open_response_cache
+
+ENABLED = {"response_cache": True, "response_cache_ttl": {"default": 60, "username_search": 5}}
+
+
+def test_fresh_stale_and_revalidated_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache(ttl=60)
+    cache.store("mod", "GET", "https://a.example/", {"found": True}, {"etag": '"v1"'})
+    cache.store("mod", "GET", "https://b.example/", {"found": False}, {})
+
+    assert cache.lookup("mod", "GET", "https://a.example/").fresh
+    assert cache.lookup("mod", "POST", "https://a.example/") is None
+
+    now[0] += 61
+    stale = cache.lookup("mod", "GET", "https://a.example/")
+    assert not stale.fresh and stale.validators() == {"If-None-Match": '"v1"'}
+    # Without validators a stale entry is useless and is dropped.
+    assert cache.lookup("mod", "GET", "https://b.example/") is None
+
+    cache.revalidated(stale)
+    assert cache.lookup("mod", "GET", "https://a.example/").fresh
+
+
+def test_lookup_returns_a_copy():
+    cache = ResponseCache()
+    cache.store("mod", "GET", "https://a.example/", {"headers": {"server": "nginx"}})
+    cache.lookup("mod", "GET", "https://a.example/").value["headers"]["server"] = "changed"
+
+    assert cache.lookup("mod", "GET", "https://a.example/").value == {"headers": {"server": "nginx"}}
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache(max_entries=3)
+    for index in range(3):
+        cache.store("mod", "GET", f"https://{index}.example/", {"index": index})
+        now[0] += 1
+    cache.lookup("mod", "GET", "https://0.example/")
+    cache.store("mod", "GET", "https://3.example/", {"index": 3})
+
+    assert cache.lookup("mod", "GET", "https://1.example/") is None
+    assert cache.lookup("mod", "GET", "https://0.example/") is not None
+
+
+def test_open_response_cache_is_opt_in_and_shared(monkeypatch):
+    assert open_response_cache({}) is None
+
+    first = open_response_cache(ENABLED)
+    second = open_response_cache({**ENABLED, "response_cache_ttl": {"default": 10}})
+    assert first is second
+    assert first.ttl_for("username_search") == 10
+
+    monkeypatch.setenv(NO_CACHE_ENV, "1")
+    assert open_response_cache(ENABLED) is None
+
+
+def test_username_search_reuses_cached_verdicts(tmp_path, http_server, monkeypatch):
+    sites = tmp_path / "sites.json"
+    sites.write_text(json.dumps({"sites": [{"name": "ok", "url": f"{http_server}/status/200/{{username}}"}]}))
+    fetches = []
+    real_fetch = username_engine._fetch_site
+
+    async def _counting_fetch(*args, **kwargs):
+        fetches.append(args[1])
+        return await real_fetch(*args, **kwargs)
+
+    monkeypatch.setattr(username_engine, "_fetch_site", _counting_fetch)
+    first = list(stream_username("bob", str(sites), timeout=5, cache=ENABLED))
+    second = list(stream_username("bob", str(sites), timeout=5, cache=ENABLED))
+
+    assert first == second
+    assert len(fetches) == 1
@@ -0,0 +1,99 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+import math
+
+import pytest
+
+from framework.core import serialize
+from framework.core.serialize import (
+    BINARY_MAGIC,
+    PRETTY,
+    Serializer,
+    StdlibJSONSerializer,
+    get_serializer,
+    loads_auto,
+)
+from framework.core.utils import JSONStore
+
+SESSION = {
+    "session_id": "20260101-000000",
+    "runs": [
+        {"module": "tech_detection", "target": "example.com", "success": True, "elapsed_seconds": 0.25},
+        {"module": "osint_lookup", "target": "jöhn", "success": False, "data": {"error": None, "ports": [80, 443]}},
+    ],
+}
+
+requires_orjson = pytest.mark.skipif(serialize.orjson is None, reason="orjson is not installed")
+requires_msgpack = pytest.mark.skipif(serialize.msgpack is None, reason="msgpack is not installed")
+
+
+@pytest.mark.parametrize(
+    "fmt, backend",
+    [
+        ("pretty", "json"),
+        ("compact", "json"),
+        pytest.param("pretty", "orjson", marks=requires_orjson),
+        pytest.param("compact", "orjson", marks=requires_orjson),
+        pytest.param("binary", "auto", marks=requires_msgpack),
+    ],
+)
+def test_round_trip(fmt, backend, tmp_path):
+    serializer = get_serializer(fmt, backend)
+    raw = serializer.dumps(SESSION)
+
+    assert serializer.loads(raw) == SESSION
+    assert loads_auto(raw) == SESSION
+
+    path = str(tmp_path / f"session{serializer.suffix}")
+    JSONStore.write(path, SESSION, serializer)
+    assert JSONStore.read(path) == SESSION
+
+
+def test_pretty_matches_the_historical_layout():
+    assert PRETTY.dumps(SESSION) == json.dumps(SESSION, indent=2, sort_keys=True).encode("utf-8")
+
+
+@requires_orjson
+def test_orjson_falls_back_for_values_it_rejects():
+    data = {"big": 2 ** 70, 1: "non-string key"}
+    raw = get_serializer("compact", "orjson").dumps(data)
+
+    assert loads_auto(raw) == {"big": 2 ** 70, "1": "non-string key"}
+
+
+def test_nan_written_by_json_is_readable():
+    raw = StdlibJSONSerializer(pretty=False).dumps({"value": float("nan")})
+
+    assert math.isnan(loads_auto(raw)["value"])
+
+
+def test_unknown_names_raise():
+    with pytest.raises(ValueError):
+        get_serializer("yaml")
+    with pytest.raises(ValueError):
+        get_serializer("compact", "ujson")
+
+
+def test_binary_without_msgpack(monkeypatch):
+    monkeypatch.setattr(serialize, "msgpack", None)
+
+    with pytest.raises(ValueError):
+        get_serializer("binary")
+    with pytest.raises(ValueError):
+        loads_auto(BINARY_MAGIC + b"\x80")
+
+
+def test_incomplete_serializer_fails_at_construction():
+    class DumpOnly(Serializer):
+        def dumps(self, data):
+            return b""
+
+    with pytest.raises(TypeError):
+        DumpOnly()
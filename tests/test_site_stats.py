@@ -0,0 +1,65 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import os
+
+import pytest
+
+from framework.core.site_stats import MAX_SAMPLES, MIN_SAMPLES, TIMEOUT_FLOOR, SiteStats, percentile
+
+
+def test_percentile_is_nearest_rank():
+    samples = list(range(1, 101))
+
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 99) == 99
+    assert percentile([7], 99) == 7
+
+
+def test_timeout_needs_enough_samples():
+    stats = SiteStats()
+    for _ in range(MIN_SAMPLES - 1):
+        stats.record_success("site", 0.5)
+
+    assert stats.latency("site", 50) is None
+    assert stats.timeout_for("site", 10.0) == 10.0
+
+
+def test_timeout_follows_p99_within_bounds():
+    stats = SiteStats()
+    for _ in range(MIN_SAMPLES):
+        stats.record_success("fast", 0.01)
+        stats.record_success("steady", 1.0)
+        stats.record_success("slow", 8.0)
+
+    assert stats.timeout_for("fast", 10.0) == TIMEOUT_FLOOR
+    assert stats.timeout_for("steady", 10.0) == pytest.approx(3.0)
+    assert stats.timeout_for("slow", 10.0) == 10.0
+
+
+def test_samples_are_capped():
+    stats = SiteStats()
+    for index in range(MAX_SAMPLES + 10):
+        stats.record_success("site", 5.0 if index < 10 else 0.1)
+
+    assert stats.latency("site", 100) == pytest.approx(0.1)
+
+
+def test_stats_persist_only_when_changed():
+    stats = SiteStats.load()
+    stats.save()
+    assert not os.path.exists(stats.path)
+
+    for _ in range(MIN_SAMPLES):
+        stats.record_success("site", 0.2)
+    stats.record_failure("site")
+    stats.save()
+
+    loaded = SiteStats.load()
+    assert loaded.latency("site", 50) == pytest.approx(0.2)
+    assert loaded.failures("site") == 1
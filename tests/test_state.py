@@ -0,0 +1,51 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.core.state import read_json
+from framework.core.strategy import ProbeStrategy
+from framework.core.utils import JSONStore
+
+
+def test_shared_store_is_one_instance_per_file(tmp_path):
+    first = ProbeStrategy.shared()
+
+    assert ProbeStrategy.shared() is first
+    assert ProbeStrategy.shared(str(tmp_path / "other.json")) is not first
+
+
+def test_parallel_runs_keep_everything_learned(state_dir):
+    barrier = threading.Barrier(8)
+
+    def _run(index: int) -> None:
+        # What a module run does: learn one site, then save.
+        strategies = ProbeStrategy.shared()
+        strategies.record_method(f"site{index}", "HEAD")
+        barrier.wait()
+        strategies.save()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_run, range(8)))
+
+    saved = ProbeStrategy.load()
+    assert [saved.method(f"site{index}") for index in range(8)] == ["HEAD"] * 8
+    assert [name for name in os.listdir(state_dir) if name.endswith(".tmp")] == []
+
+
+def test_concurrent_writes_to_one_path_never_tear(tmp_path):
+    path = str(tmp_path / "state.json")
+    payloads = [{"writer": index, "data": "x" * 50000} for index in range(16)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda data: JSONStore.write(path, data), payloads))
+
+    assert read_json(path) in payloads
+    assert os.listdir(tmp_path) == ["state.json"]
@@ -0,0 +1,147 @@
+"""
+BlackHaven Framework
+Copyright (c) 2026 erraf132 and Vyrn.exe Official
+All rights reserved.
+"""
+
+
+from __future__ import annotations
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from blackhaven.core import username_engine
+from blackhaven.core.username_engine import search_username, search_usernames, stream_username
+from framework.core.site_stats import SiteStats
+from framework.core.utils import JSONStore
+from tests.conftest import LATE_OFFSET
+
+
+def _sites(tmp_path, sites: List[Dict[str, Any]]) -> str:
+    path = tmp_path / "sites.json"
+    path.write_text(json.dumps({"sites": sites}), encoding="utf-8")
+    return str(path)
+
+
+def _check(sites_path: str, username: str, **kwargs: Any) -> Dict[str, Dict[str, str]]:
+    return {entry["site"]: entry for entry in stream_username(username, sites_path, timeout=5, **kwargs)}
+
+
+def test_status_codes(tmp_path, http_server):
+    sites = _sites(tmp_path, [
+        {"name": "ok", "url": f"{http_server}/status/200/{{username}}"},
+        {"name": "gone", "url": f"{http_server}/status/404/{{username}}"},
+        {"name": "e_code", "url": f"{http_server}/status/204/{{username}}", "e_code": 204},
+        {"name": "m_code", "url": f"{http_server}/status/200/{{username}}", "m_code": 200},
+    ])
+    results = _check(sites, "bob")
+
+    assert results["ok"]["status"] == "200" and results["ok"]["found"] == "yes"
+    assert results["gone"]["status"] == "404" and results["gone"]["found"] == "no"
+    assert results["e_code"]["found"] == "yes"
+    assert results["m_code"]["found"] == "no"
+
+
+@pytest.mark.parametrize("kind", ["page", "chunked", "gzip", "redirect"])
+def test_e_string_and_m_string(tmp_path, http_server, kind):
+    sites = _sites(tmp_path, [
+        # The status codes point the other way, so only the signatures can decide.
+        {"name": "e", "url": f"{http_server}/{kind}/{{username}}", "e_string": "PROFILE_OK", "m_code": 200},
+        {"name": "m", "url": f"{http_server}/{kind}/{{username}}", "m_string": "NOUSER", "e_code": 404},
+    ])
+
+    taken = _check(sites, "taken")
+    assert taken["e"]["found"] == "yes"
+    assert taken["m"]["found"] == "yes"
+
+    free = _check(sites, "free")
+    assert free["e"]["found"] == "no"
+    assert free["m"]["found"] == "no"
+
+
+def test_late_m_string_beats_early_e_string(tmp_path, http_server):
+    sites = _sites(tmp_path, [{
+        "name": "late",
+        "url": f"{http_server}/late/{{username}}",
+        "e_string": "PROFILE_OK",
+        "m_string": "NOUSER",
+        "max_bytes": LATE_OFFSET * 2,
+    }])
+
+    assert _check(sites, "free")["late"]["found"] == "no"
+    assert _check(sites, "taken")["late"]["found"] == "yes"
+
+
+def test_post_body(tmp_path, http_server):
+    sites = _sites(tmp_path, [{
+        "name": "post",
+        "url": f"{http_server}/api",
+        "post_body": '{{"user": "{username}"}}',
+        "m_string": "NOUSER",
+        "e_code": 404,
+    }])
+
+    assert _check(sites, "taken")["post"]["found"] == "yes"
+    assert _check(sites, "free")["post"]["found"] == "no"
+
+
+def test_refused_connection_reports_error(tmp_path, http_server, closed_port):
+    sites = _sites(tmp_path, [
+        {"name": "dead", "url": f"http://127.0.0.1:{closed_port}/{{username}}"},
+        {"name": "ok", "url": f"{http_server}/status/200/{{username}}"},
+    ])
+    results = _check(sites, "bob")
+
+    assert results["dead"] == {
+        "site": "dead",
+        "url": f"http://127.0.0.1:{closed_port}/bob",
+        "status": "error",
+        "found": "no",
+    }
+    assert results["ok"]["found"] == "yes"
+    assert SiteStats.load().failures("dead") == 1
+
+
+def test_max_hits_stops_early(tmp_path, http_server):
+    sites = _sites(tmp_path, [
+        {"name": f"site{index}", "url": f"{http_server}/status/200/{index}/{{username}}"}
+        for index in range(12)
+    ])
+    results = list(stream_username("bob", sites, max_workers=2, adaptive=False, max_hits=3))
+
+    assert len(results) == 3
+    assert all(entry["found"] == "yes" for entry in results)
+
+
+def test_search_usernames_yields_each_name_in_site_order(tmp_path, http_server):
+    sites = _sites(tmp_path, [
+        {"name": "a", "url": f"{http_server}/page/{{username}}", "e_string": "PROFILE_OK"},
+        {"name": "b", "url": f"{http_server}/status/404/{{username}}"},
+    ])
+    results = dict(search_usernames(["taken", "free", "taken"], sites, timeout=5))
+
+    # Names are yielded as they complete; duplicates are checked once.
+    assert sorted(results) == ["free", "taken"]
+    assert [entry["site"] for entry in results["taken"]] == ["a", "b"]
+    assert [entry["found"] for entry in results["taken"]] == ["yes", "no"]
+    assert [entry["found"] for entry in results["free"]] == ["no", "no"]
+
+
+def test_search_username_writes_reports_after_loading_sites(tmp_path, http_server, monkeypatch):
+    results_dir = tmp_path / "results"
+    monkeypatch.setattr(username_engine, "_USERNAME_RESULTS_DIR", str(results_dir))
+
+    with pytest.raises(FileNotFoundError):
+        search_username("bob", str(tmp_path / "missing.json"))
+    assert not results_dir.exists() or not list(results_dir.iterdir())
+
+    sites = _sites(tmp_path, [{"name": "ok", "url": f"{http_server}/status/200/{{username}}"}])
+    seen = []
+    results = search_username("bob", sites, on_result=seen.append)
+
+    assert results == seen
+    reports = sorted(path.suffix for path in results_dir.iterdir())
+    assert reports == [".json", ".txt"]
+    saved = JSONStore.read(str(next(results_dir.glob("*.json"))))
+    assert "ok" in json.dumps(saved)
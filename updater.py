@@ -8,9 +8,18 @@ All rights reserved.
 
 import subprocess
 import os
+import threading
+import time
+
+from framework.core.state import read_json, state_path, write_json_atomic
 
 REPO_NAME = "BlackHaven"
 LOCAL_VERSION_FILE = os.path.join(os.path.dirname(__file__), "version.txt")
+# The background check hits the network at most once per CHECK_TTL seconds.
+CHECK_TTL = 24 * 3600
+CHECK_CACHE_FILE = "update-check.json"
+CHECK_TIMEOUT = 5
+NO_UPDATE_CHECK_ENV = "BLACKHAVEN_NO_UPDATE_CHECK"
 
 
 def _ensure_requests():
@@ -100,6 +109,78 @@ def get_remote_version():
         return None
 
 
+def _fetch_remote_version(timeout):
+    # Never pip-installs or prints: this runs behind a command's output.
+    try:
+        import requests  # type: ignore
+    except Exception:
+        return None
+
+    try:
+        r = requests.get(_get_version_url(), timeout=timeout)
+        if r.status_code != 200:
+            return None
+        return r.content.decode("utf-8", "replace").strip() or None
+    except Exception:
+        return None
+
+
+def check_for_update(ttl=CHECK_TTL, timeout=CHECK_TIMEOUT):
+    """Return the remote version if it differs from the local one.
+
+    The result of the last check (including a failed one) is cached in
+    the state directory, so the network is hit at most once per ``ttl``.
+    """
+
+    path = state_path(CHECK_CACHE_FILE)
+    cached = read_json(path)
+    if isinstance(cached, dict) and time.time() - cached.get("checked_at", 0) < ttl:
+        remote = cached.get("remote")
+    else:
+        remote = _fetch_remote_version(timeout)
+        write_json_atomic(path, {"checked_at": time.time(), "remote": remote})
+
+    if remote and remote != get_local_version():
+        return remote
+    return None
+
+
+class UpdateCheck:
+    """Version check running on a daemon thread while the command works."""
+
+    def __init__(self):
+        self.remote = None
+        self._thread = threading.Thread(target=self._run, name="update-check", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.remote = check_for_update()
+        except Exception:
+            self.remote = None
+
+    def notice(self):
+        """Return the update notice, or None; never waits for an unfinished check."""
+
+        if self._thread.is_alive() or not self.remote:
+            return None
+        return (
+            f"New version available: {self.remote} (installed: {get_local_version()}). "
+            "Run 'python updater.py' to update."
+        )
+
+
+def start_update_check(enabled=True):
+    """Start a background update check unless disabled by flag or environment."""
+
+    if not enabled or os.getenv(NO_UPDATE_CHECK_ENV, "").strip().lower() in ("1", "true", "yes"):
+        return None
+    return UpdateCheck().start()
+
+
 def update():
     print("Checking for updates...")
 